@@ -0,0 +1,138 @@
+"""
+Shared fixtures for the extraction benchmarks.
+
+Fixture pages live in benchmarks/fixtures/*.html, with the fields each page
+should yield in fixtures/expected.json. Field accuracy per backend/fixture is
+compared with accuracy_baseline.json; latency baselines are kept by
+pytest-benchmark (--benchmark-save / --benchmark-compare).
+"""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent
+FIXTURE_DIR = BENCH_DIR / "fixtures"
+ACCURACY_BASELINE_PATH = BENCH_DIR / "accuracy_baseline.json"
+
+# The scraper modules are plain scripts next to this directory
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+_accuracy_results = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("extraction benchmarks")
+    group.addoption("--browser", action="store_true", default=False,
+                    help="also benchmark the live WebDriver and in-page JS backends (needs Chrome)")
+    group.addoption("--update-accuracy-baseline", action="store_true", default=False,
+                    help="rewrite accuracy_baseline.json with this run's field accuracy")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if session.config.getoption("--update-accuracy-baseline") and _accuracy_results:
+        baseline = load_accuracy_baseline()
+        baseline.update(_accuracy_results)
+        with open(ACCURACY_BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=2)
+            f.write("\n")
+
+
+def load_accuracy_baseline():
+    if not ACCURACY_BASELINE_PATH.exists():
+        return {}
+    with open(ACCURACY_BASELINE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def fixture_html(name: str) -> str:
+    return (FIXTURE_DIR / f"{name}.html").read_text(encoding="utf-8")
+
+
+def fixture_uri(name: str) -> str:
+    return (FIXTURE_DIR / f"{name}.html").as_uri()
+
+
+@pytest.fixture(scope="session")
+def expected():
+    with open(FIXTURE_DIR / "expected.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def record_accuracy(request, benchmark):
+    """Score extracted fields against the expectation and check the baseline."""
+    def record(key: str, extracted: dict, fields: dict) -> float:
+        missed = [name for name, value in fields.items() if _normalize(extracted.get(name)) != _normalize(value)]
+        accuracy = 1 - len(missed) / len(fields) if fields else 1.0
+        benchmark.extra_info["accuracy"] = round(accuracy, 4)
+        benchmark.extra_info["missed_fields"] = missed
+        _accuracy_results[key] = round(accuracy, 4)
+
+        if not request.config.getoption("--update-accuracy-baseline"):
+            baseline = load_accuracy_baseline().get(key)
+            if baseline is not None:
+                assert accuracy >= baseline, (
+                    f"{key}: field accuracy {accuracy:.2%} fell below baseline {baseline:.2%} (missed {missed})"
+                )
+        return accuracy
+    return record
+
+
+def _normalize(value):
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    lines = str(value or "").strip().split("\n")
+    return "\n".join(" ".join(line.split()) for line in lines)
+
+
+@pytest.fixture(scope="session")
+def browser(request):
+    """Headless Chrome for the live and JS backends; skipped without --browser."""
+    if not request.config.getoption("--browser"):
+        pytest.skip("browser backends need --browser")
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    try:
+        driver = webdriver.Chrome(options=options)
+    except Exception as e:
+        pytest.skip(f"Chrome not available: {e}")
+    driver.implicitly_wait(0)
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture(scope="session")
+def live_scraper(tmp_path_factory):
+    """test2.py imported with its run files (trace, selector stats) in a temp dir."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("test2_run"))
+    try:
+        import test2
+    finally:
+        os.chdir(cwd)
+    return test2
+
+
+@pytest.fixture(scope="session")
+def standin_origin():
+    """Local stand-in server (no latency, no lazy sections) that linkedin.com navigation is sent to."""
+    from standin_server import make_server
+    from url_utils import set_site_origin
+
+    server = make_server(0, latency_ms=0, jitter_ms=0, lazy_ms=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    set_site_origin(server.origin)
+    yield server.origin
+    set_site_origin(None)
+    server.shutdown()
@@ -0,0 +1,244 @@
+"""
+Local LinkedIn stand-in for end-to-end throughput runs.
+
+Serves the sanitized fixture pages under the same paths the scraper visits:
+
+    /in/<slug>/                 linkedin_artdeco_profile.html
+    /sales/lead/<id>,...        sales_navigator_lead.html
+    /company/<slug>/...         linkedin_company.html
+    /sales/company/<id>         sales_navigator_company.html
+    /, /feed/, /sales/          a logged-in home page
+
+Each profile links to one of --companies company pages (picked from its slug),
+so the company cache sees realistic hits and misses. Links in the pages stay on
+linkedin.com; the scraper's --base-url maps its navigation back here.
+
+Responses are delayed by --latency-ms (+- --jitter-ms), every section after the
+top card is rendered --lazy-ms apart after load, and long texts get the
+collapsed "see more" / "Show more" buttons the scraper clicks.
+
+Run from linkedin_scraper_starter/:
+
+    python benchmarks/standin_server.py --port 8765 --urls-out standin_urls.txt --profiles 200
+    python test2.py --base-url http://127.0.0.1:8765 --input standin_urls.txt --headless --no-delay
+"""
+
+import argparse
+import random
+import re
+import time
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import urlparse
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+LINKEDIN_ORIGIN = "https://www.linkedin.com"
+
+DEFAULT_PORT = 8765
+DEFAULT_LATENCY_MS = 300
+DEFAULT_JITTER_MS = 150
+DEFAULT_LAZY_MS = 250
+DEFAULT_COMPANIES = 25
+
+# Fixture identifiers that are rewritten per request
+PROFILE_SLUG = "morgan-testperson"
+LEAD_ID = "ACwAAFixture01"
+COMPANY_SLUG = "tailspin-systems"
+SALES_COMPANY_ID = "4815162"
+
+HOME_PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Feed | LinkedIn</title></head>
+<body><header id="global-nav" class="global-nav"><a class="global-nav__logo" href="/feed/">LinkedIn</a></header>
+<main id="main" class="scaffold-layout__main"><h1>Stand-in feed</h1></main></body></html>
+"""
+
+# Lazy rendering and collapsed texts, injected before </body>
+STANDIN_SCRIPT = """
+<style>
+  .standin-collapsed { max-height: 3em; overflow: hidden; }
+</style>
+<script>
+(function () {
+  var LAZY_MS = %(lazy_ms)d;
+
+  function addToggle(container, html) {
+    if (!container) return;
+    container.classList.add("standin-collapsed");
+    var holder = document.createElement("div");
+    holder.innerHTML = html;
+    var button = holder.firstChild;
+    button.addEventListener("click", function (event) {
+      event.preventDefault();
+      container.classList.remove("standin-collapsed");
+      container.classList.remove("inline-show-more-text--is-collapsed");
+      button.remove();
+    });
+    container.parentNode.insertBefore(button, container.nextSibling);
+  }
+
+  addToggle(document.querySelector(".inline-show-more-text--is-collapsed"),
+    '<a href="#" role="button" class="lt-line-clamp__more" aria-label="see more">…see more</a>');
+  addToggle(document.querySelector(".org-about-module__description .lt-line-clamp"),
+    '<a href="#" role="button" class="lt-line-clamp__more" aria-label="see more">…see more</a>');
+  addToggle(document.querySelector("#about-section ._about-body_1b2mft"),
+    '<button id="ellipsis-button-standin" class="_ellipsis-button_1d1vlq">… Show more</button>');
+  addToggle(document.querySelector("._description-wrapper_mb60vc"),
+    '<button data-test-expand-button="">Show more</button>');
+
+  if (LAZY_MS <= 0) return;
+  var sections = Array.prototype.slice.call(document.querySelectorAll("main section")).slice(1);
+  sections.forEach(function (section, index) {
+    var placeholder = document.createElement("div");
+    placeholder.className = "standin-placeholder";
+    section.replaceWith(placeholder);
+    setTimeout(function () { placeholder.replaceWith(section); }, LAZY_MS * (index + 1));
+  });
+})();
+</script>
+"""
+
+
+def _fixture(name: str) -> str:
+    return (FIXTURE_DIR / f"{name}.html").read_text(encoding="utf-8")
+
+
+def company_index(key: str, companies: int) -> int:
+    """Stable company number for a profile slug or lead id."""
+    return zlib.crc32(key.encode("utf-8")) % max(companies, 1)
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Serves fixture pages; the server carries the latency/lazy settings."""
+
+    FIXTURES = {
+        "profile": _fixture("linkedin_artdeco_profile"),
+        "lead": _fixture("sales_navigator_lead"),
+        "company": _fixture("linkedin_company"),
+        "sales_company": _fixture("sales_navigator_company"),
+    }
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        page = self.render(path)
+        if page is None:
+            self.send_error(404)
+            return
+
+        server = self.server
+        delay_ms = server.latency_ms + random.uniform(-server.jitter_ms, server.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        body = page.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def render(self, path: str):
+        server = self.server
+        if path in ("/", "/feed/", "/sales/", "/sales/home"):
+            return HOME_PAGE
+
+        match = re.match(r"^/in/([^/]+)/?$", path)
+        if match:
+            slug = match.group(1)
+            n = company_index(slug, server.companies)
+            html = self.FIXTURES["profile"].replace(PROFILE_SLUG, slug)
+            html = html.replace(f"/company/{COMPANY_SLUG}/", f"/company/{COMPANY_SLUG}-{n}/")
+            return self.finish_page(html)
+
+        match = re.match(r"^/sales/lead/([^,/]+)", path)
+        if match:
+            lead_id = match.group(1)
+            n = company_index(lead_id, server.companies)
+            html = self.FIXTURES["lead"].replace(LEAD_ID, lead_id)
+            html = html.replace(f"/sales/company/{SALES_COMPANY_ID}", f"/sales/company/{SALES_COMPANY_ID}{n}")
+            return self.finish_page(html)
+
+        match = re.match(r"^/company/([^/]+)", path)
+        if match:
+            return self.finish_page(self.FIXTURES["company"].replace(COMPANY_SLUG, match.group(1)))
+
+        match = re.match(r"^/sales/company/(\d+)", path)
+        if match:
+            return self.finish_page(self.FIXTURES["sales_company"].replace(SALES_COMPANY_ID, match.group(1)))
+
+        return None
+
+    def finish_page(self, html: str) -> str:
+        # Links keep resolving to linkedin.com, as on the real site; the scraper's
+        # --base-url override sends its navigation back here
+        html = html.replace("<head>", f'<head>\n  <base href="{LINKEDIN_ORIGIN}/">', 1)
+        return html.replace("</body>", STANDIN_SCRIPT % {"lazy_ms": self.server.lazy_ms} + "</body>", 1)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(port: int = DEFAULT_PORT, latency_ms: int = DEFAULT_LATENCY_MS,
+                jitter_ms: int = DEFAULT_JITTER_MS, lazy_ms: int = DEFAULT_LAZY_MS,
+                companies: int = DEFAULT_COMPANIES, host: str = "127.0.0.1",
+                verbose: bool = False) -> ThreadingHTTPServer:
+    """Create the stand-in server (port 0 picks a free port); call serve_forever() on it."""
+    server = ThreadingHTTPServer((host, port), StandinHandler)
+    server.daemon_threads = True
+    server.origin = f"http://{host}:{server.server_address[1]}"
+    server.latency_ms = latency_ms
+    server.jitter_ms = min(jitter_ms, latency_ms)
+    server.lazy_ms = lazy_ms
+    server.companies = companies
+    server.verbose = verbose
+    return server
+
+
+def write_url_list(path: str, profiles: int, sales_every: int = 4):
+    """Write linkedin.com profile URLs (every sales_every-th a Sales Navigator lead) for --input."""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(1, profiles + 1):
+            if sales_every and i % sales_every == 0:
+                f.write(f"{LINKEDIN_ORIGIN}/sales/lead/ACwAAStandin{i:05d},NAME_SEARCH,abcd\n")
+            else:
+                f.write(f"{LINKEDIN_ORIGIN}/in/standin-person-{i:05d}/\n")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Local LinkedIn stand-in server for throughput runs")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency-ms", type=int, default=DEFAULT_LATENCY_MS, help="response delay per page")
+    parser.add_argument("--jitter-ms", type=int, default=DEFAULT_JITTER_MS, help="random +- spread on the delay")
+    parser.add_argument("--lazy-ms", type=int, default=DEFAULT_LAZY_MS,
+                        help="gap between lazily rendered sections after load (0 renders everything at once)")
+    parser.add_argument("--companies", type=int, default=DEFAULT_COMPANIES,
+                        help="number of distinct company pages profiles link to")
+    parser.add_argument("--urls-out", metavar="FILE", help="write a profile URL list for --input and keep serving")
+    parser.add_argument("--profiles", type=int, default=100, help="number of URLs written by --urls-out")
+    parser.add_argument("--sales-every", type=int, default=4,
+                        help="every Nth URL is a Sales Navigator lead (0 for none)")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.urls_out:
+        write_url_list(args.urls_out, args.profiles, args.sales_every)
+        print(f"Wrote {args.profiles} URLs to {args.urls_out}")
+
+    server = make_server(args.port, args.latency_ms, args.jitter_ms, args.lazy_ms, args.companies,
+                         verbose=args.verbose)
+    print(f"Stand-in serving on {server.origin} "
+          f"(latency {args.latency_ms}±{server.jitter_ms}ms, lazy {args.lazy_ms}ms, {args.companies} companies)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Extraction latency and field accuracy per extractor and backend.
+
+Backends:
+    snapshot  lxml over page_source (snapshot_extract.py), parse included
+    live      one WebDriver call per selector (scraper.py and test2.py), needs --browser;
+              test2's company pages are loaded from the local stand-in server
+    js        one execute_script call (page_extractor.js), needs --browser
+
+Run from linkedin_scraper_starter/:
+
+    python -m pytest benchmarks
+    python -m pytest benchmarks --browser --benchmark-save=baseline
+    python -m pytest benchmarks --browser --benchmark-compare --benchmark-compare-fail=mean:25%
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from conftest import fixture_html, fixture_uri
+from snapshot_extract import (
+    parse_snapshot,
+    extract_top_card_snapshot,
+    extract_experience_snapshot,
+    extract_snapshot,
+    extract_company_snapshot,
+)
+
+PROFILE_FIXTURES = ["linkedin_artdeco_profile", "sales_navigator_lead"]
+COMPANY_FIXTURES = ["linkedin_company", "sales_navigator_company"]
+
+
+def _company_fields(result: tuple) -> dict:
+    name, website, description = result
+    return {"name": name, "website": website, "description": description}
+
+
+# ---------------------------
+# snapshot backend
+# ---------------------------
+def test_snapshot_classic_profile(benchmark, expected, record_accuracy):
+    case = expected["linkedin_classic_profile"]
+    html = fixture_html("linkedin_classic_profile")
+
+    def run():
+        tree = parse_snapshot(html, case["url"])
+        data = extract_top_card_snapshot(tree, case["url"])
+        data["experience"] = extract_experience_snapshot(tree)
+        return data
+
+    record_accuracy("snapshot/linkedin_classic_profile", benchmark(run), case["fields"])
+
+
+@pytest.mark.parametrize("name", PROFILE_FIXTURES)
+def test_snapshot_profile(benchmark, expected, record_accuracy, name):
+    case = expected[name]
+    html = fixture_html(name)
+
+    def run():
+        return extract_snapshot(parse_snapshot(html, case["url"]), case["url"])
+
+    record_accuracy(f"snapshot/{name}", benchmark(run), case["fields"])
+
+
+@pytest.mark.parametrize("name", COMPANY_FIXTURES)
+def test_snapshot_company(benchmark, expected, record_accuracy, name):
+    case = expected[name]
+    html = fixture_html(name)
+
+    def run():
+        return extract_company_snapshot(parse_snapshot(html, case["url"]), case["url"])
+
+    record_accuracy(f"snapshot/{name}", _company_fields(benchmark(run)), case["fields"])
+
+
+# ---------------------------
+# live backend (WebDriver per selector)
+# ---------------------------
+def test_live_classic_profile(benchmark, expected, record_accuracy, browser):
+    import scraper
+
+    case = expected["linkedin_classic_profile"]
+    browser.get(fixture_uri("linkedin_classic_profile"))
+
+    def run():
+        data = scraper.extract_top_card(browser)
+        data["experience"] = scraper.extract_experience(browser)
+        return data
+
+    record_accuracy("live/linkedin_classic_profile", benchmark(run), case["fields"])
+
+
+@pytest.mark.parametrize("name", PROFILE_FIXTURES)
+def test_live_profile(benchmark, expected, record_accuracy, browser, live_scraper, monkeypatch, name):
+    case = expected[name]
+    browser.get(fixture_uri(name))
+    # Only the profile extractors are timed here; company pages have their own case
+    monkeypatch.setattr(live_scraper, "scrape_company_info", lambda *args, **kwargs: ("", "", ""))
+
+    result = benchmark(lambda: live_scraper.extract_profile(browser, case["url"]))
+    record_accuracy(f"live/{name}", result, case["fields"])
+
+
+@pytest.mark.parametrize("name", COMPANY_FIXTURES)
+def test_live_company(benchmark, expected, record_accuracy, browser, live_scraper, standin_origin, name):
+    case = expected[name]
+
+    # fetch_company_info navigates itself, so the timing includes a local page load
+    result = benchmark(lambda: live_scraper.fetch_company_info(browser, case["url"]))
+    record_accuracy(f"live/{name}", _company_fields(result), case["fields"])
+
+
+# ---------------------------
+# js backend (single execute_script)
+# ---------------------------
+@pytest.mark.parametrize("name", PROFILE_FIXTURES)
+def test_js_profile(benchmark, expected, record_accuracy, browser, name):
+    from js_extract import extract_profile_js
+
+    case = expected[name]
+    browser.get(fixture_uri(name))
+    is_sales_navigator = name.startswith("sales_navigator")
+
+    result = benchmark(lambda: extract_profile_js(browser, is_sales_navigator))
+    record_accuracy(f"js/{name}", result["profile"], case["fields"])
+
+
+@pytest.mark.parametrize("name", COMPANY_FIXTURES)
+def test_js_company(benchmark, expected, record_accuracy, browser, name):
+    from js_extract import extract_company_js
+
+    case = expected[name]
+    browser.get(fixture_uri(name))
+
+    result = benchmark(lambda: extract_company_js(browser, case["url"]))
+    record_accuracy(f"js/{name}", _company_fields(result), case["fields"])
@@ -0,0 +1,171 @@
+"""
+Slim Chrome profile materialised on tmpfs.
+
+A full Chrome profile keeps growing (component data, history, caches) and
+slows every launch that reads it. Instead, the template directory holds only
+what a run needs:
+
+    chrome_profile_template/Preferences     minimal prefs (written on first use)
+    chrome_profile_template/cookies.json    LinkedIn session cookies
+
+At launch the template is materialised into a fresh directory under /dev/shm
+(the system temp dir when tmpfs has no room for RUNTIME_PROFILE_MB), and the
+cookies are restored over CDP because Chrome's own cookie store is encrypted
+per profile. The LinkedIn cookies are written back to the template after a
+manual login and at exit, and the runtime directory is removed. Runtime
+directories left behind by a killed run are removed on the next launch. Each browser gets its own runtime directory, so a
+standby browser can be launched while the current one is still running.
+"""
+
+import glob
+import json
+import os
+import shutil
+import socket
+import tempfile
+import time
+from typing import List, Optional
+
+from driver_launch import TMPFS_ROOT, has_tmpfs_room
+
+PROFILE_TEMPLATE_DIR = "chrome_profile_template"
+RUNTIME_PREFIX = "linkedin_profile_"
+# Room a running profile needs on tmpfs (the HTTP cache lives elsewhere)
+RUNTIME_PROFILE_MB = 64
+# Leftover runtime directories younger than this may still be starting up
+STALE_AFTER_SECONDS = 600
+
+COOKIE_DOMAIN = "linkedin.com"
+
+MINIMAL_PREFERENCES = {
+    "profile": {"exit_type": "Normal", "exited_cleanly": True, "password_manager_enabled": False},
+    "credentials_enable_service": False,
+    "translate": {"enabled": False},
+    "download": {"prompt_for_download": False},
+}
+
+# Keys Network.setCookies accepts from a Network.getAllCookies entry
+_COOKIE_PARAM_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite",
+                      "expires", "priority", "sourceScheme", "sourcePort")
+
+
+def _is_linkedin_domain(domain: str) -> bool:
+    domain = domain.lstrip(".")
+    return domain == COOKIE_DOMAIN or domain.endswith("." + COOKIE_DOMAIN)
+
+
+def _runtime_root() -> Optional[str]:
+    """tmpfs when it has room for another profile, else the system temp dir (None)."""
+    return TMPFS_ROOT if has_tmpfs_room(RUNTIME_PROFILE_MB) else None
+
+
+def _in_use(runtime_dir: str) -> bool:
+    """True when a live Chrome on this host holds the profile (its SingletonLock names host-pid)."""
+    try:
+        owner = os.readlink(os.path.join(runtime_dir, "SingletonLock"))
+    except OSError:
+        return False
+    host, _, pid = owner.rpartition("-")
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def remove_stale_runtime_dirs() -> int:
+    """Remove runtime profiles left by killed runs; returns how many were removed."""
+    removed = 0
+    now = time.time()
+    for root in {TMPFS_ROOT, tempfile.gettempdir()}:
+        for path in glob.glob(os.path.join(root, RUNTIME_PREFIX + "*")):
+            try:
+                if now - os.path.getmtime(path) < STALE_AFTER_SECONDS or _in_use(path):
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+class ChromeProfile:
+    """Template on disk, runtime copy on tmpfs; cookies are the only state carried over."""
+
+    def __init__(self, template_dir: str = PROFILE_TEMPLATE_DIR):
+        self.template_dir = template_dir
+        self.runtime_dirs: List[str] = []
+        self._swept = False
+
+    @property
+    def cookies_path(self) -> str:
+        return os.path.join(self.template_dir, "cookies.json")
+
+    def materialize(self) -> str:
+        """Fresh runtime profile directory for --user-data-dir."""
+        os.makedirs(self.template_dir, exist_ok=True)
+        prefs_path = os.path.join(self.template_dir, "Preferences")
+        if not os.path.exists(prefs_path):
+            with open(prefs_path, "w", encoding="utf-8") as f:
+                json.dump(MINIMAL_PREFERENCES, f, indent=1)
+
+        if not self._swept:
+            self._swept = True
+            removed = remove_stale_runtime_dirs()
+            if removed:
+                print(f"Removed {removed} runtime profiles left by earlier runs")
+        runtime_dir = tempfile.mkdtemp(prefix=RUNTIME_PREFIX, dir=_runtime_root())
+        os.makedirs(os.path.join(runtime_dir, "Default"))
+        shutil.copyfile(prefs_path, os.path.join(runtime_dir, "Default", "Preferences"))
+        self.runtime_dirs.append(runtime_dir)
+        return runtime_dir
+
+    def restore_cookies(self, driver) -> int:
+        """Load the saved LinkedIn cookies into the browser; returns how many were set."""
+        try:
+            with open(self.cookies_path, encoding="utf-8") as f:
+                cookies = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        params = []
+        for cookie in cookies:
+            param = {key: cookie[key] for key in _COOKIE_PARAM_KEYS if key in cookie}
+            if cookie.get("session") or param.get("expires", -1) < 0:
+                param.pop("expires", None)
+            params.append(param)
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+        except Exception as e:
+            print(f"⚠️ Could not restore the saved session cookies: {e}")
+            return 0
+        return len(params)
+
+    def save_cookies(self, driver) -> int:
+        """Write the browser's LinkedIn cookies back to the template; returns how many were saved."""
+        try:
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+        except Exception as e:
+            print(f"⚠️ Could not read cookies to save the session: {e}")
+            return 0
+        cookies = [c for c in cookies if _is_linkedin_domain(c.get("domain", ""))]
+        if not cookies:
+            return 0
+        os.makedirs(self.template_dir, exist_ok=True)
+        tmp_path = self.cookies_path + ".tmp"
+        # Session cookies are credentials: keep the file private to the user
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cookies, f)
+        os.replace(tmp_path, self.cookies_path)
+        return len(cookies)
+
+    def cleanup(self, runtime_dir: Optional[str] = None):
+        """Remove one runtime directory, or all of them (call after driver.quit())."""
+        for path in ([runtime_dir] if runtime_dir else list(self.runtime_dirs)):
+            shutil.rmtree(path, ignore_errors=True)
+            if path in self.runtime_dirs:
+                self.runtime_dirs.remove(path)
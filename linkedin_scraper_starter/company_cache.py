@@ -0,0 +1,157 @@
+"""
+Persistent company-page cache.
+
+Company pages are shared by many profiles, so scrape_company_info (test2.py)
+and scrape_salesnav_company_page (testscrape.py) look here first. Entries are
+keyed by canonical company URL (url_utils.classify_url), carry the company id
+for cross-URL lookups within the same page kind, and expire after a
+configurable TTL. Lookups for a company that is already being fetched in this
+run wait for that fetch instead of loading it again.
+
+The scripts store differently shaped records, so each one uses its own
+namespace and never sees the other's entries.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from url_utils import classify_url
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+
+class CompanyCache:
+    """SQLite-backed company cache with TTL and in-flight de-duplication."""
+
+    def __init__(self, path: str = "company_cache.sqlite", ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 namespace: str = "default"):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS company_pages (
+                    namespace TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    kind TEXT,
+                    company_id TEXT,
+                    name TEXT,
+                    website TEXT,
+                    description TEXT,
+                    type TEXT,
+                    industry TEXT,
+                    size TEXT,
+                    data TEXT,
+                    fetched_at REAL,
+                    PRIMARY KEY (namespace, url)
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_company_pages_id "
+                               "ON company_pages(namespace, kind, company_id)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cached data for url, or None if missing or expired."""
+        company = classify_url(url)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT data, fetched_at FROM company_pages WHERE namespace = ? AND url = ?",
+                (self.namespace, company.canonical)
+            ).fetchone()
+            if row is None and company.id:
+                row = conn.execute(
+                    "SELECT data, fetched_at FROM company_pages "
+                    "WHERE namespace = ? AND kind = ? AND company_id = ? "
+                    "ORDER BY fetched_at DESC LIMIT 1", (self.namespace, company.kind, company.id)
+                ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return json.loads(row[0])
+
+    def put(self, url: str, data: Dict):
+        """Store data for url (replacing any older entry)."""
+        company = classify_url(url)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO company_pages "
+                "(namespace, url, kind, company_id, name, website, description, type, industry, size, "
+                "data, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.namespace,
+                    company.canonical,
+                    company.kind,
+                    company.id,
+                    data.get("name", ""),
+                    data.get("website", ""),
+                    data.get("description", data.get("about", "")),
+                    data.get("type", ""),
+                    data.get("industry", ""),
+                    data.get("size", ""),
+                    json.dumps(data, ensure_ascii=False),
+                    time.time()
+                )
+            )
+            conn.commit()
+
+    def get_or_fetch(self, url: str, fetch: Callable[[], Optional[Dict]]) -> Tuple[Optional[Dict], bool]:
+        """Return (data, from_cache) for url, fetching (at most once per run) on a miss.
+
+        fetch() should return a dict, or None when the page could not be read;
+        None results are not cached so a later profile can retry. from_cache
+        is False when this call ran fetch(); the hits/misses counters are
+        shared by every thread and only meant for run totals.
+        """
+        key = classify_url(url).canonical
+        while True:
+            cached = self.get(url)
+            if cached is not None:
+                self.hits += 1
+                return cached, True
+            with self._lock:
+                pending = self._in_flight.get(key)
+                if pending is None:
+                    pending = threading.Event()
+                    self._in_flight[key] = pending
+                    owner = True
+                else:
+                    owner = False
+            if owner:
+                break
+            # Someone else is loading this company; reuse their result
+            pending.wait()
+            cached = self.get(url)
+            if cached is not None:
+                self.hits += 1
+                return cached, True
+            # Their fetch failed; loop round and try ourselves
+
+        self.misses += 1
+        try:
+            data = fetch()
+            if data is not None:
+                self.put(url, data)
+            return data, False
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            pending.set()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
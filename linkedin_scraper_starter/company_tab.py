@@ -0,0 +1,27 @@
+"""
+Dedicated browser tab for company lookups.
+
+Company pages are loaded in a second, persistent tab so the profile tab never
+has to navigate away, and therefore never has to be reloaded afterwards.
+"""
+
+# driver session id -> window handle of its company tab
+_company_tabs = {}
+
+
+def switch_to_company_tab(driver) -> str:
+    """Switch to the company tab (opening it on first use) and return the previous handle."""
+    profile_handle = driver.current_window_handle
+    handle = _company_tabs.get(driver.session_id)
+    if handle not in driver.window_handles:
+        driver.switch_to.new_window("tab")
+        _company_tabs[driver.session_id] = driver.current_window_handle
+        print("   → Opened dedicated company tab")
+    else:
+        driver.switch_to.window(handle)
+    return profile_handle
+
+
+def return_from_company_tab(driver, profile_handle: str):
+    """Go back to the profile tab without reloading it."""
+    driver.switch_to.window(profile_handle)
@@ -0,0 +1,48 @@
+"""
+Condition-based "DOM settled" waits.
+
+Replaces fixed time.sleep calls after page loads, "Show more" clicks and modal
+open/close. A MutationObserver watches the relevant subtree and the wait
+returns as soon as it has been quiet for quiet_ms, or when the cap (the old
+fixed sleep) runs out. The politeness delay in human_delay is separate.
+"""
+
+import time
+
+SETTLE_QUIET_MS = 400
+
+# Runs inside the page via execute_async_script; the last argument is the callback
+_SETTLE_SCRIPT = """
+const selector = arguments[0], quietMs = arguments[1], capMs = arguments[2], done = arguments[3];
+const root = (selector && document.querySelector(selector)) || document.body || document.documentElement;
+const start = performance.now();
+let last = start;
+const observer = new MutationObserver(() => { last = performance.now(); });
+observer.observe(root, {childList: true, subtree: true, characterData: true});
+const timer = setInterval(() => {
+    const now = performance.now();
+    if (now - last >= quietMs || now - start >= capMs) {
+        observer.disconnect();
+        clearInterval(timer);
+        done({settled: now - last >= quietMs, waited_ms: now - start});
+    }
+}, 50);
+"""
+
+
+def wait_for_dom_settled(driver, selector: str = "main", cap_seconds: float = 3.0,
+                         quiet_ms: int = SETTLE_QUIET_MS) -> float:
+    """Block until the subtree under selector stops mutating, at most cap_seconds.
+
+    Falls back to the whole body when selector does not match yet. Returns the
+    seconds actually waited. If the script cannot run (e.g. the page is
+    navigating), it sleeps the cap so behaviour never gets worse than before.
+    """
+    start = time.time()
+    try:
+        driver.execute_async_script(_SETTLE_SCRIPT, selector, quiet_ms, int(cap_seconds * 1000))
+    except Exception:
+        remaining = cap_seconds - (time.time() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+    return time.time() - start
@@ -0,0 +1,258 @@
+"""
+Chrome startup shared by the scraper scripts.
+
+Launch approaches are always tried in order of preference. Failures are
+counted per host in LAUNCH_CACHE_PATH: an approach that failed
+LAUNCH_SKIP_AFTER_FAILURES times in a row is skipped until
+LAUNCH_RETRY_AFTER_SECONDS have passed, so a broken approach no longer costs a
+full Chrome launch on every run, while a one-off failure (a locked profile)
+does not push the host off the preferred approach. The health check
+stays local (about:blank plus a CDP Browser.getVersion) instead of loading an
+external page, and the time from launch to a usable driver is reported.
+
+Browsers keep a size-capped HTTP disk cache under DISK_CACHE_DIR that
+outlives the run, so LinkedIn's hashed JS/CSS bundles are not downloaded again
+on the first pages of every session. Chrome's cache backend cannot be shared
+by two running browsers, so each live browser in this process claims its own
+slot directory (the current browser and a warm standby use slot-0 and slot-1)
+and hands it back with release_disk_cache(). The caches go on tmpfs only
+when /dev/shm has room for DISK_CACHE_SLOTS full caps plus TMPFS_HEADROOM_MB
+(Docker's default /dev/shm is 64 MB), and in .chrome_cache/ otherwise.
+"""
+
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+from typing import List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+
+LAUNCH_CACHE_PATH = ".driver_launch.json"
+LAUNCH_SKIP_AFTER_FAILURES = 3
+LAUNCH_RETRY_AFTER_SECONDS = 24 * 3600
+
+TMPFS_ROOT = "/dev/shm"
+# Space on tmpfs left over for everything else (runtime profiles, other programs)
+TMPFS_HEADROOM_MB = 128
+
+# Static-asset cache kept across runs, independent of the Chrome profile (cap per browser)
+DISK_CACHE_SIZE_MB = 256
+# Browsers expected to run at once: the current one and a warm standby
+DISK_CACHE_SLOTS = 2
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def has_tmpfs_room(required_mb: float, existing: Optional[str] = None, root: str = TMPFS_ROOT) -> bool:
+    """True when root has required_mb free plus the headroom.
+
+    Space already taken by existing (a directory on root) counts as free.
+    """
+    try:
+        free = shutil.disk_usage(root).free
+    except OSError:
+        return False
+    if existing and os.path.isdir(existing):
+        free += _dir_size(existing)
+    return free >= (required_mb + TMPFS_HEADROOM_MB) * 1024 * 1024
+
+
+def _disk_cache_dir() -> str:
+    tmpfs_dir = os.path.join(TMPFS_ROOT, "linkedin_scraper_cache")
+    if has_tmpfs_room(DISK_CACHE_SIZE_MB * DISK_CACHE_SLOTS, existing=tmpfs_dir):
+        return tmpfs_dir
+    return os.path.join(os.getcwd(), ".chrome_cache")
+
+
+DISK_CACHE_DIR = _disk_cache_dir()
+
+_cache_slots_in_use = set()
+_cache_slots_lock = threading.Lock()
+
+
+def claim_disk_cache() -> str:
+    """Cache directory for a new browser: the lowest slot no live browser of this process uses."""
+    with _cache_slots_lock:
+        slot = 0
+        while slot in _cache_slots_in_use:
+            slot += 1
+        _cache_slots_in_use.add(slot)
+    return os.path.join(DISK_CACHE_DIR, f"slot-{slot}")
+
+
+def release_disk_cache(driver_or_dir):
+    """Hand a browser's cache slot back (pass the driver or its cache directory) after quit()."""
+    path = getattr(driver_or_dir, "disk_cache_dir", driver_or_dir)
+    if not isinstance(path, str):
+        return
+    with _cache_slots_lock:
+        _cache_slots_in_use.discard(int(path.rsplit("slot-", 1)[1]))
+
+BASE_ARGUMENTS = [
+    "--start-maximized",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+]
+
+# Tried in order of preference; approaches that keep failing on this host are skipped for a while
+LAUNCH_APPROACHES = [
+    # # Use existing profile (if Chrome is closed)
+    # {
+    #     "name": "existing profile",
+    #     "options": [
+    #         r"--user-data-dir=C:\Users\Harsh\AppData\Local\Google\Chrome\User Data",
+    #         r"--profile-directory=Profile 1"
+    #     ]
+    # },
+    # Slim profile materialised by chrome_profile.ChromeProfile (user_data_dir)
+    {
+        "name": "slim profile",
+        "user_data_dir": True,
+        "options": [
+            "--profile-directory=Default",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-component-update"
+        ]
+    },
+    {
+        "name": "default",
+        "options": []
+    }
+]
+
+
+def build_options(arguments: List[str], headless: bool = False, performance_log: bool = False,
+                  disk_cache_dir: Optional[str] = None) -> Options:
+    """Fresh Chrome options: the shared base arguments plus an approach's own.
+
+    performance_log turns on Chrome's performance log (network events), which
+    resource_blocking reads to measure bytes per page. disk_cache_dir must not
+    be in use by another running browser.
+    """
+    options = Options()
+    for arg in BASE_ARGUMENTS:
+        options.add_argument(arg)
+    if disk_cache_dir:
+        options.add_argument(f"--disk-cache-dir={disk_cache_dir}")
+        options.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE_MB * 1024 * 1024}")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    if headless:
+        options.add_argument("--headless=new")
+    if performance_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    for arg in arguments:
+        options.add_argument(arg)
+    return options
+
+
+def check_driver(driver) -> str:
+    """Local health check; returns the browser version string. Raises if the driver is unusable."""
+    driver.get("about:blank")
+    try:
+        return driver.execute_cdp_cmd("Browser.getVersion", {}).get("product", "")
+    except (AttributeError, WebDriverException):
+        # Non-Chromium drivers have no CDP; the about:blank load already proved the session works
+        return driver.capabilities.get("browserVersion", "")
+
+
+def _load_cache(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or not all(isinstance(hosts, dict) for hosts in cache.values()):
+        return {}
+    return cache
+
+
+def _save_cache(path: str, cache: dict):
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=1)
+    except OSError as e:
+        print(f"⚠️ Could not save the launch cache {path}: {e}")
+
+
+def is_skipped(failures: dict, now: float) -> bool:
+    """True while an approach's failure record says it keeps failing on this host."""
+    return (failures.get("count", 0) >= LAUNCH_SKIP_AFTER_FAILURES
+            and now - failures.get("last", 0) < LAUNCH_RETRY_AFTER_SECONDS)
+
+
+def runnable_approaches(approaches: List[dict], host_failures: dict, now: float) -> List[dict]:
+    """approaches in preference order without those that keep failing (all of them if every one does)."""
+    runnable = [approach for approach in approaches
+                if not is_skipped(host_failures.get(approach["name"], {}), now)]
+    return runnable or list(approaches)
+
+
+def launch_driver(page_load_timeout: float, implicit_wait: float, headless: bool = False,
+                  performance_log: bool = False, user_data_dir: Optional[str] = None,
+                  approaches: List[dict] = LAUNCH_APPROACHES,
+                  cache_path: Optional[str] = LAUNCH_CACHE_PATH) -> Optional[webdriver.Chrome]:
+    """Start Chrome with the first working approach, or return None when all fail.
+
+    Approaches marked user_data_dir run on the given profile directory and are
+    skipped without one. The driver's cache slot is in driver.disk_cache_dir;
+    release it with release_disk_cache(driver) once the driver has quit.
+    """
+    host = socket.gethostname()
+    cache = _load_cache(cache_path) if cache_path else {}
+    host_failures = cache.setdefault(host, {})
+    started = time.perf_counter()
+    disk_cache_dir = claim_disk_cache()
+
+    for approach in runnable_approaches(approaches, host_failures, time.time()):
+        arguments = list(approach["options"])
+        if approach.get("user_data_dir"):
+            if not user_data_dir:
+                continue
+            arguments.insert(0, f"--user-data-dir={user_data_dir}")
+        driver = None
+        try:
+            print(f"Trying to start Chrome with {approach['name']}...")
+            driver = webdriver.Chrome(options=build_options(arguments, headless, performance_log, disk_cache_dir))
+            driver.set_page_load_timeout(page_load_timeout)
+            driver.implicitly_wait(implicit_wait)
+            version = check_driver(driver)
+        except WebDriverException as e:
+            print(f"❌ Failed with {approach['name']}: {str(e)[:100]}...")
+            failures = host_failures.setdefault(approach["name"], {})
+            failures["count"] = failures.get("count", 0) + 1
+            failures["last"] = time.time()
+            if cache_path:
+                _save_cache(cache_path, cache)
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+            continue
+
+        elapsed = time.perf_counter() - started
+        print(f"✅ Chrome ready in {elapsed:.2f}s with {approach['name']} ({version or 'unknown version'})")
+        if cache_path and host_failures.pop(approach["name"], None):
+            _save_cache(cache_path, cache)
+        driver.disk_cache_dir = disk_cache_dir
+        return driver
+
+    release_disk_cache(disk_cache_dir)
+    return None
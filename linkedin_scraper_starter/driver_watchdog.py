@@ -0,0 +1,211 @@
+"""
+Browser memory watchdog with driver recycling.
+
+Over a long run Chrome's renderer keeps growing: pages get slower and sooner or
+later the driver dies. RecyclingDriver stands in for the WebDriver (every
+attribute is forwarded to the current driver, so code and worker threads that
+hold it keep working) and, at page boundaries, replaces that driver when
+
+- the browser uses more than max_memory_mb,
+- it has loaded max_pages pages (every get() through the proxy counts,
+  company pages included), or
+- it no longer responds.
+
+Memory is the unique set size (USS) of Chrome's process tree under
+chromedriver when psutil is installed, so pages shared between Chrome's
+processes are counted once; otherwise it is the page's JS heap from CDP
+Performance.getMetrics. Once the current driver gets close to a limit, a
+standby driver is launched on a background thread, so the swap itself only
+costs a session cookie restore. When no replacement can be started, the
+current driver is kept and the swap is retried at the next page boundary.
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Callable, Optional
+
+try:
+    import psutil
+except ImportError:  # optional: fall back to the JS heap reported over CDP
+    psutil = None
+
+MAX_BROWSER_MEMORY_MB = 1500
+MAX_PAGES_PER_DRIVER = 200
+MEMORY_CHECK_EVERY = 5
+# The standby browser is launched at this share of either limit
+STANDBY_AT = 0.8
+
+
+def browser_memory(driver) -> Optional[dict]:
+    """Current memory of the driver's browser, or None when it cannot be measured.
+
+    {"total_mb": ..., "renderer_mb": largest renderer, "source": "psutil" | "cdp"}
+    """
+    if psutil is not None:
+        try:
+            processes = psutil.Process(driver.service.process.pid).children(recursive=True)
+            total = renderer = 0
+            for process in processes:
+                try:
+                    uss = process.memory_full_info().uss
+                    if "--type=renderer" in process.cmdline():
+                        renderer = max(renderer, uss)
+                except psutil.Error:
+                    continue
+                total += uss
+            if total:
+                return {"total_mb": total / 2 ** 20, "renderer_mb": renderer / 2 ** 20, "source": "psutil"}
+        except (AttributeError, psutil.Error):
+            pass
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics", [])
+    except Exception:
+        return None
+    heap = {metric["name"]: metric["value"] for metric in metrics}.get("JSHeapTotalSize")
+    if heap is None:
+        return None
+    return {"total_mb": heap / 2 ** 20, "renderer_mb": heap / 2 ** 20, "source": "cdp"}
+
+
+def is_alive(driver) -> bool:
+    """True when the driver still answers a cheap command."""
+    try:
+        driver.current_window_handle
+        return True
+    except Exception:
+        return False
+
+
+def _discard(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class RecyclingDriver:
+    """WebDriver proxy that swaps in a fresh browser at page boundaries.
+
+    start_driver() launches a new driver with the saved session (None on
+    failure); stop_driver(driver) saves the session and quits it;
+    refresh_session(driver) re-applies the saved session to a standby that was
+    launched before the old driver saved it.
+    """
+
+    def __init__(self, driver, start_driver: Callable, stop_driver: Callable,
+                 refresh_session: Optional[Callable] = None,
+                 max_memory_mb: float = MAX_BROWSER_MEMORY_MB, max_pages: int = MAX_PAGES_PER_DRIVER,
+                 check_every: int = MEMORY_CHECK_EVERY, standby_at: float = STANDBY_AT):
+        self._driver = driver
+        self._start = start_driver
+        self._stop = stop_driver
+        self._refresh = refresh_session
+        self.max_memory_mb = max_memory_mb
+        self.max_pages = max_pages
+        self.check_every = check_every
+        self.standby_at = standby_at
+        self.pages = 0
+        self._boundaries = 0
+        self.last_memory: Optional[dict] = None
+        self.recycles = Counter()
+        self._standby = None
+        self._standby_thread: Optional[threading.Thread] = None
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def get(self, url: str):
+        self.pages += 1
+        return self._driver.get(url)
+
+    def page_boundary(self) -> bool:
+        """Call between pages: replaces the driver when it is due. True when it was replaced."""
+        self._boundaries += 1
+        reason = None
+        if not is_alive(self._driver):
+            reason = "not responding"
+        elif self.pages >= self.max_pages:
+            reason = "page limit"
+        elif self._boundaries % self.check_every == 0:
+            sample = browser_memory(self._driver)
+            if sample:
+                self.last_memory = sample
+                if sample["total_mb"] > self.max_memory_mb:
+                    reason = "memory"
+                elif sample["total_mb"] > self.max_memory_mb * self.standby_at:
+                    self._launch_standby()
+
+        if reason:
+            return self.recycle(reason)
+        if self.pages >= self.max_pages * self.standby_at:
+            self._launch_standby()
+        return False
+
+    def recycle(self, reason: str) -> bool:
+        """Replace the current driver now (the standby when it is ready).
+
+        Returns False, keeping the current driver, when no replacement starts.
+        """
+        memory = f", {self.last_memory['total_mb']:.0f} MB" if self.last_memory else ""
+        print(f"   🔁 Recycling the browser ({reason}: {self.pages} pages{memory})")
+        started = time.perf_counter()
+        driver = self._take_standby()
+        if driver is None:
+            try:
+                driver = self._start()
+            except Exception as e:
+                print(f"   ⚠️ {e}")
+                driver = None
+        if driver is None:
+            print("   ⚠️ Could not start a replacement browser; retrying at the next page")
+            return False
+        # The old browser saves its session first, so the new one gets the latest cookies
+        self._stop(self._driver)
+        if self._refresh:
+            self._refresh(driver)
+        self._driver = driver
+        self.pages = 0
+        self.last_memory = None
+        self.recycles[reason] += 1
+        print(f"   🔁 Browser replaced in {time.perf_counter() - started:.2f}s")
+        return True
+
+    def _launch_standby(self):
+        if self._standby_thread is not None:
+            return
+        print("   🔁 Launching a standby browser in the background")
+        self._standby_thread = threading.Thread(target=self._run_standby, name="standby-driver", daemon=True)
+        self._standby_thread.start()
+
+    def _run_standby(self):
+        try:
+            self._standby = self._start()
+        except Exception as e:
+            print(f"   ⚠️ Standby browser failed to start: {e}")
+            self._standby = None
+
+    def _take_standby(self):
+        """The standby driver (waiting for its launch to finish), or None."""
+        if self._standby_thread is None:
+            return None
+        self._standby_thread.join()
+        driver, self._standby, self._standby_thread = self._standby, None, None
+        if driver is not None and not is_alive(driver):
+            _discard(driver)
+            return None
+        return driver
+
+    def quit(self):
+        """Quit the current browser and any standby (the standby's session is not saved)."""
+        standby = self._take_standby()
+        if standby is not None:
+            _discard(standby)
+        self._driver.quit()
+
+    def summary(self) -> str:
+        if not self.recycles:
+            return "Browser recycling: none"
+        reasons = ", ".join(f"{count} × {reason}" for reason, count in self.recycles.items())
+        return f"Browser recycling: {sum(self.recycles.values())} ({reasons})"
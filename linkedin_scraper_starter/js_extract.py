@@ -0,0 +1,51 @@
+"""
+Single-call JavaScript extraction backend.
+
+page_extractor.js evaluates every selector cascade inside the page and returns
+one JSON object, so a profile (or company page) costs one execute_script round
+trip instead of hundreds of per-element Selenium commands.
+"""
+
+import os
+from typing import Dict
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "page_extractor.js")
+
+_script_source = None
+
+
+def load_script() -> str:
+    """Read page_extractor.js once and keep it for the rest of the run."""
+    global _script_source
+    if _script_source is None:
+        with open(SCRIPT_PATH, encoding="utf-8") as f:
+            _script_source = f.read()
+    return _script_source
+
+
+def run_page_extractor(driver, kind: str, url: str = ""):
+    """Send the extractor with one execute_script call and return its JSON result."""
+    return driver.execute_script(load_script() + "\nreturn extractPage(arguments[0], arguments[1]);", kind, url)
+
+
+def extract_profile_js(driver, is_sales_navigator: bool = False) -> Dict:
+    """Extract a profile in one round trip.
+
+    Returns {"profile": {...test2 columns...}, "experience": [...], "education": "..."}
+    where each experience item has role, company, duration, location and company_url.
+    """
+    result = run_page_extractor(driver, "sales_navigator" if is_sales_navigator else "linkedin") or {}
+    result.setdefault("profile", {})
+    result.setdefault("experience", [])
+    result.setdefault("education", "")
+    return result
+
+
+def extract_company_js(driver, company_url: str) -> tuple:
+    """Extract a company page in one round trip.
+
+    Returns tuple: (company_name, website_url, company_description)
+    """
+    result = run_page_extractor(driver, "company", company_url) or {}
+    return result.get("name", ""), result.get("website", ""), result.get("description", "")
+
@@ -0,0 +1,414 @@
+// Single-call in-page extractor used by js_extract.py.
+//
+// The whole file is sent with one execute_script call and returns one JSON
+// object, so a profile costs one WebDriver round trip instead of one per
+// selector. The DOM logic is ported from LinkedInScrapperV2/content.js
+// (extractExperience, extractAboutSection, extractEducation) and from the
+// selector cascades in test2.py, made synchronous: clamped "see more" text is
+// already in the DOM, so no clicks or sleeps are needed.
+
+function safeText(element) {
+    try {
+        if (!element) return "";
+        const text = element.innerText !== undefined ? element.innerText : element.textContent;
+        return text ? text.trim() : "";
+    } catch {
+        return "";
+    }
+}
+
+function queryOne(selector, root = document) {
+    try {
+        if (selector.startsWith("/")) {
+            return document.evaluate(selector, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        return root.querySelector(selector);
+    } catch (e) {
+        return null;
+    }
+}
+
+function queryAll(selector, root = document) {
+    try {
+        return Array.from(root.querySelectorAll(selector));
+    } catch (e) {
+        return [];
+    }
+}
+
+function firstText(selectors, minLength = 2, root = document) {
+    for (const selector of selectors) {
+        const text = safeText(queryOne(selector, root));
+        if (text && text.length >= minLength) return text;
+    }
+    return "";
+}
+
+function absoluteUrl(href) {
+    if (!href) return "";
+    if (href.startsWith("/")) return "https://www.linkedin.com" + href;
+    return href;
+}
+
+function buildEntry(item) {
+    const parts = [];
+    if (item.role) parts.push(item.role);
+    if (item.company) parts.push(`at ${item.company}`);
+    if (item.duration) parts.push(`(${item.duration})`);
+    if (item.location) parts.push(`[${item.location}]`);
+    return parts.join(" ");
+}
+
+function splitName(data, fullName) {
+    data["Full Name"] = fullName;
+    const idx = fullName.indexOf(" ");
+    data["First Name"] = idx === -1 ? fullName : fullName.substring(0, idx);
+    data["Last Name"] = idx === -1 ? "" : fullName.substring(idx + 1);
+}
+
+function emptyProfile() {
+    return {
+        "First Name": "",
+        "Last Name": "",
+        "Full Name": "",
+        "Designation": "",
+        "Current Position": "",
+        "About": "",
+        "Location": "",
+        "Email": "",
+        "Mobile No.": "",
+        "Experience": "",
+        "Company Name": "",
+        "Company Url": "",
+        "Company Website": "",
+        "Company Description": "",
+        "Profile Url": window.location.href
+    };
+}
+
+function extractAboutSection(isSalesNavigator) {
+    let aboutText = "";
+
+    if (isSalesNavigator) {
+        const texts = [];
+        const textSelectors = [
+            "div[data-anonymize='person-blurb']",
+            "#about-section div._content-width_1dtbsb",
+            "div[id*='clamped-content']",
+            "._about-section_1dtbsb ._bodyText_1e5nen"
+        ];
+        for (const selector of textSelectors) {
+            for (const elem of queryAll(selector)) {
+                const text = safeText(elem);
+                if (text && text.length > 20) {
+                    texts.push(text.replace("… Show more", "").trim());
+                }
+            }
+        }
+        aboutText = texts.join("\n\n").trim();
+    } else {
+        // visually-hidden span always carries the full text (content.js step 1)
+        aboutText = safeText(queryOne(".inline-show-more-text--is-collapsed span.visually-hidden"));
+
+        if (!aboutText) {
+            aboutText = firstText([
+                ".pv-about__summary-text .lt-line-clamp__raw-line",
+                "div.full-width.t-14.t-normal.t-black span[aria-hidden='true']",
+                ".pv-about__summary-text",
+                "div[class*='full-width t-14 t-normal t-black'] span[aria-hidden='true']",
+                "div.qmdGMKYuIypnxyEHNTIvfxuATDBMXQom span[aria-hidden='true']",
+                "div.FwOlsjQqkKryZHlZOACWZtVIHRMuhoM span"
+            ], 21);
+        }
+
+        if (!aboutText) {
+            aboutText = queryAll(".lt-line-clamp__raw-line, .lt-line-clamp__line")
+                .map(l => safeText(l))
+                .filter(text => text)
+                .join("\n")
+                .trim();
+        }
+    }
+
+    if (aboutText) {
+        aboutText = aboutText
+            .split("\n\n")
+            .map(para => para.trim())
+            .filter(para => para)
+            .join("\n\n");
+    }
+    return aboutText;
+}
+
+function linkedInExperienceItems() {
+    let ul = queryOne("//*[@id='profile-content']/div/div[2]/div/div/main/section[6]/div[3]/ul");
+    if (!ul) {
+        // content.js: walk up from the #experience anchor to its section
+        const anchor = queryOne("div#experience.pv-profile-card__anchor");
+        const section = anchor ? anchor.closest("section") : null;
+        ul = section ? section.querySelector("ul") : queryOne("section[data-section='experience'] ul, .experience-section ul");
+    }
+    return ul ? queryAll("li.artdeco-list__item", ul) : [];
+}
+
+function extractLinkedInExperienceItem(item) {
+    const role = firstText([
+        "span.t-bold span[aria-hidden='true']",
+        ".display-flex.align-items-center .t-bold span[aria-hidden='true']",
+        ".mr1.t-bold span[aria-hidden='true']",
+        ".hoverable-link-text.t-bold span[aria-hidden='true']"
+    ], 2, item);
+
+    let company = "";
+    for (const sel of ["span.t-14.t-normal span[aria-hidden='true']", ".t-14.t-normal span[aria-hidden='true']"]) {
+        const txt = safeText(queryOne(sel, item));
+        if (txt && !/(·|yr|mo|Present)/.test(txt)) {
+            company = txt;
+            break;
+        }
+    }
+
+    let duration = "";
+    for (const sel of ["span.pvs-entity__caption-wrapper[aria-hidden='true']", ".t-14.t-normal.t-black--light span[aria-hidden='true']"]) {
+        const txt = safeText(queryOne(sel, item));
+        if (txt && /(yr|mo|Present|–|-)/.test(txt)) {
+            duration = txt;
+            break;
+        }
+    }
+
+    let location = "";
+    for (const span of queryAll(".t-14.t-normal span[aria-hidden='true']", item)) {
+        const txt = safeText(span);
+        if (txt && /(Remote|Hybrid|United States|United Kingdom|India|Canada|Australia)/.test(txt)) {
+            location = txt;
+            break;
+        }
+    }
+
+    const link = queryOne("a[href*='/company/']", item);
+    return { role, company, duration, location, company_url: link ? link.href : "" };
+}
+
+function extractSalesNavigatorExperienceItem(item) {
+    const role = firstText(["h2[data-anonymize='job-title']"], 1, item);
+    const company = firstText(["p[data-anonymize='company-name']"], 1, item);
+
+    let duration = "";
+    const dateElem = queryOne("span.FaIDAmBvHCUAhRDrOYReTwrRgdFObBlKKw", item);
+    const durationElem = queryOne("p._bodyText_1e5nen._default_1i6ulk._sizeXSmall_1e5nen._lowEmphasis_1i6ulk", item);
+    if (dateElem && durationElem) {
+        const dateRange = safeText(dateElem);
+        const fullText = safeText(durationElem);
+        if (dateRange && fullText) {
+            const parts = fullText.split(dateRange);
+            if (parts.length > 1) {
+                const durationOnly = parts[1].trim();
+                duration = durationOnly ? `${dateRange} · ${durationOnly}` : dateRange;
+            } else {
+                duration = dateRange;
+            }
+        } else {
+            duration = dateRange || fullText;
+        }
+    }
+
+    const location = firstText(["p.IcGLmQVeFqxrUMEeMBuKbysvdrtdpDiSlHJY"], 1, item);
+    const link = queryOne("a[href*='/sales/company/']", item);
+    return { role, company, duration, location, company_url: absoluteUrl(link ? link.getAttribute("href") : "") };
+}
+
+function extractExperience(isSalesNavigator) {
+    if (isSalesNavigator) {
+        const ul = queryOne("//*[@id='scroll-to-experience-section']/div/ul");
+        return ul ? queryAll("li._experience-entry_1irc72", ul).map(extractSalesNavigatorExperienceItem) : [];
+    }
+    return linkedInExperienceItems().map(extractLinkedInExperienceItem);
+}
+
+function extractEducation() {
+    const anchor = queryOne("div#education.pv-profile-card__anchor");
+    let eduItems = [];
+    if (anchor) {
+        const section = anchor.closest("section");
+        const ul = section ? section.querySelector("ul") : null;
+        if (ul) eduItems = queryAll("li.artdeco-list__item, li", ul);
+    }
+    if (eduItems.length === 0) {
+        for (const selector of [
+            "section[data-section='education'] ul li",
+            ".education-section li",
+            ".pv-profile-section.education-section ul li"
+        ]) {
+            eduItems = queryAll(selector);
+            if (eduItems.length > 0) break;
+        }
+    }
+
+    const entries = [];
+    for (const item of eduItems) {
+        const degree = safeText(queryOne("span.t-bold span[aria-hidden='true']", item) || queryOne(".pv-education-entity__degree", item));
+        const institution = safeText(queryOne("span.t-14.t-normal span[aria-hidden='true']", item) || queryOne(".pv-education-entity__school-name", item));
+        const duration = safeText(queryOne("span.t-14.t-normal.t-black--light span[aria-hidden='true']", item) || queryOne(".pv-education-entity__dates", item));
+        const entry = [degree, institution, duration].filter(Boolean).join(" · ");
+        if (entry) entries.push(entry);
+    }
+    return entries.join("\n");
+}
+
+function applyExperience(data, items) {
+    const lines = items.filter(i => i.role || i.company).map(buildEntry);
+    if (lines.length > 0) data["Experience"] = lines.join("\n");
+    if (items.length > 0) {
+        if (items[0].company) data["Company Name"] = items[0].company;
+        if (items[0].company_url) data["Company Url"] = items[0].company_url;
+    }
+}
+
+function extractLinkedInProfile() {
+    const data = emptyProfile();
+    const fullName = firstText(["h1", "div.text-heading-xlarge", "h1.text-heading-xlarge"]);
+    if (fullName) splitName(data, fullName);
+    data["Designation"] = firstText([
+        "div.text-body-medium.break-words",
+        "div.ph5 div.text-body-medium",
+        ".pv-text-details__left-panel .text-body-medium"
+    ]);
+    data["Location"] = firstText([
+        "span.text-body-small.inline.t-black--light.break-words",
+        ".pv-text-details__left-panel .pb2 .text-body-small",
+        "div.ph5 span.text-body-small"
+    ]);
+
+    const items = extractExperience(false);
+    applyExperience(data, items);
+
+    if (data["Experience"]) {
+        data["Current Position"] = data["Experience"].split("\n")[0];
+    } else if (data["Designation"] && data["Company Name"]) {
+        data["Current Position"] = `${data["Designation"]} at ${data["Company Name"]}`;
+    } else if (data["Designation"]) {
+        data["Current Position"] = data["Designation"];
+    }
+
+    data["About"] = extractAboutSection(false);
+    return { profile: data, experience: items, education: extractEducation() };
+}
+
+function extractSalesNavigatorProfile() {
+    const data = emptyProfile();
+    const fullName = firstText([
+        "//*[@id='profile-card-section']/section[1]/div[1]/div[2]/h1",
+        ".profile-topcard-person__name",
+        "h1.profile-topcard-person__name",
+        "#profile-card-section h1"
+    ]);
+    if (fullName) splitName(data, fullName);
+
+    const lockup = queryOne("div._lockup-content-overflow-hidden_p4eb22");
+    if (lockup) {
+        const roleCompany = queryOne("p._current-role-item_th0xau", lockup);
+        const dateDuration = queryOne("p._bodyText_1e5nen", lockup);
+        if (roleCompany && dateDuration) {
+            data["Current Position"] = `${safeText(roleCompany)} ${safeText(dateDuration)}`;
+        }
+    }
+
+    data["Designation"] = firstText([
+        "#profile-card-section .profile-topcard__headline",
+        ".profile-topcard__headline",
+        ".profile-topcard__headline-text",
+        ".profile-topcard-person__headline",
+        "[data-anonymize='headline']",
+        "//*[@id='profile-card-section']/section[1]/div[1]/div[3]"
+    ]);
+    data["Location"] = firstText([".profile-topcard__location", ".profile-topcard-person__location"]);
+    data["About"] = extractAboutSection(true);
+
+    const items = extractExperience(true);
+    applyExperience(data, items);
+    return { profile: data, experience: items, education: "" };
+}
+
+function extractCompany(companyUrl) {
+    const name = firstText([
+        "h1.org-top-card-summary__title",
+        "h1[class*='org-top-card-summary__title']",
+        ".org-top-card-summary__title",
+        "h1"
+    ], 1);
+
+    let website = "";
+    const websiteSelectors = [
+        "a[href*='://']:not([href*='linkedin']):not([href*='mailto']):not([href*='tel'])",
+        ".company-overview__website a",
+        "[data-field='website'] a",
+        ".company-info a[href*='://']:not([href*='linkedin'])",
+        "a.link-without-visited-state:not([href*='linkedin'])",
+        "a[href^='https://']:not([href*='linkedin.com'])",
+        "a[href^='www.']"
+    ];
+    outer:
+    for (const selector of websiteSelectors) {
+        for (const elem of queryAll(selector)) {
+            const href = elem.href || "";
+            const lower = href.toLowerCase();
+            if (href && !["linkedin.com", "mailto:", "tel:", "javascript:"].some(x => lower.includes(x)) && href.startsWith("http")) {
+                website = href;
+                break outer;
+            }
+        }
+    }
+
+    let description = "";
+    if (companyUrl.includes("/sales/company/")) {
+        description = firstText([
+            "p[data-anonymize='company-blurb']",
+            "[data-anonymize='company-blurb']",
+            "._description-wrapper_mb60vc p",
+            ".pb1 p[data-anonymize='company-blurb']"
+        ], 21);
+    } else {
+        description = firstText([
+            ".lt-line-clamp__raw-line",
+            ".org-about-module__description .lt-line-clamp__raw-line",
+            ".organization-about-module__content-consistant-cards-description .lt-line-clamp__raw-line",
+            ".org-about-module__description",
+            ".organization-about-module__content-consistant-cards-description"
+        ], 21);
+        if (!description) {
+            for (const selector of [".lt-line-clamp__line", ".organization-about-module__content-consistant-cards-description span"]) {
+                const combined = queryAll(selector).map(e => safeText(e)).filter(Boolean).join(" ").trim();
+                if (combined.length > 20) {
+                    description = combined;
+                    break;
+                }
+            }
+        }
+    }
+    if (!description) {
+        for (const selector of [
+            "[data-test='about-us-description']",
+            ".about-us-company-module__description",
+            ".org-page-details__definition dd",
+            ".org-about-us__description",
+            "section[data-test='about-us'] p",
+            ".org-top-card-summary__description",
+            "[data-test='company-about-us'] p"
+        ]) {
+            const match = queryAll(selector).map(e => safeText(e)).find(t => t.length > 20);
+            if (match) {
+                description = match;
+                break;
+            }
+        }
+    }
+
+    return { name, website, description };
+}
+
+function extractPage(kind, url) {
+    if (kind === "company") return extractCompany(url || window.location.href);
+    if (kind === "sales_navigator") return extractSalesNavigatorProfile();
+    return extractLinkedInProfile();
+}
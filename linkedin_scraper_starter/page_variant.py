@@ -0,0 +1,77 @@
+"""
+Page-variant fingerprinting.
+
+Profile pages come in a few layout families that need different selectors:
+
+    classic          legacy pv-* top card (pv-text-details__left-panel)
+    artdeco          current layout, ph5 top card with text-heading-xlarge
+    sales_navigator  hashed _xxx_1dtbsb classes with data-anonymize attributes
+
+detect_variant() checks a few marker nodes in one execute_script call, and
+the extractors then read each top-card field with the variant's single
+selector (VARIANT_SELECTORS), falling back to the full cascade only when that
+lookup comes back empty.
+"""
+
+from typing import Dict, Optional
+
+from selenium.webdriver.common.by import By
+
+CLASSIC = "classic"
+ARTDECO = "artdeco"
+SALES_NAVIGATOR = "sales_navigator"
+
+# Checked in order; the first variant with a matching marker wins
+VARIANT_MARKERS = [
+    (SALES_NAVIGATOR, "[data-anonymize='person-name'], #profile-card-section, [class*='_content-width_1dtbsb']"),
+    (CLASSIC, ".pv-text-details__left-panel h1, section.pv-top-card .pv-top-card--list"),
+    (ARTDECO, "main .ph5 h1.text-heading-xlarge, main h1.text-heading-xlarge"),
+]
+
+# One selector per top-card field and variant
+VARIANT_SELECTORS: Dict[str, Dict[str, str]] = {
+    CLASSIC: {
+        "name": ".pv-text-details__left-panel h1",
+        "headline": ".pv-text-details__left-panel .text-body-medium",
+        "location": ".pv-text-details__left-panel .pb2 .text-body-small",
+    },
+    ARTDECO: {
+        "name": "main .ph5 h1.text-heading-xlarge",
+        "headline": "main .ph5 div.text-body-medium.break-words",
+        "location": "main .ph5 span.text-body-small.inline.t-black--light.break-words",
+    },
+    SALES_NAVIGATOR: {
+        "name": "[data-anonymize='person-name']",
+        "headline": "[data-anonymize='headline']",
+        "location": "[data-anonymize='location']",
+    },
+}
+
+_DETECT_SCRIPT = """
+const markers = arguments[0];
+for (const [variant, selector] of markers) {
+    if (document.querySelector(selector)) return variant;
+}
+return null;
+"""
+
+
+def detect_variant(driver) -> Optional[str]:
+    """Layout family of the loaded profile page, or None when no marker matches."""
+    try:
+        return driver.execute_script(_DETECT_SCRIPT, [list(marker) for marker in VARIANT_MARKERS])
+    except Exception as e:
+        print(f"   ⚠️ Page variant detection failed: {e}")
+        return None
+
+
+def variant_field(driver, variant: Optional[str], field: str) -> str:
+    """Text of field via the variant's single selector ("" when unknown or missing)."""
+    selector = VARIANT_SELECTORS.get(variant, {}).get(field)
+    if not selector:
+        return ""
+    try:
+        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+        return (elements[0].text or "").strip() if elements else ""
+    except Exception:
+        return ""
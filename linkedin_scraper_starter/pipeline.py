@@ -0,0 +1,155 @@
+"""
+Producer/consumer runner that overlaps extraction with the politeness delay.
+
+The browser thread only navigates and captures page_source. Worker threads
+parse the snapshot, normalise fields, look up the company cache and write to
+the result sink while the browser sits out human_delay. Anything that needs
+the browser again (a company page on a cache miss) is queued back to the
+browser thread with run_in_browser and served between navigations and during
+the delay. The delay restarts after every page load served that way, so the
+gap between any LinkedIn request and the next profile load is never shorter
+than configured.
+
+The snapshot queue is bounded: when workers fall behind, the browser thread
+stops navigating until there is room again.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, NamedTuple
+
+PIPELINE_WORKERS = 2
+PIPELINE_QUEUE_SIZE = 4
+
+_POLL_SECONDS = 0.05
+_STOP = object()
+
+
+class PageSnapshot(NamedTuple):
+    url: str
+    page_url: str
+    page_source: str
+
+
+class _BrowserTask:
+    def __init__(self, fn: Callable):
+        self.fn = fn
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.result = self.fn()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done.set()
+
+
+class SnapshotPipeline:
+    """Bounded snapshot queue, worker pool and browser task queue.
+
+    process(snapshot, run_in_browser) runs on a worker thread and returns the
+    record to store; every record is written to sink on the worker side under
+    one lock. Only the thread that created the pipeline may touch the driver,
+    via the functions it passes to run_in_browser.
+    """
+
+    def __init__(self, process: Callable[[PageSnapshot, Callable], Dict], sink,
+                 workers: int = PIPELINE_WORKERS, queue_size: int = PIPELINE_QUEUE_SIZE):
+        self.process = process
+        self.sink = sink
+        self.processed = 0
+        self.browser_busy = 0.0
+        self._snapshots = queue.Queue(maxsize=queue_size)
+        self._browser_tasks = queue.Queue()
+        self._sink_lock = threading.Lock()
+        self._browser_thread = threading.current_thread()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"pipeline-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def write(self, record: Dict):
+        """Write a record from the browser thread (e.g. a page that failed to load)."""
+        with self._sink_lock:
+            self.sink.write(record)
+
+    def run_in_browser(self, fn: Callable):
+        """Run fn on the browser thread and return its result (worker side)."""
+        if threading.current_thread() is self._browser_thread:
+            return fn()
+        task = _BrowserTask(fn)
+        self._browser_tasks.put(task)
+        task.done.wait()
+        if task.error is not None:
+            raise task.error
+        return task.result
+
+    def serve_browser_tasks(self) -> int:
+        """Run queued browser tasks now (browser side). Returns how many ran."""
+        ran = 0
+        while True:
+            try:
+                task = self._browser_tasks.get_nowait()
+            except queue.Empty:
+                return ran
+            start = time.time()
+            task.run()
+            self.browser_busy += time.time() - start
+            ran += 1
+
+    def idle(self, seconds: float) -> float:
+        """Sleep for seconds while serving browser tasks (the politeness delay).
+
+        The delay restarts after each served task. Returns the time spent
+        waiting, without the time the tasks themselves took.
+        """
+        started = time.time()
+        busy_before = self.browser_busy
+        deadline = started + seconds
+        while True:
+            if self.serve_browser_tasks():
+                deadline = time.time() + seconds
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return time.time() - started - (self.browser_busy - busy_before)
+            time.sleep(min(_POLL_SECONDS, remaining))
+
+    def submit(self, snapshot: PageSnapshot):
+        """Queue a snapshot for the workers, blocking while the queue is full."""
+        while True:
+            self.serve_browser_tasks()
+            try:
+                self._snapshots.put(snapshot, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def close(self):
+        """Drain the queue, keep serving browser tasks until every worker exits."""
+        for _ in self._workers:
+            self.submit(_STOP)
+        while any(worker.is_alive() for worker in self._workers):
+            self.serve_browser_tasks()
+            time.sleep(_POLL_SECONDS)
+        self.serve_browser_tasks()
+
+    def _work(self):
+        while True:
+            snapshot = self._snapshots.get()
+            if snapshot is _STOP:
+                return
+            try:
+                record = self.process(snapshot, self.run_in_browser)
+            except Exception as e:
+                print(f"❌ Pipeline worker failed on {snapshot.url}: {e}")
+                continue
+            if record is not None:
+                with self._sink_lock:
+                    self.sink.write(record)
+                    self.processed += 1
@@ -0,0 +1,122 @@
+"""
+Offline re-extraction from the snapshot archive.
+
+Replays archived profile pages through the snapshot extractors (the same field
+logic as extract_linkedin_profile / extract_sales_navigator_profile) and fills
+the first company from its archived company page (scrape_company_info's field
+logic), across a process pool. No browser and no network are involved, so
+after a selector fix the whole archive can be re-processed in minutes:
+
+    python reextract.py snapshots.pack reextracted.jsonl
+    python reextract.py snapshots.pack reextracted.sqlite --workers 8
+
+Each worker opens the archive read-only and decodes pages itself; only the
+small result dicts travel back to the parent, which is the single writer.
+"""
+
+import argparse
+import os
+import time
+from multiprocessing import Pool
+from typing import Dict, List, Optional
+
+from snapshot_archive import SnapshotArchive
+from snapshot_extract import parse_snapshot, extract_snapshot, extract_company_snapshot, empty_profile
+from result_sink import open_sink, is_successful
+from url_utils import PROFILE, SALES_LEAD
+
+CHUNK_SIZE = 64
+COMPANY_MEMO_SIZE = 10000
+
+# Per-process state, set up by _init_worker
+_archive: Optional[SnapshotArchive] = None
+_companies: Dict[str, tuple] = {}
+
+
+def _init_worker(pack_path: str):
+    global _archive, _companies
+    _archive = SnapshotArchive(pack_path, readonly=True)
+    _companies = {}
+
+
+def _company_fields(company_url: str) -> tuple:
+    """Company name/website/description from the archived company page, memoised per worker."""
+    if company_url not in _companies:
+        html = _archive.get(company_url)
+        fields = extract_company_snapshot(parse_snapshot(html, company_url), company_url) if html else ("", "", "")
+        if len(_companies) >= COMPANY_MEMO_SIZE:
+            _companies.clear()
+        _companies[company_url] = fields
+    return _companies[company_url]
+
+
+def reextract_entry(entry: Dict) -> Dict[str, str]:
+    """Re-run extraction for one archived profile page."""
+    url = entry["url"]
+    try:
+        html = _archive.read(entry["id"])
+        tree = parse_snapshot(html, entry["page_url"] or url)
+        profile = extract_snapshot(tree, entry["page_url"] or url, entry["kind"] == SALES_LEAD)
+        profile["Profile Url"] = url
+        if profile["Company Url"]:
+            name, website, description = _company_fields(profile["Company Url"])
+            if name:
+                profile["Company Name"] = name
+            if website:
+                profile["Company Website"] = website
+            if description:
+                profile["Company Description"] = description
+        return profile
+    except Exception as e:
+        record = empty_profile(url)
+        record["Full Name"] = f"ERROR: {e}"
+        return record
+
+
+def _reextract_chunk(entries: List[Dict]) -> List[Dict[str, str]]:
+    return [reextract_entry(entry) for entry in entries]
+
+
+def _chunks(items: List, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def reextract(pack_path: str, output_path: str, workers: Optional[int] = None,
+              chunk_size: int = CHUNK_SIZE) -> Dict[str, float]:
+    """Re-extract the latest capture of every archived profile into output_path."""
+    with SnapshotArchive(pack_path, readonly=True) as archive:
+        entries = [e for e in archive.entries() if e["kind"] in (PROFILE, SALES_LEAD)]
+    workers = workers or os.cpu_count() or 1
+    print(f"🔁 Re-extracting {len(entries)} archived profiles with {workers} processes...")
+
+    start = time.time()
+    written = 0
+    successful = 0
+    with open_sink(output_path) as sink, \
+            Pool(workers, initializer=_init_worker, initargs=(pack_path,)) as pool:
+        for records in pool.imap_unordered(_reextract_chunk, _chunks(entries, chunk_size)):
+            for record in records:
+                sink.write(record)
+                written += 1
+                successful += is_successful(record)
+    elapsed = time.time() - start
+    rate = written / elapsed if elapsed else 0.0
+    print(f"✅ {successful}/{written} profiles re-extracted to {output_path} "
+          f"in {elapsed:.1f}s ({rate:.0f} profiles/s)")
+    return {"profiles": written, "successful": successful, "seconds": elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract profiles from a snapshot archive")
+    parser.add_argument("archive", help="snapshot pack file (e.g. snapshots.pack)")
+    parser.add_argument("output", help="result store to write (.jsonl or .sqlite)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help=f"profiles per task (default {CHUNK_SIZE})")
+    args = parser.parse_args()
+    reextract(args.archive, args.output, args.workers, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Resource-blocking load profile.
+
+Extraction only needs DOM text and hrefs, so images, avatars, banner media,
+fonts and video are blocked with CDP Network.setBlockedURLs before each
+navigation. Blocking is set per tab and per page kind (url_utils kinds), so a
+page type whose text sections need one of these resources can allow it back
+in PAGE_KIND_ALLOW.
+
+Bytes are measured from Chrome's performance log (Network.loadingFinished
+encodedDataLength), which needs the "goog:loggingPrefs" capability set at
+launch (driver_launch.build_options(performance_log=True)). The first page of
+each kind is loaded unblocked as a baseline; later pages of that kind report
+how many requests were blocked and the bytes saved against that baseline.
+The same log gives the share of JS/CSS bundles served from the HTTP disk
+cache (driver_launch.DISK_CACHE_DIR slots), reported per page and for the run.
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from url_utils import classify_url, PROFILE, SALES_LEAD, COMPANY, SALES_COMPANY, UNKNOWN
+
+# Blocked URL patterns per resource type (CDP wildcard syntax)
+BLOCKED_PATTERNS: Dict[str, List[str]] = {
+    "image": ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.ico*",
+              "*media.licdn.com/dms/image/*", "*static.licdn.com/aero-v1/sc/h/*.svg"],
+    "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*dms.licdn.com/playlist/*"],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*"],
+}
+BLOCKED_TYPES = ("image", "media", "font")
+
+# Resource types counted for the disk-cache hit ratio
+STATIC_TYPES = ("Script", "Stylesheet")
+
+# Patterns a page kind still needs to render its text sections
+PAGE_KIND_ALLOW: Dict[str, List[str]] = {
+    PROFILE: [],
+    COMPANY: [],
+    # Sales Navigator draws its "Show more" and section toggles from SVG sprites
+    SALES_LEAD: ["*static.licdn.com/aero-v1/sc/h/*.svg"],
+    SALES_COMPANY: ["*static.licdn.com/aero-v1/sc/h/*.svg"],
+}
+
+
+def page_kind(url: str) -> str:
+    return classify_url(url).kind
+
+
+def blocked_patterns(kind: str, types=BLOCKED_TYPES) -> List[str]:
+    allowed = set(PAGE_KIND_ALLOW.get(kind, []))
+    return [pattern for t in types for pattern in BLOCKED_PATTERNS[t] if pattern not in allowed]
+
+
+class ResourceBlocker:
+    """Applies the load profile per tab and reports bytes and cache hits per page.
+
+    With block=False pages are only measured.
+    """
+
+    def __init__(self, block: bool = True, types=BLOCKED_TYPES):
+        self.block = block
+        self.measure = True
+        self.types = types
+        self._applied: Dict[str, Optional[tuple]] = {}
+        self._baseline: Dict[str, int] = {}
+        self._kind: Optional[str] = None
+        self.pages = 0
+        self.bytes_loaded = 0
+        self.bytes_saved = 0
+        self.requests_blocked = 0
+        self.static_requests = 0
+        self.static_cached = 0
+
+    def before_load(self, driver, url: str):
+        """Set the blocked URL list for url's page kind on the current tab."""
+        if not self.measure and not self.block:
+            return
+        kind = page_kind(url)
+        self._kind = kind
+        self._drain(driver)
+        if not self.block:
+            return
+        # The first page of a kind loads unblocked to measure the baseline
+        patterns = tuple(blocked_patterns(kind, self.types)) if kind in self._baseline or kind == UNKNOWN else ()
+        try:
+            handle = driver.current_window_handle
+            if self._applied.get(handle) != patterns:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+                self._applied[handle] = patterns
+        except Exception as e:
+            print(f"   ⚠️ Resource blocking unavailable: {e}")
+            self.block = False
+
+    def after_load(self, driver):
+        """Count the bytes and cache hits of the page just loaded and print them."""
+        if self._kind is None:
+            return
+        kind, self._kind = self._kind, None
+        page = self._drain(driver)
+        if page is None:
+            return
+        self.pages += 1
+        self.bytes_loaded += page["loaded"]
+        self.requests_blocked += page["blocked"]
+        self.static_requests += page["static"]
+        self.static_cached += page["static_cached"]
+        cache = f"static cache {page['static_cached']}/{page['static']}"
+        if not self.block:
+            print(f"   📦 {page['loaded'] / 1024:.0f} KB loaded, {cache}")
+        elif kind not in self._baseline:
+            self._baseline[kind] = page["loaded"]
+            print(f"   📦 {page['loaded'] / 1024:.0f} KB loaded (unblocked {kind} baseline), {cache}")
+        else:
+            saved = max(self._baseline[kind] - page["loaded"], 0)
+            self.bytes_saved += saved
+            print(f"   📦 {page['loaded'] / 1024:.0f} KB loaded, {page['blocked']} requests blocked, "
+                  f"~{saved / 1024:.0f} KB saved, {cache}")
+
+    def _drain(self, driver) -> Optional[dict]:
+        """Read and clear the performance log; None when the log is unavailable."""
+        if not self.measure:
+            return None
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            self.measure = False
+            return None
+        loaded = blocked = static = static_cached = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            if method == "Network.loadingFinished":
+                loaded += message["params"].get("encodedDataLength", 0)
+            elif method == "Network.loadingFailed" and message["params"].get("blockedReason"):
+                blocked += 1
+            elif method == "Network.responseReceived" and message["params"].get("type") in STATIC_TYPES:
+                static += 1
+                if message["params"].get("response", {}).get("fromDiskCache"):
+                    static_cached += 1
+        return {"loaded": int(loaded), "blocked": blocked, "static": static, "static_cached": static_cached}
+
+    def cache_hit_ratio(self) -> float:
+        return self.static_cached / self.static_requests if self.static_requests else 0.0
+
+    def summary(self) -> str:
+        if not self.pages:
+            return "Page loads: no pages measured"
+        return (f"Page loads: {self.pages} pages, {self.bytes_loaded / 1e6:.1f} MB loaded, "
+                f"{self.requests_blocked} requests blocked, ~{self.bytes_saved / 1e6:.1f} MB saved, "
+                f"JS/CSS disk cache hits {self.static_cached}/{self.static_requests} ({self.cache_hit_ratio():.0%})")
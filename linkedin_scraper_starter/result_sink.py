@@ -0,0 +1,329 @@
+"""
+Streaming, crash-safe result sinks.
+
+Every completed record is appended to durable storage as soon as it is
+produced, instead of being collected in a list and written to Excel after the
+last URL. The JSONL sink is a plain append log; the SQLite sink is an
+indexed store that upserts by canonical profile URL. Writes are buffered and
+flushed (with fsync) every FLUSH_EVERY records or FSYNC_INTERVAL seconds,
+whichever comes first, so a crash, Ctrl-C or driver death loses at most one
+small batch. Excel/CSV is an export step:
+
+    python result_sink.py export results.jsonl result.xlsx
+    python result_sink.py export output_results.sqlite output.csv
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Set
+
+from url_utils import canonical_profile_url
+
+FLUSH_EVERY = 10
+FSYNC_INTERVAL = 5.0
+
+
+class JsonlSink:
+    """Append-only JSON Lines sink."""
+
+    def __init__(self, path: str, flush_every: int = FLUSH_EVERY, fsync_interval: float = FSYNC_INTERVAL):
+        self.path = path
+        self.flush_every = flush_every
+        self.fsync_interval = fsync_interval
+        self.written = 0
+        self._buffer = []
+        self._last_flush = time.time()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, record: Dict):
+        self._buffer.append(json.dumps(record, ensure_ascii=False, default=str))
+        self.written += 1
+        if len(self._buffer) >= self.flush_every or time.time() - self._last_flush >= self.fsync_interval:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._buffer = []
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_flush = time.time()
+
+    def close(self):
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SqliteSink:
+    """Indexed SQLite store (WAL mode), one row per canonical profile URL.
+
+    Writing a profile that is already stored updates it in place (upsert), so
+    appending a batch costs O(batch) regardless of how much history the file
+    holds. A failed re-scrape never overwrites an earlier successful record.
+    Rows are committed in small batches.
+    """
+
+    def __init__(self, path: str, flush_every: int = FLUSH_EVERY, fsync_interval: float = FSYNC_INTERVAL):
+        self.path = path
+        self.flush_every = flush_every
+        self.fsync_interval = fsync_interval
+        self.written = 0
+        self._pending = 0
+        self._last_flush = time.time()
+        # Pipeline workers write from their own threads (serialised by a lock)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                canonical_url TEXT UNIQUE,
+                profile_url TEXT,
+                company_url TEXT,
+                ok INTEGER,
+                scraped_at REAL,
+                data TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_profile_url ON results(profile_url)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_company_url ON results(company_url)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_scraped_at ON results(scraped_at)")
+        self._conn.commit()
+
+    def write(self, record: Dict):
+        url = record_url(record)
+        self._conn.execute(
+            "INSERT INTO results (canonical_url, profile_url, company_url, ok, scraped_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(canonical_url) DO UPDATE SET "
+            "profile_url = excluded.profile_url, company_url = excluded.company_url, ok = excluded.ok, "
+            "scraped_at = excluded.scraped_at, data = excluded.data "
+            "WHERE excluded.ok >= results.ok",
+            (
+                canonical_profile_url(url) if url else None,
+                url,
+                record.get("Company Url") or record.get("company_url") or "",
+                1 if is_successful(record) else 0,
+                time.time(),
+                json.dumps(record, ensure_ascii=False, default=str)
+            )
+        )
+        self.written += 1
+        self._pending += 1
+        if self._pending >= self.flush_every or time.time() - self._last_flush >= self.fsync_interval:
+            self.flush()
+
+    def flush(self):
+        self._conn.commit()
+        self._pending = 0
+        self._last_flush = time.time()
+
+    def close(self):
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def record_url(record: Dict) -> str:
+    """Profile URL of a record, whichever script's column naming it uses."""
+    return record.get("Profile Url") or record.get("profile_url") or ""
+
+
+def is_sqlite_path(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in (".sqlite", ".sqlite3", ".db")
+
+
+def open_sink(path: str, **kwargs):
+    """Open the sink that matches the file extension (.jsonl or .sqlite/.db)."""
+    if is_sqlite_path(path):
+        return SqliteSink(path, **kwargs)
+    return JsonlSink(path, **kwargs)
+
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """Stream records back out of a sink file without loading it all."""
+    if not os.path.exists(path):
+        return
+    if is_sqlite_path(path):
+        conn = sqlite3.connect(path)
+        try:
+            for (data,) in conn.execute("SELECT data FROM results ORDER BY id"):
+                yield json.loads(data)
+        finally:
+            conn.close()
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # A torn last line from a hard crash; everything before it is intact
+                continue
+
+
+def iter_latest_records(path: str) -> Iterator[Dict]:
+    """One record per canonical profile URL, the one SqliteSink's upsert would keep.
+
+    The JSONL log holds every attempt, so a profile that failed and was
+    re-scraped appears more than once. The latest record wins unless it is a
+    failure replacing a success. Two streaming passes: the first remembers
+    the winning line of each URL, the second yields those lines in file order.
+    Records without a URL are all kept. A SQLite store is already one row per
+    URL and is read as is.
+    """
+    if is_sqlite_path(path):
+        yield from iter_records(path)
+        return
+    winners = {}
+    for index, record in enumerate(iter_records(path)):
+        url = record_url(record)
+        if not url:
+            continue
+        key = canonical_profile_url(url)
+        ok = is_successful(record)
+        if key not in winners or ok or not winners[key][1]:
+            winners[key] = (index, ok)
+    keep = {index for index, _ in winners.values()}
+    for index, record in enumerate(iter_records(path)):
+        if index in keep or not record_url(record):
+            yield record
+
+
+def is_successful(record: Dict) -> bool:
+    """True for a record with data; False for errors and empty extractions."""
+    if record.get("error"):
+        return False
+    name = record.get("Full Name") or record.get("name") or ""
+    return bool(name) and not str(name).startswith("ERROR:")
+
+
+def completed_profile_urls(path: str) -> Set[str]:
+    """Canonical URLs that already have a successful record in the store.
+
+    One streaming pass builds a hash set, so membership checks stay O(1) for
+    lists of hundreds of thousands of URLs. A later success wins over an
+    earlier failure; errored or empty records are left out so they re-queue.
+    """
+    if is_sqlite_path(path):
+        if not os.path.exists(path):
+            return set()
+        conn = sqlite3.connect(path)
+        try:
+            return {row[0] for row in conn.execute("SELECT canonical_url FROM results WHERE ok = 1 AND canonical_url IS NOT NULL")}
+        finally:
+            conn.close()
+
+    completed = set()
+    for record in iter_records(path):
+        url = record_url(record)
+        if url and is_successful(record):
+            completed.add(canonical_profile_url(url))
+    return completed
+
+
+def export_to_excel(path: str, output_file: str, columns: Optional[List[str]] = None) -> int:
+    """Write the sink's records to an xlsx file, streaming row by row.
+
+    One row per profile (see iter_latest_records). Columns default to the
+    union of record keys in first-seen order. Returns the number of rows written.
+    """
+    from openpyxl import Workbook
+
+    if columns is None:
+        columns = record_columns(path)
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(columns)
+    rows = 0
+    for record in iter_latest_records(path):
+        sheet.append([_cell(record.get(col, "")) for col in columns])
+        rows += 1
+    workbook.save(output_file)
+    return rows
+
+
+def export_to_csv(path: str, output_file: str, columns: Optional[List[str]] = None) -> int:
+    """Write the sink's records to a CSV file, one row per profile, streaming row by row."""
+    import csv
+
+    if columns is None:
+        columns = record_columns(path)
+    rows = 0
+    with open(output_file, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for record in iter_latest_records(path):
+            writer.writerow([_cell(record.get(col, "")) for col in columns])
+            rows += 1
+    return rows
+
+
+def export_results(path: str, output_file: str, columns: Optional[List[str]] = None) -> int:
+    """Export to .csv or .xlsx depending on the output file extension."""
+    if output_file.lower().endswith(".csv"):
+        return export_to_csv(path, output_file, columns)
+    return export_to_excel(path, output_file, columns)
+
+
+def record_columns(path: str) -> List[str]:
+    """Union of record keys in first-seen order."""
+    columns = []
+    seen = set()
+    for record in iter_records(path):
+        for key in record:
+            if key not in seen:
+                seen.add(key)
+                columns.append(key)
+    return columns
+
+
+def _cell(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def import_excel(xlsx_path: str, sink) -> int:
+    """Seed a sink with the rows of an existing xlsx export (read-only, streamed)."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(xlsx_path, read_only=True)
+    rows = workbook.active.iter_rows(values_only=True)
+    header = next(rows, None)
+    count = 0
+    if header:
+        for row in rows:
+            sink.write({h: ("" if v is None else v) for h, v in zip(header, row) if h is not None})
+            count += 1
+    workbook.close()
+    return count
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != "export":
+        print("Usage: python result_sink.py export <results.jsonl|results.sqlite> <output.xlsx|output.csv>")
+        sys.exit(1)
+    exported = export_results(sys.argv[2], sys.argv[3])
+    print(f"✅ Exported {exported} records to {sys.argv[3]}")
@@ -0,0 +1,178 @@
+"""
+Per-phase timing spans for profile visits.
+
+Each visit is split into named spans (navigation, readiness wait, settle waits,
+each extractor, the company hop, the sink write). A span records its wall time
+and how many selector misses the driver saw while it was open, counted by the
+ProbeDriver proxy from selector_probe. Spans nest: the settle waits inside an
+extractor also count towards that extractor, and every span names its parent.
+
+One JSON line per span is appended to the trace file, tagged with the run and
+the profile URL; print_summary() reports p50/p95/p99 per phase at the end.
+
+    python run_trace.py trace.jsonl          # summary of the last run in a trace file
+    python run_trace.py trace.jsonl --all    # every run in the file
+"""
+
+import functools
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from selector_probe import ProbeDriver, ProbeStats
+
+PERCENTILES = (50, 95, 99)
+
+
+class RunTrace:
+    """Collects spans for one run; writes them to path (JSONL) when given.
+
+    Safe to use from the pipeline workers: the current profile and span stack
+    are per thread, and file writes are serialised.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.run = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self._file = open(path, "a", encoding="utf-8") if path else None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._durations: Dict[str, List[float]] = {}
+        self._misses: Dict[str, int] = {}
+
+    @contextmanager
+    def profile(self, url: str, driver=None, phase: str = "profile"):
+        """Open a profile context; yields driver wrapped so selector misses are counted."""
+        local = self._local
+        previous = (getattr(local, "url", None), getattr(local, "stats", None), getattr(local, "stack", None))
+        local.url, local.stats, local.stack = url, ProbeStats(), []
+        try:
+            with self.span(phase):
+                yield ProbeDriver(driver, local.stats) if driver is not None else None
+        finally:
+            local.url, local.stats, local.stack = previous
+
+    @contextmanager
+    def span(self, phase: str):
+        """Time the enclosed block as phase, within the current profile (if any)."""
+        local = self._local
+        stack = getattr(local, "stack", None)
+        if stack is None:
+            stack = local.stack = []
+        stats = getattr(local, "stats", None)
+        misses_before = stats.misses if stats else 0
+        parent = stack[-1] if stack else None
+        stack.append(phase)
+        started = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            stack.pop()
+            misses = (stats.misses if stats else 0) - misses_before
+            self._record({
+                "run": self.run,
+                "url": getattr(local, "url", None),
+                "phase": phase,
+                "parent": parent,
+                "start": round(started, 3),
+                "seconds": round(seconds, 4),
+                "misses": misses,
+                "error": error,
+            })
+
+    def traced(self, phase: str):
+        """Decorator form of span()."""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(phase):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def _record(self, span: dict):
+        with self._lock:
+            self._durations.setdefault(span["phase"], []).append(span["seconds"])
+            self._misses[span["phase"]] = self._misses.get(span["phase"], 0) + span["misses"]
+            if self._file:
+                self._file.write(json.dumps(span) + "\n")
+                self._file.flush()
+
+    def summary(self) -> Dict[str, dict]:
+        with self._lock:
+            return summarize(self._durations, self._misses)
+
+    def print_summary(self):
+        print_summary(self.summary())
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(durations: Dict[str, List[float]], misses: Dict[str, int]) -> Dict[str, dict]:
+    """Per phase: count, total seconds, p50/p95/p99 and selector misses."""
+    result = {}
+    for phase, values in durations.items():
+        values = sorted(values)
+        row = {"count": len(values), "total": sum(values), "misses": misses.get(phase, 0)}
+        for pct in PERCENTILES:
+            row[f"p{pct}"] = percentile(values, pct)
+        result[phase] = row
+    return result
+
+
+def print_summary(summary: Dict[str, dict]):
+    if not summary:
+        print("⏱️ No spans recorded.")
+        return
+    print("\n⏱️ Time per phase (seconds)")
+    print(f"   {'phase':<16}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'total':>10}{'misses':>8}")
+    for phase, row in sorted(summary.items(), key=lambda item: -item[1]["total"]):
+        print(f"   {phase:<16}{row['count']:>7}{row['p50']:>9.2f}{row['p95']:>9.2f}"
+              f"{row['p99']:>9.2f}{row['total']:>10.1f}{row['misses']:>8}")
+
+
+def load_trace(path: str, all_runs: bool = False) -> Dict[str, dict]:
+    """Summary of the last run (or all runs) recorded in a trace file."""
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                spans.append(json.loads(line))
+    if spans and not all_runs:
+        last_run = spans[-1]["run"]
+        spans = [s for s in spans if s["run"] == last_run]
+
+    durations, misses = {}, {}
+    for span in spans:
+        durations.setdefault(span["phase"], []).append(span["seconds"])
+        misses[span["phase"]] = misses.get(span["phase"], 0) + span.get("misses", 0)
+    return summarize(durations, misses)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python run_trace.py <trace.jsonl> [--all]")
+        sys.exit(1)
+    print_summary(load_trace(sys.argv[1], all_runs="--all" in sys.argv[2:]))
@@ -1,17 +1,27 @@
 import time
 import random
 import sys
+import argparse
+import itertools
 from typing import List, Dict
-import pandas as pd
 import os
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.common.exceptions import TimeoutException
+
+from driver_launch import launch_driver
+from chrome_profile import ChromeProfile
+from session import has_session, is_login_page
+from snapshot_extract import take_snapshot, extract_top_card_snapshot, extract_experience_snapshot
+from selector_probe import wait_for_profile_ready, run_with_probing
+from dom_wait import wait_for_dom_settled
+from url_input import iter_profile_urls, InputStats
+from snapshot_archive import open_archive, archive_page
+from result_sink import open_sink, export_results, completed_profile_urls, import_excel
 
 # ---------------------------
 # Guardrails & configuration
@@ -20,6 +30,21 @@ MIN_DELAY_SECONDS = 20  # Increased for contact info extraction
 MAX_DELAY_SECONDS = 40
 PAGE_LOAD_TIMEOUT = 30
 IMPLICIT_WAIT = 4
+# "live" runs every selector through WebDriver; "snapshot" parses one page_source with lxml
+EXTRACTION_MODE = "live"
+# Run selectors with implicit wait 0 behind one explicit "profile rendered" wait
+PROBE_MODE = False
+# Indexed SQLite store; each record is upserted by canonical profile URL as soon
+# as it is scraped. output.xlsx / .csv are produced from it with --export.
+RESULTS_PATH = "output_results.sqlite"
+OUTPUT_FILE = "output.xlsx"
+# Set to e.g. "snapshots.pack" to keep a compressed copy of every visited page
+SNAPSHOT_ARCHIVE_PATH = None
+# URL list: .csv (url column), .jsonl, .txt or .xlsx; read as a stream
+INPUT_PATH = "profiles.csv"
+
+snapshot_archive = open_archive(SNAPSHOT_ARCHIVE_PATH)
+chrome_profile = ChromeProfile()
 
 def human_delay():
     """Random delay to mimic human behavior."""
@@ -28,77 +53,15 @@ def human_delay():
     time.sleep(delay)
 
 def init_driver() -> webdriver.Chrome:
-    """Initialize Chrome with fallback options."""
-    chrome_options = Options()
-    
-    # Basic options that usually work
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    
-    # Try different approaches in order of preference
-    approaches = [
-        # # Approach 1: Use existing profile (if Chrome is closed)
-        # {
-        #     "name": "existing profile",
-        #     "options": [
-        #         r"--user-data-dir=C:\Users\Harsh\AppData\Local\Google\Chrome\User Data",
-        #         r"--profile-directory=Profile 1"
-        #     ]
-        # },
-        # Approach 2: Create temporary profile
-        {
-            "name": "temporary profile", 
-            "options": [
-                f"--user-data-dir={os.getcwd()}\\temp_chrome_profile",
-                "--profile-directory=Default"
-            ]
-        },
-        # Approach 3: Default (no profile)
-        {
-            "name": "default",
-            "options": []
-        }
-    ]
-    
-    for approach in approaches:
-        try:
-            print(f"Trying to start Chrome with {approach['name']}...")
-            
-            # Create fresh options for each attempt
-            options = Options()
-            options.add_argument("--start-maximized")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            
-            # Add approach-specific options
-            for arg in approach["options"]:
-                options.add_argument(arg)
-            
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-            driver.implicitly_wait(IMPLICIT_WAIT)
-            
-            # Test if driver works
-            driver.get("https://www.google.com")
-            print(f"✅ Successfully started Chrome with {approach['name']}")
-            return driver
-            
-        except WebDriverException as e:
-            print(f"❌ Failed with {approach['name']}: {str(e)[:100]}...")
-            if 'driver' in locals():
-                try:
-                    driver.quit()
-                except:
-                    pass
-            continue
-    
+    """Start Chrome, trying the launch approach that last worked on this host first."""
+    driver = launch_driver(PAGE_LOAD_TIMEOUT, IMPLICIT_WAIT, user_data_dir=chrome_profile.materialize())
+    if driver is not None:
+        restored = chrome_profile.restore_cookies(driver)
+        if restored:
+            print(f"Restored {restored} saved session cookies")
+        return driver
+
+    chrome_profile.cleanup()
     # If all approaches fail
     print("❌ All Chrome startup approaches failed. Please try:")
     print("1. Close all Chrome windows completely")
@@ -124,6 +87,8 @@ def wait_for_manual_login(driver):
     print("3. Come back here and press ENTER when ready")
     print("="*60)
     input("Press ENTER after you've logged in to LinkedIn... ")
+    # Persist the new session now, so it survives a crash before the run ends
+    chrome_profile.save_cookies(driver)
     print("Continuing with profile scraping...\n")
 
 def extract_contact_info(driver) -> Dict[str, str]:
@@ -152,7 +117,7 @@ def extract_contact_info(driver) -> Dict[str, str]:
                 contact_button = driver.find_element(By.CSS_SELECTOR, selector)
                 if contact_button.is_displayed():
                     driver.execute_script("arguments[0].click();", contact_button)
-                    time.sleep(2)  # Wait for contact info to load
+                    wait_for_dom_settled(driver, "#artdeco-modal-outlet", cap_seconds=2)  # Wait for contact info to load
                     contact_clicked = True
                     break
             except:
@@ -241,7 +206,7 @@ def extract_contact_info(driver) -> Dict[str, str]:
                     close_btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if close_btn.is_displayed():
                         close_btn.click()
-                        time.sleep(1)
+                        wait_for_dom_settled(driver, "#artdeco-modal-outlet", cap_seconds=1)
                         break
                 except:
                     continue
@@ -346,39 +311,64 @@ def extract_experience(driver) -> List[str]:
         pass
     return experiences
 
+def extract_profile(driver) -> Dict[str, str]:
+    """Extract top card, contact info and experience from the loaded profile."""
+    # Extract profile data
+    if EXTRACTION_MODE == "snapshot":
+        tree = take_snapshot(driver)
+        profile = extract_top_card_snapshot(tree, driver.current_url)
+    else:
+        profile = extract_top_card(driver)
+    
+    # Extract contact information
+    print("   📞 Extracting contact info...")
+    contact_info = extract_contact_info(driver)
+    profile.update(contact_info)
+    
+    # Extract experience
+    if EXTRACTION_MODE == "snapshot":
+        experiences = extract_experience_snapshot(tree)
+    else:
+        experiences = extract_experience(driver)
+    if experiences:
+        profile["experience"] = "; ".join(experiences)
+    else:
+        profile["experience"] = ""
+
+    return profile
+
 def visit_profile(driver, url: str) -> Dict[str, str]:
     """Visit a LinkedIn profile and extract data."""
     print(f"🔍 Visiting: {url}")
     
     try:
         driver.get(url)
+        if is_login_page(driver):
+            print("⚠️ Session expired; a manual login is needed")
+            wait_for_manual_login(driver)
+            driver.get(url)
         WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.TAG_NAME, "main"))
         )
         
-        # Small delay to let page fully load
-        time.sleep(3)
+        # Wait for the page to stop rendering (capped at the old 3s sleep)
+        wait_for_dom_settled(driver, "main", cap_seconds=3)
         
     except TimeoutException:
         print("⚠️  Page load timeout; continuing with extraction...")
     except Exception as e:
         print(f"⚠️  Error loading page: {e}")
         return {"error": str(e), "profile_url": url}
+    archive_page(snapshot_archive, driver, url)
 
-    # Extract profile data
-    profile = extract_top_card(driver)
-    
-    # Extract contact information
-    print("   📞 Extracting contact info...")
-    contact_info = extract_contact_info(driver)
-    profile.update(contact_info)
-    
-    # Extract experience
-    experiences = extract_experience(driver)
-    if experiences:
-        profile["experience"] = "; ".join(experiences)
+    if PROBE_MODE:
+        wait_for_profile_ready(driver)
+        profile, _ = run_with_probing(driver, extract_profile, IMPLICIT_WAIT)
     else:
-        profile["experience"] = ""
+        profile = extract_profile(driver)
+    # Keyed by the input URL (the resume key) even when LinkedIn redirected
+    profile["landed_url"] = profile["profile_url"]
+    profile["profile_url"] = url
 
     print(f"✅ Extracted: {profile['name']} - {profile['headline'][:50]}...")
     if profile['email']:
@@ -388,80 +378,106 @@ def visit_profile(driver, url: str) -> Dict[str, str]:
     
     return profile
 
+def parse_args():
+    """Command-line options."""
+    parser = argparse.ArgumentParser(description="LinkedIn profile scraper")
+    parser.add_argument("--input", default=INPUT_PATH,
+                        help=f"URL list (.csv, .jsonl, .txt or .xlsx; default {INPUT_PATH})")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip URLs that already have a successful record in the result store")
+    parser.add_argument("--export", nargs="?", const=OUTPUT_FILE, metavar="FILE",
+                        help=f"export the result store to FILE (.xlsx or .csv, default {OUTPUT_FILE}) and exit")
+    return parser.parse_args()
+
 def main():
     """Main function to run the scraper."""
+    args = parse_args()
+
+    if args.export:
+        total = export_results(RESULTS_PATH, args.export)
+        print(f"✅ Exported {total} profiles from {RESULTS_PATH} to {args.export}")
+        return
+
     print("🚀 LinkedIn Profile Scraper Starting...")
     
-    # Load URLs from CSV
+    # Resume: URLs that already have a good record are skipped as they stream in
+    completed = completed_profile_urls(RESULTS_PATH) if args.resume else None
+
+    # Stream URLs from the input file; nothing is loaded up front
+    stats = InputStats()
     try:
-        df = pd.read_csv("profiles.csv")
-        urls = [u for u in df["url"].dropna().tolist() 
-               if isinstance(u, str) and u.strip().startswith("http")]
+        urls = iter_profile_urls(args.input, skip=completed, stats=stats)
+        first_url = next(urls, None)
     except FileNotFoundError:
-        print("❌ profiles.csv not found. Please create it with a 'url' column.")
+        print(f"❌ {args.input} not found. Please create it with a 'url' column.")
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Error reading profiles.csv: {e}")
+        print(f"❌ Error reading {args.input}: {e}")
         sys.exit(1)
 
-    if not urls:
-        print("❌ No valid URLs found in profiles.csv. Exiting.")
+    if first_url is None:
+        if stats.resumed:
+            print(f"✅ Nothing left to scrape ({stats.resumed} already scraped).")
+            return
+        print(f"❌ No valid URLs found in {args.input}. Exiting.")
         sys.exit(1)
-    
-    print(f"📋 Found {len(urls)} profiles to scrape")
 
     # Initialize driver
     driver = init_driver()
     
     try:
-        # Navigate to LinkedIn
-        print("🌐 Opening LinkedIn...")
-        driver.get("https://www.linkedin.com/")
-        
-        # Wait for manual login
-        wait_for_manual_login(driver)
-
-        results = []
-        for i, url in enumerate(urls, 1):
-            print(f"\n📊 Processing profile {i}/{len(urls)}")
-            
-            try:
-                profile = visit_profile(driver, url.strip())
-                results.append(profile)
-            except Exception as e:
-                print(f"❌ Error processing {url}: {e}")
-                results.append({"error": str(e), "profile_url": url})
-
-            # Rate limiting between profiles
-            if i < len(urls):
-                print(f"⏳ Rate limiting...")
-                human_delay()
-
-        # Save results
-        print(f"\n💾 Saving results...")
-        # out_df = pd.DataFrame(results)
-        # output_file = "output.xlsx"
-        # out_df.to_excel(output_file, index=False)
-        output_file = "output.xlsx"
-        out_df = pd.DataFrame(results)
-
-        # If output.xlsx already exists, append new results
-        if os.path.exists(output_file):
-            old_df = pd.read_excel(output_file)
-            final_df = pd.concat([old_df, out_df], ignore_index=True)
+        # Reuse the session stored in the Chrome profile; log in manually only without one
+        if has_session(driver):
+            print("✅ Reusing the stored LinkedIn session")
         else:
-            final_df = out_df
+            print("🌐 Opening LinkedIn...")
+            driver.get("https://www.linkedin.com/")
+            wait_for_manual_login(driver)
+
+        output_file = OUTPUT_FILE
+        is_new_store = not os.path.exists(RESULTS_PATH)
+        sink = open_sink(RESULTS_PATH)
+        try:
+            # First run with a sink: carry the rows already in output.xlsx over
+            if is_new_store and os.path.exists(output_file):
+                imported = import_excel(output_file, sink)
+                print(f"📥 Imported {imported} existing rows from {output_file}")
+
+            successful = 0
+            processed = 0
+            for i, url in enumerate(itertools.chain([first_url], urls), 1):
+                # Rate limiting between profiles
+                if i > 1:
+                    print(f"⏳ Rate limiting...")
+                    human_delay()
+
+                print(f"\n📊 Processing profile {i}")
+                processed = i
+                try:
+                    profile = visit_profile(driver, url.strip())
+                except Exception as e:
+                    print(f"❌ Error processing {url}: {e}")
+                    profile = {"error": str(e), "profile_url": url}
+                sink.write(profile)
+                if "error" not in profile:
+                    successful += 1
+        finally:
+            sink.close()
 
-        final_df.to_excel(output_file, index=False)
-        print(f"✅ Saved {len(final_df)} total profiles to {output_file}")
+        print(f"\n💾 Saved {sink.written} records to {RESULTS_PATH}")
+        print(f"   Run 'python scraper.py --export' to write {output_file}")
         
         # Show summary
-        successful = len([r for r in results if "error" not in r])
-        print(f"\n📈 Summary: {successful}/{len(urls)} profiles scraped successfully")
+        print(f"\n📋 Input: {stats.summary()}")
+        print(f"📈 Summary: {successful}/{processed} profiles scraped successfully")
 
     finally:
         print("🔄 Closing browser...")
+        chrome_profile.save_cookies(driver)
         driver.quit()
+        chrome_profile.cleanup()
+        if snapshot_archive:
+            snapshot_archive.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
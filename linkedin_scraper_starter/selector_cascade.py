@@ -0,0 +1,186 @@
+"""
+Adaptive selector cascades.
+
+The extractors try fallback lists such as name_selectors or website_selectors
+until one matches, and with live WebDriver lookups every miss costs a round
+trip (or an implicit wait). CascadeStats keeps hit/try counts per selector,
+persists them between runs, and hands each cascade back in a learned order.
+
+The lists are first-match and written from specific to generic, so learning
+must not change which element wins. Only selectors of equal CSS specificity
+swap places, each within the positions of the written list they already
+hold. Generic selectors (no id, class or attribute, e.g. a bare "h1") keep
+their written place. Within those limits:
+
+- selectors that historically win are tried first (Laplace-smoothed hit rate,
+  so unseen selectors keep their written order against each other)
+- selectors that have not matched in their last demote_after tries (each
+  run of the cascade that reaches them counts, so a per-entry cascade can use
+  up several on one page) are moved behind their equals; they are still tried, so a layout change only costs the old
+  fallback order
+
+Cascade names carry the page kind (e.g. "company.name" and
+"sales_company.name"), so one platform's hits never reorder the other's list.
+
+    for selector in selector_stats.cascade("linkedin.name", name_selectors):
+        ...
+        if full_name:
+            selector_stats.hit("linkedin.name", selector)
+            break
+
+    python selector_cascade.py selector_stats.json    # hit-rate report, dead fallbacks flagged
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Consecutive tries without a match, not pages: a cascade that runs once per
+# experience entry is tried several times on one profile
+DEMOTE_AFTER_TRIES = 25
+
+_QUOTED = re.compile(r"'[^']*'|\"[^\"]*\"")
+_ATTRIBUTE = re.compile(r"\[[^\]]*\]")
+_ID = re.compile(r"#[\w-]+")
+_CLASS = re.compile(r"\.[\w-]+")
+_PSEUDO_ELEMENT = re.compile(r"::[\w-]+")
+_PSEUDO_CLASS = re.compile(r":(?!not\()[\w-]+")
+_TYPE = re.compile(r"(?:^|[\s>+~(,])([a-zA-Z][\w-]*)")
+
+
+def specificity(selector: str) -> Tuple[int, int, int]:
+    """CSS specificity (ids, classes/attributes/pseudo-classes, types) of selector."""
+    rest = _QUOTED.sub("", selector)
+    rest, attributes = _ATTRIBUTE.subn("", rest)
+    rest, ids = _ID.subn("", rest)
+    rest, classes = _CLASS.subn("", rest)
+    rest, pseudo_elements = _PSEUDO_ELEMENT.subn("", rest)
+    rest, pseudo_classes = _PSEUDO_CLASS.subn("", rest)
+    return ids, classes + attributes + pseudo_classes, len(_TYPE.findall(rest)) + pseudo_elements
+
+
+def is_generic(selector: str) -> bool:
+    """True for type-only selectors such as "h1" or "main p", which match almost any page."""
+    ids, classes, _ = specificity(selector)
+    return not ids and not classes
+
+
+class CascadeStats:
+    """Per-cascade, per-selector tries and hits, stored as JSON at path."""
+
+    def __init__(self, path: Optional[str] = None, demote_after: int = DEMOTE_AFTER_TRIES):
+        self.path = path
+        self.demote_after = demote_after
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, dict]] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self._stats = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable selector stats {path}: {e}")
+
+    def _entry(self, name: str, selector: str) -> dict:
+        return self._stats.setdefault(name, {}).setdefault(selector, {"tries": 0, "hits": 0, "since_hit": 0})
+
+    def is_demoted(self, entry: Optional[dict]) -> bool:
+        return bool(entry) and entry["since_hit"] >= self.demote_after
+
+    def rank(self, name: str, selectors: List[str]) -> List[str]:
+        """selectors in the order to try them for cascade name."""
+        with self._lock:
+            known = self._stats.get(name, {})
+
+            def key(item):
+                index, selector = item
+                entry = known.get(selector)
+                if not entry:
+                    return (False, -0.5, index)
+                rate = (entry["hits"] + 1) / (entry["tries"] + 2)
+                return (self.is_demoted(entry), -rate, index)
+
+            ranked = list(selectors)
+            groups: Dict[tuple, List[int]] = {}
+            for index, selector in enumerate(selectors):
+                if not is_generic(selector):
+                    groups.setdefault(specificity(selector), []).append(index)
+            # Equals trade places among the positions they hold; everything else stays put
+            for positions in groups.values():
+                learned = sorted(((index, selectors[index]) for index in positions), key=key)
+                for position, (_, selector) in zip(positions, learned):
+                    ranked[position] = selector
+            return ranked
+
+    def cascade(self, name: str, selectors: List[str]) -> Iterator[str]:
+        """Yield selectors in learned order, counting each one that is tried."""
+        for selector in self.rank(name, selectors):
+            with self._lock:
+                entry = self._entry(name, selector)
+                entry["tries"] += 1
+                entry["since_hit"] += 1
+            yield selector
+
+    def hit(self, name: str, selector: str):
+        """Record that selector produced the value for cascade name."""
+        with self._lock:
+            entry = self._entry(name, selector)
+            entry["hits"] += 1
+            entry["since_hit"] = 0
+
+    def report(self) -> List[dict]:
+        """One row per selector: cascade, selector, tries, hits, hit_rate, demoted, dead."""
+        rows = []
+        with self._lock:
+            for name in sorted(self._stats):
+                for selector in self._report_order(name):
+                    entry = self._stats[name][selector]
+                    rows.append({
+                        "cascade": name,
+                        "selector": selector,
+                        "tries": entry["tries"],
+                        "hits": entry["hits"],
+                        "hit_rate": entry["hits"] / entry["tries"] if entry["tries"] else 0.0,
+                        "demoted": self.is_demoted(entry),
+                        "dead": entry["hits"] == 0 and entry["tries"] >= self.demote_after,
+                    })
+        return rows
+
+    def _report_order(self, name: str) -> List[str]:
+        entries = self._stats[name]
+        return sorted(entries, key=lambda s: (self.is_demoted(entries[s]), -entries[s]["hits"], s))
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self._stats, indent=1, sort_keys=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+
+def print_report(rows: List[dict]):
+    if not rows:
+        print("No selector stats recorded yet.")
+        return
+    current = None
+    for row in rows:
+        if row["cascade"] != current:
+            current = row["cascade"]
+            print(f"\n{current}")
+        flag = "  dead" if row["dead"] else ("  demoted" if row["demoted"] else "")
+        print(f"   {row['hits']:>6}/{row['tries']:<6} {row['hit_rate']:>6.1%}  {row['selector']}{flag}")
+    dead = sum(1 for row in rows if row["dead"])
+    print(f"\n{dead} of {len(rows)} selectors are dead weight (never matched)")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python selector_cascade.py <selector_stats.json>")
+        sys.exit(1)
+    print_report(CascadeStats(sys.argv[1]).report())
@@ -0,0 +1,136 @@
+"""
+Zero-implicit-wait selector probing.
+
+With driver.implicitly_wait(N) every selector miss in a fallback cascade blocks
+for N seconds before the `except: continue`. Probing mode waits once, explicitly,
+for the profile to render, then runs every selector with implicit wait 0 and
+reports how much waiting the misses would have cost under the old behaviour.
+"""
+
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+# One marker per layout that only exists once the top card has rendered
+PROFILE_READY_SELECTORS = {
+    False: "main h1, div.text-heading-xlarge",
+    True: "#profile-card-section h1, [data-anonymize='person-name'], .profile-topcard-person__name"
+}
+READY_TIMEOUT = 15
+
+
+class ProbeStats:
+    """Selector lookups and misses seen while probing one page."""
+
+    def __init__(self):
+        self.lookups = 0
+        self.misses = 0
+        self.elapsed = 0.0
+        self._last_miss = None
+
+    def record_hit(self):
+        self._last_miss = None
+
+    def record_miss(self, target, by, value):
+        """Count a miss, except when it repeats the previous lookup (a WebDriverWait poll).
+
+        Polls of one wait retry the same lookup back to back, while separate
+        cascades that try the same selector later are counted again.
+        """
+        key = (getattr(target, "id", None) or id(target), by, value)
+        if key != self._last_miss:
+            self._last_miss = key
+            self.misses += 1
+
+    def saved_seconds(self, implicit_wait: float) -> float:
+        """Time the same misses would have spent in the implicit wait."""
+        return self.misses * implicit_wait
+
+
+class ProbeDriver:
+    """Thin proxy over a driver or element that counts selector misses.
+
+    Elements returned from find_element(s) are wrapped too, so nested lookups
+    such as item.find_element(...) inside an experience entry are counted.
+    """
+
+    def __init__(self, target, stats: ProbeStats):
+        self._target = target
+        self._stats = stats
+
+    def find_element(self, by=By.ID, value=None):
+        self._stats.lookups += 1
+        try:
+            element = self._target.find_element(by, value)
+        except NoSuchElementException:
+            self._stats.record_miss(self._target, by, value)
+            raise
+        self._stats.record_hit()
+        return ProbeDriver(element, self._stats)
+
+    def find_elements(self, by=By.ID, value=None):
+        self._stats.lookups += 1
+        elements = self._target.find_elements(by, value)
+        if elements:
+            self._stats.record_hit()
+        else:
+            self._stats.record_miss(self._target, by, value)
+        return [ProbeDriver(e, self._stats) for e in elements]
+
+    def execute_script(self, script, *args):
+        return self._target.execute_script(script, *[_unwrap(a) for a in args])
+
+    def execute_async_script(self, script, *args):
+        return self._target.execute_async_script(script, *[_unwrap(a) for a in args])
+
+    @property
+    def wrapped(self):
+        return self._target
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+def _unwrap(value):
+    if isinstance(value, ProbeDriver):
+        return value.wrapped
+    return value
+
+
+def wait_for_profile_ready(driver, is_sales_navigator: bool = False, timeout: float = READY_TIMEOUT) -> bool:
+    """Explicit "profile rendered" gate: main plus the layout's top-card marker."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.TAG_NAME, "main"))
+        )
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, PROFILE_READY_SELECTORS[is_sales_navigator]))
+        )
+        return True
+    except TimeoutException:
+        print("   ⚠️ Profile did not render before the readiness timeout; probing anyway")
+        return False
+
+
+def run_with_probing(driver, extractor, implicit_wait: float):
+    """Run extractor(driver) with implicit wait 0 and report the time saved.
+
+    Returns (result, ProbeStats). The driver's implicit wait is restored to
+    implicit_wait afterwards, even if the extractor raises.
+    """
+    stats = ProbeStats()
+    driver.implicitly_wait(0)
+    start = time.time()
+    try:
+        result = extractor(ProbeDriver(driver, stats))
+    finally:
+        stats.elapsed = time.time() - start
+        driver.implicitly_wait(implicit_wait)
+
+    print(f"   ⏱️ Probe: {stats.misses}/{stats.lookups} selector misses, "
+          f"~{stats.saved_seconds(implicit_wait):.1f}s implicit wait avoided "
+          f"(extraction took {stats.elapsed:.1f}s)")
+    return result, stats
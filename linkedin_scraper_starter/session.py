@@ -0,0 +1,62 @@
+"""
+Authenticated-session detection.
+
+The temporary Chrome profile keeps LinkedIn's cookies between runs, so a
+stored session can usually be reused without the manual login prompt:
+
+- has_session() reads the browser's cookie jar over CDP (no navigation
+  needed) and looks for an unexpired li_at (LinkedIn) or li_a (Sales
+  Navigator) cookie
+- is_login_page() recognises the login/authwall/checkpoint pages LinkedIn
+  redirects to once that session has expired, from the URL or the login form
+
+The scripts only fall back to their manual login prompt when one of these
+says the session is really gone.
+"""
+
+import time
+from urllib.parse import urlparse
+
+# Session cookie per platform (keyed by is_sales_navigator)
+AUTH_COOKIES = {False: "li_at", True: "li_a"}
+
+LOGIN_PATH_PREFIXES = ("/login", "/uas/login", "/authwall", "/checkpoint", "/sales/login", "/signup")
+LOGIN_FORM_SELECTOR = "form.login__form, input#username[name='session_key'], .authwall-join-form"
+
+
+def browser_cookies(driver) -> list:
+    """Every cookie in the browser profile, not just the current page's domain."""
+    try:
+        return driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+    except Exception:
+        # Without CDP only the current domain is visible
+        try:
+            return driver.get_cookies()
+        except Exception:
+            return []
+
+
+def has_session(driver, is_sales_navigator: bool = False) -> bool:
+    """True when the profile holds an unexpired session cookie for the platform."""
+    name = AUTH_COOKIES[is_sales_navigator]
+    now = time.time()
+    for cookie in browser_cookies(driver):
+        if cookie.get("name") != name or "linkedin.com" not in cookie.get("domain", ""):
+            continue
+        # CDP reports session cookies with expires -1; WebDriver uses "expiry"
+        expires = cookie.get("expires", cookie.get("expiry", -1))
+        if not cookie.get("value") or (expires not in (-1, None) and expires <= now):
+            continue
+        return True
+    return False
+
+
+def is_login_page(driver) -> bool:
+    """True when the browser was sent to a login, authwall or checkpoint page."""
+    try:
+        path = urlparse(driver.current_url).path
+        if path.startswith(LOGIN_PATH_PREFIXES):
+            return True
+        return bool(driver.execute_script("return !!document.querySelector(arguments[0]);", LOGIN_FORM_SELECTOR))
+    except Exception:
+        return False
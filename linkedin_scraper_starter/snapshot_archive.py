@@ -0,0 +1,310 @@
+"""
+Append-only archive of page snapshots (the HTML of every visited page).
+
+Pages are compressed one record at a time and appended to a pack file; a
+SQLite index maps (canonical URL, capture time) to the record's offset and
+length, and reads go through mmap, so any page can be pulled back without
+touching the rest of the pack. When selectors break, pages can be
+re-extracted from here instead of being visited again.
+
+Compression is zstd when the zstandard package is installed, otherwise zlib.
+With zstd, a dictionary is trained once the index holds DICT_TRAIN_SAMPLES
+pages (counted across runs, samples read back from the pack) and used for
+every page after that; LinkedIn markup is so repetitive that this
+typically brings a page down to a few percent of its raw size. Dictionaries
+are stored in the index, so the pack stays readable as they change.
+"""
+
+import mmap
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from url_utils import classify_url
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DICT_TRAIN_SAMPLES = 200
+DICT_SIZE = 112 * 1024
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 9
+
+
+class SnapshotArchive:
+    """Pack file plus SQLite offset index.
+
+    path is the pack file; the index lives next to it in path + ".idx".
+    A readonly archive never writes and can be opened by many processes.
+    """
+
+    def __init__(self, path: str = "snapshots.pack", train_samples: int = DICT_TRAIN_SAMPLES,
+                 readonly: bool = False):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.train_samples = train_samples
+        self._lock = threading.RLock()
+        self._pack = None if readonly else open(path, "ab")
+        self._map = None
+        self._map_size = 0
+        self._training_failed = False
+        self._compressors = {}
+        self._decompressors = {}
+        if readonly:
+            self._conn = sqlite3.connect(Path(self.index_path).absolute().as_uri() + "?mode=ro", uri=True,
+                                         check_same_thread=False)
+            self._dict_id = None
+            return
+        self._conn = sqlite3.connect(self.index_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                canonical_url TEXT,
+                url TEXT,
+                page_url TEXT,
+                kind TEXT,
+                captured_at REAL,
+                offset INTEGER,
+                length INTEGER,
+                raw_size INTEGER,
+                codec TEXT,
+                dict_id INTEGER
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_snapshots_url_time ON snapshots(canonical_url, captured_at)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_kind ON snapshots(kind)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS dictionaries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                data BLOB,
+                created_at REAL
+            )
+        """)
+        self._conn.commit()
+        row = self._conn.execute("SELECT MAX(id) FROM dictionaries").fetchone()
+        self._dict_id = row[0] if row and row[0] else None
+        self._pages = self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    # ---------------------------
+    # Writing
+    # ---------------------------
+    def put(self, url: str, html: str, page_url: str = "", kind: Optional[str] = None,
+            captured_at: Optional[float] = None) -> int:
+        """Compress and append one page. Returns its index id."""
+        raw = (html or "").encode("utf-8")
+        route = classify_url(url)
+        captured_at = time.time() if captured_at is None else captured_at
+        with self._lock:
+            codec, dict_id, data = self._compress(raw)
+            offset = self._pack.tell()
+            self._pack.write(data)
+            self._pack.flush()
+            cursor = self._conn.execute(
+                "INSERT INTO snapshots "
+                "(canonical_url, url, page_url, kind, captured_at, offset, length, raw_size, codec, dict_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (route.canonical, url, page_url or url, kind or route.kind, captured_at,
+                 offset, len(data), len(raw), codec, dict_id)
+            )
+            self._conn.commit()
+            self._pages += 1
+            self._maybe_train()
+            return cursor.lastrowid
+
+    def _compress(self, raw: bytes):
+        if zstandard is None:
+            return "zlib", None, zlib.compress(raw, ZLIB_LEVEL)
+        if self._dict_id is None:
+            return "zstd", None, self._compressor(None).compress(raw)
+        return "zstd", self._dict_id, self._compressor(self._dict_id).compress(raw)
+
+    def _compressor(self, dict_id: Optional[int]):
+        if dict_id not in self._compressors:
+            dictionary = self._dictionary(dict_id)
+            self._compressors[dict_id] = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dictionary)
+        return self._compressors[dict_id]
+
+    def _maybe_train(self):
+        """Train the first dictionary once the archive holds enough pages (one attempt per process)."""
+        if (zstandard is None or self._dict_id is not None or not self.train_samples
+                or self._training_failed or self._pages < self.train_samples):
+            return
+        if self.train_dictionary(self.train_samples) is None:
+            self._training_failed = True
+
+    def train_dictionary(self, limit: int = DICT_TRAIN_SAMPLES) -> Optional[int]:
+        """(Re)train a dictionary from the most recent pages in the archive."""
+        if zstandard is None:
+            return None
+        rows = self._conn.execute(
+            "SELECT id FROM snapshots ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+        samples = [self.read(row[0]).encode("utf-8") for row in rows]
+        with self._lock:
+            return self._train(samples)
+
+    def _train(self, samples: List[bytes]) -> Optional[int]:
+        try:
+            trained = zstandard.train_dictionary(DICT_SIZE, samples)
+        except zstandard.ZstdError as e:
+            print(f"⚠️ Snapshot dictionary training failed: {e}")
+            return None
+        cursor = self._conn.execute(
+            "INSERT INTO dictionaries (data, created_at) VALUES (?, ?)", (trained.as_bytes(), time.time())
+        )
+        self._conn.commit()
+        self._dict_id = cursor.lastrowid
+        return self._dict_id
+
+    def _dictionary(self, dict_id: Optional[int]):
+        if dict_id is None:
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM dictionaries WHERE id = ?", (dict_id,)).fetchone()
+        return zstandard.ZstdCompressionDict(row[0])
+
+    # ---------------------------
+    # Reading
+    # ---------------------------
+    def read(self, snapshot_id: int) -> str:
+        """HTML of one archived page by index id."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT offset, length, codec, dict_id FROM snapshots WHERE id = ?", (snapshot_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(snapshot_id)
+        return self._read(*row)
+
+    def get(self, url: str, before: Optional[float] = None) -> Optional[str]:
+        """Latest capture of url (optionally at or before a timestamp), or None."""
+        canonical = classify_url(url).canonical
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT offset, length, codec, dict_id FROM snapshots "
+                "WHERE canonical_url = ? AND captured_at <= ? ORDER BY captured_at DESC LIMIT 1",
+                (canonical, before if before is not None else float("inf"))
+            ).fetchone()
+        return self._read(*row) if row else None
+
+    def entries(self, kind: Optional[str] = None, latest_only: bool = True) -> Iterator[Dict]:
+        """Index rows (without the HTML), oldest first; latest capture per URL by default."""
+        query = "SELECT id, canonical_url, url, page_url, kind, captured_at FROM snapshots"
+        where = []
+        params = []
+        if kind:
+            where.append("kind = ?")
+            params.append(kind)
+        if latest_only:
+            where.append("id IN (SELECT MAX(id) FROM snapshots GROUP BY canonical_url)")
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY id"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        for row in rows:
+            yield dict(zip(("id", "canonical_url", "url", "page_url", "kind", "captured_at"), row))
+
+    def _read(self, offset: int, length: int, codec: str, dict_id: Optional[int]) -> str:
+        data = self._view(offset, length)
+        if codec == "zlib":
+            return zlib.decompress(data).decode("utf-8")
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd snapshots (pip install zstandard)")
+        if dict_id not in self._decompressors:
+            self._decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=self._dictionary(dict_id))
+        return self._decompressors[dict_id].decompress(data).decode("utf-8")
+
+    def _view(self, offset: int, length: int) -> bytes:
+        """Bytes of one record through a (re)mapped view of the pack."""
+        with self._lock:
+            end = offset + length
+            if self._map is None or end > self._map_size:
+                if self._pack is not None:
+                    self._pack.flush()
+                if self._map is not None:
+                    self._map.close()
+                with open(self.path, "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._map_size = len(self._map)
+            return self._map[offset:end]
+
+    # ---------------------------
+    # Housekeeping
+    # ---------------------------
+    def stats(self) -> Dict[str, float]:
+        pages, raw, stored = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(length), 0) FROM snapshots"
+        ).fetchone()
+        return {"pages": pages, "raw_bytes": raw, "stored_bytes": stored,
+                "ratio": (stored / raw) if raw else 0.0}
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._pack is not None:
+                self._pack.flush()
+                os.fsync(self._pack.fileno())
+                self._pack.close()
+                self._pack = None
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_archive(path: Optional[str]) -> Optional[SnapshotArchive]:
+    """SnapshotArchive at path, or None when archiving is switched off."""
+    return SnapshotArchive(path) if path else None
+
+
+def archive_page(archive: Optional[SnapshotArchive], driver, url: str, page_source: Optional[str] = None) -> str:
+    """Store the page currently loaded in driver; returns its HTML ("" when off).
+
+    Pass page_source when it has already been captured, to save a round trip.
+    Archiving never interrupts a scrape: failures are reported and ignored.
+    """
+    if archive is None:
+        return page_source or ""
+    try:
+        if page_source is None:
+            page_source = driver.page_source
+        archive.put(url, page_source, page_url=driver.current_url)
+    except Exception as e:
+        print(f"⚠️ Could not archive {url}: {e}")
+    return page_source or ""
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3 or sys.argv[1] not in ("stats", "train"):
+        print("Usage: python snapshot_archive.py stats|train <snapshots.pack>")
+        sys.exit(1)
+    readonly = sys.argv[1] == "stats"
+    if readonly and not os.path.exists(sys.argv[2] + ".idx"):
+        print(f"{sys.argv[2]} has no index ({sys.argv[2]}.idx)")
+        sys.exit(1)
+    with SnapshotArchive(sys.argv[2], train_samples=0, readonly=readonly) as archive:
+        if sys.argv[1] == "train":
+            dict_id = archive.train_dictionary()
+            print(f"✅ Trained dictionary {dict_id}; new pages will use it")
+        info = archive.stats()
+        print(f"📦 {info['pages']} pages, {info['raw_bytes'] / 1e6:.1f} MB raw → "
+              f"{info['stored_bytes'] / 1e6:.1f} MB stored ({info['ratio']:.1%})")
@@ -0,0 +1,540 @@
+"""
+Snapshot-once extraction.
+
+Instead of sending one chromedriver round trip per selector (plus one more for
+every .text / get_attribute), grab driver.page_source once per page and run the
+same selector cascades the scrapers use against an in-process lxml tree.
+
+The functions here return the same dict shapes as their live counterparts in
+scraper.py and test2.py, so callers can switch backends without touching the
+rest of the pipeline.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+LINKEDIN_ORIGIN = "https://www.linkedin.com"
+
+# Compiled selectors are cached because the same cascades run on every page
+_compiled = {}
+
+
+def parse_snapshot(page_source: str, url: str = ""):
+    """Parse a page_source string into an lxml tree with absolute links."""
+    tree = lxml_html.fromstring(page_source or "<html></html>")
+    if url:
+        try:
+            tree.make_links_absolute(url, resolve_base_href=True)
+        except Exception:
+            pass
+    return tree
+
+
+def take_snapshot(driver):
+    """Grab the current DOM in one WebDriver call and parse it."""
+    return parse_snapshot(driver.page_source, driver.current_url)
+
+
+def _compile(selector: str):
+    """Compile a CSS selector, or an XPath when it starts with '/'."""
+    if selector not in _compiled:
+        if selector.startswith("/"):
+            _compiled[selector] = lambda node, xp=selector: node.xpath(xp)
+        else:
+            _compiled[selector] = CSSSelector(selector)
+    return _compiled[selector]
+
+
+def select_all(node, selector: str) -> list:
+    """Return every node matching selector (CSS or XPath), or [] on error."""
+    try:
+        return _compile(selector)(node)
+    except Exception:
+        return []
+
+
+def select_one(node, selector: str):
+    """Return the first node matching selector, or None."""
+    matches = select_all(node, selector)
+    return matches[0] if matches else None
+
+
+def node_text(node) -> str:
+    """Approximate Selenium's element.text for an lxml node."""
+    if node is None:
+        return ""
+    parts = []
+    for item in node.iter():
+        if item.tag in ("script", "style", "template") or not isinstance(item.tag, str):
+            if item is not node and item.tail:
+                parts.append(item.tail)
+            continue
+        if item.tag == "br":
+            parts.append("\n")
+        if item.text:
+            parts.append(item.text)
+        if item is not node and item.tail:
+            parts.append(item.tail)
+    lines = [" ".join(line.split()) for line in "".join(parts).split("\n")]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def first_text(node, selectors: List[str], min_length: int = 2) -> str:
+    """Run a selector cascade and return the first text of at least min_length."""
+    for selector in selectors:
+        text = node_text(select_one(node, selector))
+        if text and len(text) >= min_length:
+            return text
+    return ""
+
+
+def attr(node, name: str) -> str:
+    """Read an attribute from an lxml node, tolerating None."""
+    if node is None:
+        return ""
+    return node.get(name) or ""
+
+
+def _split_name(data: Dict[str, str], full_name: str):
+    """Fill the First/Last/Full Name columns from a full name."""
+    data["Full Name"] = full_name
+    name_parts = full_name.split(" ", 1)
+    data["First Name"] = name_parts[0]
+    data["Last Name"] = name_parts[1] if len(name_parts) > 1 else ""
+
+
+def _build_entry(role: str, company_name: str, duration: str, location: str) -> str:
+    """Format one experience line the same way extract_first_company_info does."""
+    entry_parts = []
+    if role:
+        entry_parts.append(role)
+    if company_name:
+        entry_parts.append(f"at {company_name}")
+    if duration:
+        entry_parts.append(f"({duration})")
+    if location:
+        entry_parts.append(f"[{location}]")
+    return " ".join(entry_parts)
+
+
+def _absolute(url: str) -> str:
+    if url and url.startswith("/"):
+        return LINKEDIN_ORIGIN + url
+    return url
+
+
+# ---------------------------
+# Selector cascades (kept in sync with the live extractors)
+# ---------------------------
+NAME_SELECTORS = [
+    "h1",
+    "div.text-heading-xlarge",
+    "h1.text-heading-xlarge"
+]
+
+HEADLINE_SELECTORS = [
+    "div.text-body-medium.break-words",
+    "div.ph5 div.text-body-medium",
+    ".pv-text-details__left-panel .text-body-medium"
+]
+
+LOCATION_SELECTORS = [
+    "span.text-body-small.inline.t-black--light.break-words",
+    ".pv-text-details__left-panel .pb2 .text-body-small",
+    "div.ph5 span.text-body-small"
+]
+
+SALES_NAV_NAME_SELECTORS = [
+    "//*[@id='profile-card-section']/section[1]/div[1]/div[2]/h1",
+    ".profile-topcard-person__name",
+    "h1.profile-topcard-person__name",
+    "#profile-card-section h1"
+]
+
+SALES_NAV_HEADLINE_SELECTORS = [
+    "#profile-card-section .profile-topcard__headline",
+    ".profile-topcard__headline",
+    ".profile-topcard__headline-text",
+    ".profile-topcard-person__headline",
+    "[data-anonymize='headline']",
+    "//*[@id='profile-card-section']/section[1]/div[1]/div[3]"
+]
+
+SALES_NAV_LOCATION_SELECTORS = [
+    ".profile-topcard__location",
+    ".profile-topcard-person__location"
+]
+
+LINKEDIN_ABOUT_SELECTORS = [
+    ".pv-about__summary-text .lt-line-clamp__raw-line",
+    "div.full-width.t-14.t-normal.t-black span[aria-hidden='true']",
+    ".pv-about__summary-text",
+    "div[class*='full-width t-14 t-normal t-black'] span[aria-hidden='true']",
+    "div.qmdGMKYuIypnxyEHNTIvfxuATDBMXQom span[aria-hidden='true']",
+    "div.FwOlsjQqkKryZHlZOACWZtVIHRMuhoM span"
+]
+
+SALES_NAV_ABOUT_SELECTORS = [
+    "div[data-anonymize='person-blurb']",
+    "#about-section div._content-width_1dtbsb",
+    "div[id*='clamped-content']",
+    "._about-section_1dtbsb ._bodyText_1e5nen"
+]
+
+LINKEDIN_EXPERIENCE_XPATH = "//*[@id='profile-content']/div/div[2]/div/div/main/section[6]/div[3]/ul"
+SALES_NAV_EXPERIENCE_XPATH = "//*[@id='scroll-to-experience-section']/div/ul"
+
+COMPANY_NAME_SELECTORS = [
+    "h1.org-top-card-summary__title",
+    "h1[class*='org-top-card-summary__title']",
+    ".org-top-card-summary__title",
+    "h1"
+]
+
+COMPANY_WEBSITE_SELECTORS = [
+    "a[href*='://']:not([href*='linkedin']):not([href*='mailto']):not([href*='tel'])",
+    ".company-overview__website a",
+    "[data-field='website'] a",
+    ".company-info a[href*='://']:not([href*='linkedin'])",
+    "a.link-without-visited-state:not([href*='linkedin'])",
+    "a[href^='https://']:not([href*='linkedin.com'])",
+    "a[href^='www.']"
+]
+
+SALES_NAV_DESC_SELECTORS = [
+    "p[data-anonymize='company-blurb']",
+    "[data-anonymize='company-blurb']",
+    "._description-wrapper_mb60vc p",
+    ".pb1 p[data-anonymize='company-blurb']"
+]
+
+LINKEDIN_DESC_SELECTORS = [
+    ".lt-line-clamp__raw-line",
+    ".org-about-module__description .lt-line-clamp__raw-line",
+    ".organization-about-module__content-consistant-cards-description .lt-line-clamp__raw-line",
+    ".org-about-module__description",
+    ".organization-about-module__content-consistant-cards-description"
+]
+
+TRUNCATED_DESC_SELECTORS = [
+    ".lt-line-clamp__line",
+    ".organization-about-module__content-consistant-cards-description span"
+]
+
+FALLBACK_DESC_SELECTORS = [
+    "[data-test='about-us-description']",
+    ".about-us-company-module__description",
+    ".org-page-details__definition dd",
+    ".org-about-us__description",
+    "section[data-test='about-us'] p",
+    ".org-top-card-summary__description",
+    "[data-test='company-about-us'] p"
+]
+
+EXPERIENCE_SELECTORS = [
+    "#experience ~ div li",
+    ".pv-profile-section.experience li",
+    "section[data-section='experience'] li"
+]
+
+
+# ---------------------------
+# scraper.py shapes
+# ---------------------------
+def extract_top_card_snapshot(tree, url: str) -> Dict[str, str]:
+    """Snapshot version of scraper.extract_top_card."""
+    return {
+        "name": first_text(tree, NAME_SELECTORS),
+        "headline": first_text(tree, HEADLINE_SELECTORS),
+        "location": first_text(tree, LOCATION_SELECTORS),
+        "current_position": "",
+        "profile_url": url
+    }
+
+
+def extract_experience_snapshot(tree) -> List[str]:
+    """Snapshot version of scraper.extract_experience."""
+    experiences = []
+    for selector in EXPERIENCE_SELECTORS:
+        sections = select_all(tree, selector)
+        if sections:
+            for sec in sections[:5]:
+                role = node_text(select_one(sec, "h3, .mr1.t-bold"))
+                company = node_text(select_one(sec, "p, .pv-entity__secondary-title"))
+                if role and company:
+                    experiences.append(f"{role} at {company}")
+            break
+    return experiences
+
+
+# ---------------------------
+# test2.py shapes
+# ---------------------------
+def empty_profile(url: str) -> Dict[str, str]:
+    """Blank record with the test2.py column set."""
+    return {
+        "First Name": "",
+        "Last Name": "",
+        "Full Name": "",
+        "Designation": "",
+        "Current Position": "",
+        "About": "",
+        "Location": "",
+        "Email": "",
+        "Mobile No.": "",
+        "Experience": "",
+        "Company Name": "",
+        "Company Url": "",
+        "Company Website": "",
+        "Company Description": "",
+        "Profile Url": url
+    }
+
+
+def extract_about_snapshot(tree, is_sales_navigator: bool = False) -> str:
+    """Snapshot version of test2.extract_about_section.
+
+    No "Show more" click is needed: clamped text is still present in the DOM.
+    """
+    about_text = ""
+    if is_sales_navigator:
+        about_texts = []
+        for selector in SALES_NAV_ABOUT_SELECTORS:
+            for elem in select_all(tree, selector):
+                text = node_text(elem)
+                if text and len(text) > 20:
+                    about_texts.append(text.replace('… Show more', '').strip())
+        about_text = "\n\n".join(about_texts).strip()
+    else:
+        for selector in LINKEDIN_ABOUT_SELECTORS:
+            text = node_text(select_one(tree, selector))
+            if text and len(text) > 20:
+                about_text = text
+                break
+        if not about_text:
+            lines = [node_text(l) for l in select_all(tree, ".lt-line-clamp__raw-line, .lt-line-clamp__line")]
+            about_text = '\n'.join([l for l in lines if l]).strip()
+
+    if about_text:
+        about_text = '\n\n'.join([para.strip() for para in about_text.split('\n\n') if para.strip()])
+    return about_text
+
+
+def _linkedin_experience_item(item) -> Dict[str, str]:
+    role = first_text(item, [
+        "span.t-bold span[aria-hidden='true']",
+        ".display-flex.align-items-center .t-bold span[aria-hidden='true']"
+    ])
+
+    company_name = ""
+    for comp_sel in ["span.t-14.t-normal span[aria-hidden='true']", ".t-14.t-normal span[aria-hidden='true']"]:
+        comp_text = node_text(select_one(item, comp_sel))
+        if comp_text and "·" not in comp_text and "yr" not in comp_text and "mo" not in comp_text and "Present" not in comp_text:
+            company_name = comp_text
+            break
+
+    duration = ""
+    for dur_sel in ["span.pvs-entity__caption-wrapper[aria-hidden='true']", ".t-14.t-normal.t-black--light span[aria-hidden='true']"]:
+        duration_text = node_text(select_one(item, dur_sel))
+        if duration_text and any(keyword in duration_text for keyword in ["yr", "mo", "Present", "–", "-"]):
+            duration = duration_text
+            break
+
+    location = ""
+    for span in select_all(item, ".t-14.t-normal span[aria-hidden='true']"):
+        span_text = node_text(span)
+        if span_text and any(keyword in span_text for keyword in ["Remote", "Hybrid", "United States", "United Kingdom", "India", "Canada", "Australia"]):
+            location = span_text
+            break
+
+    company_url = ""
+    for link_sel in ["a[href*='/company/']", "a.optional-action-target-wrapper[href*='/company/']"]:
+        company_url = attr(select_one(item, link_sel), "href")
+        if company_url:
+            break
+
+    return {"role": role, "company": company_name, "duration": duration,
+            "location": location, "company_url": company_url}
+
+
+def _sales_nav_experience_item(item) -> Dict[str, str]:
+    role = node_text(select_one(item, "h2[data-anonymize='job-title']"))
+    company_name = node_text(select_one(item, "p[data-anonymize='company-name']"))
+
+    duration = ""
+    date_elem = select_one(item, "span.FaIDAmBvHCUAhRDrOYReTwrRgdFObBlKKw")
+    duration_elem = select_one(item, "p._bodyText_1e5nen._default_1i6ulk._sizeXSmall_1e5nen._lowEmphasis_1i6ulk")
+    # The live extractor needs both nodes present before it uses either
+    if date_elem is not None and duration_elem is not None:
+        date_range = node_text(date_elem)
+        duration_full_text = node_text(duration_elem)
+        if date_range and duration_full_text:
+            duration_parts = duration_full_text.split(date_range)
+            if len(duration_parts) > 1:
+                duration_only = duration_parts[1].strip()
+                duration = f"{date_range} · {duration_only}" if duration_only else date_range
+            else:
+                duration = date_range
+        elif date_range:
+            duration = date_range
+        elif duration_full_text:
+            duration = duration_full_text
+
+    location = node_text(select_one(item, "p.IcGLmQVeFqxrUMEeMBuKbysvdrtdpDiSlHJY"))
+    company_url = _absolute(attr(select_one(item, "a[href*='/sales/company/']"), "href"))
+
+    return {"role": role, "company": company_name, "duration": duration,
+            "location": location, "company_url": company_url}
+
+
+def extract_experience_entries_snapshot(tree, is_sales_navigator: bool = False) -> List[Dict[str, str]]:
+    """Return every experience item as a dict of role/company/duration/location/company_url."""
+    if is_sales_navigator:
+        experience_ul = select_one(tree, SALES_NAV_EXPERIENCE_XPATH)
+        if experience_ul is None:
+            return []
+        return [_sales_nav_experience_item(item) for item in select_all(experience_ul, "li._experience-entry_1irc72")]
+
+    experience_ul = select_one(tree, LINKEDIN_EXPERIENCE_XPATH)
+    if experience_ul is None:
+        return []
+    return [_linkedin_experience_item(item) for item in select_all(experience_ul, "li.artdeco-list__item")]
+
+
+def extract_first_company_snapshot(tree, is_sales_navigator: bool = False) -> Dict[str, str]:
+    """Snapshot version of test2.extract_first_company_info, minus the company page hop.
+
+    The caller decides how to fetch Company Website / Company Description for
+    the returned Company Url.
+    """
+    company_info = {
+        "Company Name": "",
+        "Company Url": "",
+        "Company Website": "",
+        "Company Description": "",
+        "Experience": ""
+    }
+    entries = extract_experience_entries_snapshot(tree, is_sales_navigator)
+    experience_entries = []
+    for index, item in enumerate(entries):
+        if item["role"] or item["company"]:
+            experience_entries.append(_build_entry(item["role"], item["company"], item["duration"], item["location"]))
+        if index == 0:
+            company_info["Company Name"] = item["company"]
+            company_info["Company Url"] = item["company_url"]
+    if experience_entries:
+        company_info["Experience"] = "\n".join(experience_entries)
+    return company_info
+
+
+def _merge_company_info(data: Dict[str, str], company_info: Dict[str, str]):
+    for key in ["Company Name", "Company Url", "Company Website", "Company Description", "Experience"]:
+        if company_info.get(key):
+            data[key] = company_info[key]
+
+
+def extract_linkedin_profile_snapshot(tree, url: str) -> Dict[str, str]:
+    """Snapshot version of test2.extract_linkedin_profile (without the company hop)."""
+    data = empty_profile(url)
+
+    full_name = first_text(tree, NAME_SELECTORS)
+    if full_name:
+        _split_name(data, full_name)
+    data["Designation"] = first_text(tree, HEADLINE_SELECTORS)
+    data["Location"] = first_text(tree, LOCATION_SELECTORS)
+
+    _merge_company_info(data, extract_first_company_snapshot(tree, is_sales_navigator=False))
+
+    if data["Experience"]:
+        data["Current Position"] = data["Experience"].split("\n")[0]
+    elif data["Designation"] and data["Company Name"]:
+        data["Current Position"] = f"{data['Designation']} at {data['Company Name']}"
+    elif data["Designation"]:
+        data["Current Position"] = data["Designation"]
+
+    data["About"] = extract_about_snapshot(tree, is_sales_navigator=False)
+    return data
+
+
+def extract_sales_navigator_profile_snapshot(tree, url: str) -> Dict[str, str]:
+    """Snapshot version of test2.extract_sales_navigator_profile (without the company hop)."""
+    data = empty_profile(url)
+
+    full_name = first_text(tree, SALES_NAV_NAME_SELECTORS)
+    if full_name:
+        _split_name(data, full_name)
+
+    current_position_elem = select_one(tree, "div._lockup-content-overflow-hidden_p4eb22")
+    if current_position_elem is not None:
+        role_company_elem = select_one(current_position_elem, "p._current-role-item_th0xau")
+        date_duration_elem = select_one(current_position_elem, "p._bodyText_1e5nen")
+        if role_company_elem is not None and date_duration_elem is not None:
+            data["Current Position"] = f"{node_text(role_company_elem)} {node_text(date_duration_elem)}"
+
+    data["Designation"] = first_text(tree, SALES_NAV_HEADLINE_SELECTORS)
+    data["Location"] = first_text(tree, SALES_NAV_LOCATION_SELECTORS)
+    data["About"] = extract_about_snapshot(tree, is_sales_navigator=True)
+
+    _merge_company_info(data, extract_first_company_snapshot(tree, is_sales_navigator=True))
+    return data
+
+
+def extract_company_snapshot(tree, company_url: str) -> tuple:
+    """Snapshot version of test2.scrape_company_info's field logic.
+
+    Returns tuple: (company_name, website_url, company_description)
+    """
+    company_name = ""
+    for selector in COMPANY_NAME_SELECTORS:
+        company_name = node_text(select_one(tree, selector))
+        if company_name:
+            break
+
+    website_url = ""
+    for selector in COMPANY_WEBSITE_SELECTORS:
+        for element in select_all(tree, selector):
+            href = attr(element, "href")
+            if href and not any(x in href.lower() for x in ['linkedin.com', 'mailto:', 'tel:', 'javascript:']):
+                if href.startswith('http'):
+                    website_url = href
+                    break
+        if website_url:
+            break
+
+    company_description = ""
+    if "/sales/company/" in company_url:
+        company_description = first_text(tree, SALES_NAV_DESC_SELECTORS, min_length=21)
+    else:
+        company_description = first_text(tree, LINKEDIN_DESC_SELECTORS, min_length=21)
+        if not company_description:
+            for selector in TRUNCATED_DESC_SELECTORS:
+                desc_elements = select_all(tree, selector)
+                if desc_elements:
+                    combined_text = " ".join([t for t in (node_text(e) for e in desc_elements) if t])
+                    if combined_text and len(combined_text.strip()) > 20:
+                        company_description = combined_text.strip()
+                        break
+
+    if not company_description:
+        for selector in FALLBACK_DESC_SELECTORS:
+            for desc_elem in select_all(tree, selector):
+                desc_text = node_text(desc_elem)
+                if desc_text and len(desc_text) > 20:
+                    company_description = desc_text
+                    break
+            if company_description:
+                break
+
+    return company_name, website_url, company_description
+
+
+def extract_snapshot(tree, url: str, is_sales_navigator: Optional[bool] = None) -> Dict[str, str]:
+    """Dispatch to the LinkedIn or Sales Navigator snapshot extractor."""
+    if is_sales_navigator is None:
+        is_sales_navigator = "/sales/" in url
+    if is_sales_navigator:
+        return extract_sales_navigator_profile_snapshot(tree, url)
+    return extract_linkedin_profile_snapshot(tree, url)
@@ -1,321 +0,0 @@
-~?С *)
-Googlegoogle-ct-logs@googlegroups.com*$
-
-Cloudflarect-logs@cloudflare.com*
-DigiCertctops@digicert.com*
-Sectigoctops@sectigo.com*$
-Let's Encryptsre@letsencrypt.org*,
-	TrustAsiatrustasia-ct-logs@trustasia.com*
-Geomysct@geomys.org2
-Google 'Argon2025h2' log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEr+TzlCzfpie1/rJhgxnIITojqKk9VK+8MZoc08HjtsLzD8e5yjsdeWVhIiWCVk6Y6KomKTYeKGBv6xVu93zQug==,EvFONL1TckyEBhnDjz96E/jntWKHiJxtMAWE6+WGJjo= */https://ct.googleapis.com/logs/us1/argon2025h2/2
-ʌB
-挫J
-GoogleRgoogle_argon2025h2https://crbug.com/8890332
-Google 'Argon2026h1' log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEB/we6GOO/xwxivy4HhkrYFAAPo6e2nc346Wo2o2U+GvoPWSPJz91s/xrEvA3Bk9kWHUUXVZS5morFEzsgdHqPg==,DleUvPOuqT4zGyyZB7P3kN+bwj1xMiXdIaklrGHFTiE= */https://ct.googleapis.com/logs/us1/argon2026h1/2
-B
-J
-GoogleųRgoogle_argon2026h1https://crbug.com/414170832
-Google 'Argon2026h2' log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEKjpni/66DIYrSlGK6Rf+e6F2c/28ZUvDJ79N81+gyimAESAyeNZ++TRgjHWg9TVQnKHTSU0T1TtqDupFnSQTIg==,1219ENGn9XfCx+lf1wC/+YLJM1pl4dCzAXMXwMjFaXc= */https://ct.googleapis.com/logs/us1/argon2026h2/2
-B
-J
-GoogleųRgoogle_argon2026h2https://crbug.com/414170832
-Google 'Xenon2025h2' log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEa+Cv7QZ8Pe/ZDuRYSwTYKkeZkIl6uTaldcgEuMviqiu1aJ2IKaKlz84rmhWboD6dlByyt0ryUexA7WJHpANJhg==,3dzKNJXX4RYF55Uy+sef+D0cUN/bADoUEnYKLKy7yCo= */https://ct.googleapis.com/logs/eu1/xenon2025h2/2
-ʌB
-挫J
-GoogleRgoogle_xenon2025h2https://crbug.com/8333502
-Google 'Xenon2026h1' log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEOh/Iu87VkEc0ysoBBCchHOIpPZK7kUXHWj6l1PIS5ujmQ7rze8I4r/wjigVW6wMKMMxjbNk8vvV7lLqU07+ITA==,lpdkv1VYl633Q4doNwhCd+nwOtX2pPM2bkakPw/KqcY= */https://ct.googleapis.com/logs/eu1/xenon2026h1/2
-B
-J
-GoogleųRgoogle_xenon2026h1https://crbug.com/413835352
-Google 'Xenon2026h2' log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE5Xd4lXEos5XJpcx6TOgyA5Z7/C4duaTbQ6C9aXL5Rbqaw+mW1XDnDX7JlRUninIwZYZDU9wRRBhJmCVopzwFvw==,2AlVO5RPev/IFhlvlE+Fq7D4/F6HVSYPFdEucrtFSxQ= */https://ct.googleapis.com/logs/eu1/xenon2026h2/2
-B
-J
-GoogleųRgoogle_xenon2026h2https://crbug.com/413835352
-Cloudflare 'Nimbus2025'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEGoAaFRkZI3m0+qB5jo3VwdzCtZaSfpTgw34UfAoNLUaonRuxQWUMX5jEWhd5gVtKFEHsr6ldDqsSGXHNQ++7lw==,zPsPaoVxCWX+lZtTzumyfCLphVwNl422qX5UwP5MDbA= **https://ct.cloudflare.com/logs/nimbus2025/2
-һB
-J
-
-CloudflareRcloudflare_nimbus2025https://crbug.com/14746572
-Cloudflare 'Nimbus2026'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE2FxhT6xq0iCATopC9gStS9SxHHmOKTLeaVNZ661488Aq8tARXQV+6+jB0983v5FkRm4OJxPqu29GJ1iG70Ahow==,yzj3FYl8hKFEX1vB3fvJbvKaWc1HCmkFhbDLFMMUWOc= **https://ct.cloudflare.com/logs/nimbus2026/2
-B
-J
-
-CloudflareRcloudflare_nimbus2026https://crbug.com/3554609772
-DigiCert Yeti2025 Log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE35UAXhDBAfc34xB00f+yypDtMplfDDn+odETEazRs3OTIMITPEy1elKGhj3jlSR82JGYSDvw8N8h8bCBWlklQw==,fVkeEuF4KnscYWd8Xv340IdcFKBOlZ65Ay/ZDowuebg= *%https://yeti2025.ct.digicert.com/log/2
-һB
-J
-DigiCertԫRdigicert_yeti2025https://crbug.com/12966352
-DigiCert Nessie2025 Log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE8vDwp4uBLgk5O59C2jhEX7TM7Ta72EN/FklXhwR/pQE09+hoP7d4H2BmLWeadYC3U6eF1byrRwZV27XfiKFvOA==,5tIxY0B3jMEQQQbXcbnOwdJA9paEhvu6hzId/R43jlA= *'https://nessie2025.ct.digicert.com/log/2
-һB
-J
-DigiCertԫRdigicert_nessie2025https://crbug.com/12966352
-DigiCert 'Wyvern2025h2' Log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE4NtB7+QEvctrLkzM8WzeQVh//pT2evZg7Yt2cqOiHDETMjWh8gjSaMU0p1YIHGPeleKBaZeNHqi3ZlEldU14Lg==,7TxL1ugGwqSiAFfbyyTiOAHfUS/txIbFcA8g3bc+P+A= *&https://wyvern.ct.digicert.com/2025h2/2
-ʌB
-̿J
-DigiCertRdigicert_wyvern2025h2crbug.com/3370760212
-DigiCert 'Wyvern2026h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE7Lw0OeKajbeZepHxBXJS2pOJXToHi5ntgKUW2nMhIOuGlofFxtkXum65TBNY1dGD+HrfHge8Fc3ASs0qMXEHVQ==,ZBHEbKQS7KeJHKICLgC8q08oB9QeNSer6v7VA8l9zfA= *&https://wyvern.ct.digicert.com/2026h1/2
-B
-J
-DigiCertRdigicert_wyvern2026h1https://crbug.com/3539240092
-DigiCert 'Wyvern2026h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEenPbSvLeT+zhFBu+pqk8IbhFEs16iCaRIFb1STLDdWzL6XwTdTWcbOzxMTzB3puME5K3rT0PoZyPSM50JxgjmQ==,wjF+V0UZo0XufzjespBB68fCIVoiv3/Vta12mtkOUs0= *&https://wyvern.ct.digicert.com/2026h2/2
-B
-J
-DigiCertRdigicert_wyvern2026h2https://crbug.com/3539240092
-DigiCert 'Sphinx2025h2' Log|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEQYxQE1SxGQW3f0ogbqN1Y8o09Mx06jI7tosDFKhSfzKHXlmeD6sYnilstXJ3GidUhV3BeySoNOPNiM7UUBu+aQ==,pELFBklgYVSPD9TqnPt6LSZFTYepfy/fRVn2J086hFQ= *&https://sphinx.ct.digicert.com/2025h2/2
-ʌB
-̿J
-DigiCertRdigicert_sphinx2025h2crbug.com/3370789712
-DigiCert 'Sphinx2026h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEq4S++DyHokIlmmacritS51r5IRsZA6UH4kYLH4pefGyu/xl3huh7/O5rNk/yvMOeBQKaCAG1SSM1xNNQK1Hp9A==,SZybad4dfOz8Nt7Nh2SmuFuvCoeAGdFVUvvp6ynd+MM= *&https://sphinx.ct.digicert.com/2026h1/2
-B
-J
-DigiCertRdigicert_sphinx2026h1https://crbug.com/3540253692
-DigiCert 'Sphinx2026h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEquD0JkRQT/2inuaA4HC1sc6UpfiXgURVQmQcInmnZFnTiZMhZvsJgWAfYlU0OIykOC6slQzr7U9kvEVC9wZ6zQ==,lE5Dh/rswe+B8xkkJqgYZQHH0184AgE/cmd9VTcuGdg= *&https://sphinx.ct.digicert.com/2026h2/2
-B
-J
-DigiCertRdigicert_sphinx2026h2https://crbug.com/3540253692
-Sectigo 'Sabre2025h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEhRMRLXvzk4HkuXzZZDvntYOZZnlZR2pCXta9Yy63kUuuvFbExW4JoNdkGsjBr4mL9VjYuut7g1Lp9OClzc2SzA==,GgT/SdBUHUCv9qDDv/HYxGcvTuzuI0BomGsXQC7ciX0= *#https://sabre2025h2.ct.sectigo.com/2
-ʌB
-挫J
-SectigoRsectigo_sabre2025h2https://crbug.com/7037002
-Sectigo 'Mammoth2025h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEiOLHs9c3o5HXs8XaB1EEK4HtwkQ7daDmZeFKuhuxnKkqhDEprh2L8TOfEi6QsRVnZqB8C1tif2yaajCbaAIWbw==,rxgaKNaMo+CpikycZ6sJ+Lu8IrquvLE4o6Gd0/m2Aw0= *%https://mammoth2025h2.ct.sectigo.com/2
-ʌB
-挫J
-SectigoRsectigo_mammoth2025h2https://crbug.com/7036992
-Sectigo 'Mammoth2026h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEnssMilHMiuILzoXmr00x2xtqTP2weWuZl8Bd+25FUB1iqsafm2sFPaKrK12Im1Ao4p5YpaX6+eP6FSXjFBMyxA==,JS+Uwisp6W6fQRpyBytpXFtS/5epDSVAu/zcUexN7gs= *%https://mammoth2026h1.ct.sectigo.com/2
-B
-J
-SectigoRsectigo_mammoth2026h1https://crbug.com/413086032
-Sectigo 'Mammoth2026h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE7INh8te0u+TkO+vIY3WYz2GQYxQ9XyLfdLpQp1ibaX3mY4lt2ddRhD/4AtjI/8KXceV+J/VysY8kJ1cKDXTAtg==,lLHBirDQV8R74KwEDh8svI3DdXJ7yVHyClJhJoY7pzw= *%https://mammoth2026h2.ct.sectigo.com/2
-B
-J
-SectigoRsectigo_mammoth2026h2https://crbug.com/413086032
-Sectigo 'Sabre2026h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEhCa8Nr3YjTyHnuAQr82U2de5UYA0fvdYXHPq6wmTuBB7kJx9x82WQ+1TbpUhRmdR8N62yZ6q4oBtziWBNNdqYA==,VmzVo3a+g9/jQrZ1xJwjJJinabrDgsurSaOHfZqzLQE= *#https://sabre2026h1.ct.sectigo.com/2
-B
-J
-SectigoRsectigo_sabre2026h1https://crbug.com/413086062
-Sectigo 'Sabre2026h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEzjXK7DkHgtp3J4bk8n7F3Djym6mrjKfA7YMePmobwPCVVroyM0x1fAkH6eE+ZTVj8Em+ctGqna99CMS0jVk9cw==,H1bRq5RwSkHdP+r99GmTVTAsFDG/5hNGCJ//rnldzC8= *#https://sabre2026h2.ct.sectigo.com/2
-B
-J
-SectigoRsectigo_sabre2026h2https://crbug.com/413086062
-Sectigo 'Elephant2025h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE0OlLeGW2qUZGUoQERydw3GlayEO3ZK3418zThY1tDYr85ASme6ZOL/2DXyOXw8RCwVsKhRbOqMEOxW4Q2p4KQg==,DR28iUTp9QBVQtctPhRMzEMIKrbqHpTf1wZlfS6G8wE= *&https://elephant2025h2.ct.sectigo.com/2
-ʌB
-J
-SectigoRsectigo_elephant2025h2https://crbug.com/3991343702
-Sectigo 'Elephant2026h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEU0lqnPHoXuU9Fc9dJv1HQZCvssJfvxLsirwVQ/fkFyUqeu4inwPKikeT4DGyyWWH4NR/DCJa2bAumHrXJdAcaQ==,0W6ppWgHfmY1oD83pd28A6U8QRIU1IgY9ekxsyPLlQQ= *&https://elephant2026h1.ct.sectigo.com/2
-B
-J
-SectigoRsectigo_elephant2026h1https://crbug.com/3991343702
-Sectigo 'Elephant2026h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEO/t4Uwkoou78zkCchh9tfAKbIUJmbOoUAb8szD8StnnHFKAVY5kq1Ljs8YD7CfzdD7xcVjmQYpbtNUhxRMRtmA==,r2eIO1ewTt2Pptl+9i6o64EKx3Fg8CReVdYML+eFhzo= *&https://elephant2026h2.ct.sectigo.com/2
-B
-J
-SectigoRsectigo_elephant2026h2https://crbug.com/3991343702
-Sectigo 'Elephant2027h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE4fu36JygUwaaVO+ddWJ97FJZlA5SjPLmT+RHwg0pavkIrbT1b5LNQrsaEw0CoGraf7BkzKZf7PC8gYAScw2woA==,YEyar3p/d18B1Ab8kg3ImesLHH34yVIb+voXdzuXi8k= *&https://elephant2027h1.ct.sectigo.com/2
-B
-J
-SectigoRsectigo_elephant2027h1https://crbug.com/3991343702
-Sectigo 'Elephant2027h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAECTPhpJnRFroRRpP/1DdAns+PrnmUywtqIV+EeL4Jg8zKouoW7kuAkYo+kZeoHtyK7CBhflIlMk7T2Qrn4w/t8g==,okkM3NuOM6QAMhdg1tTVGiA2GR6nfZaL4mqKAPb///c= *&https://elephant2027h2.ct.sectigo.com/2
-B
-J
-SectigoRsectigo_elephant2027h2https://crbug.com/3991343702
-Sectigo 'Tiger2025h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEFUl5keBbWVckXMv6WSWToTeGwi9DSNCI2WZlIENBkA/zADmmS58w33/f0JhC2KEkWS+4T7/bYOXv4dDNzzrExg==,XKV30pt/i69Bntjsq/tty67DhTcC1XRvF02tPJNKqWo= *#https://tiger2025h2.ct.sectigo.com/2
-ʌB
-ϹJ
-SectigoRsectigo_tiger2025h2https://crbug.com/3991246092
-Sectigo 'Tiger2026h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE73eDJyszDbzsWcgI0nbtU0+y11gQWjNjS/RSO5P4hOSFE+pPrDCtfNPHe6dq7/XQYwOFt9Feb8TwQW+mqXN5xg==,FoMtq/CpJQ8P8DqlRf/Iv8gj0IdL9gQpJ/jnHzMT9fo= *#https://tiger2026h1.ct.sectigo.com/2
-B
-ϹJ
-SectigoRsectigo_tiger2026h1https://crbug.com/3991246092
-Sectigo 'Tiger2026h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEfJFUD/FRkonvZIA9ZT1J3yvA4EpSp3innbIVpMTDR1oCe5vguapheQ7wYiWaCES1EL1B+2BEC+P5bUfwF44lnA==,yKPEf8ezrbk1awE/anoSbeM6TkOlxkb5l605dZkdz5o= *#https://tiger2026h2.ct.sectigo.com/2
-B
-ϹJ
-SectigoRsectigo_tiger2026h2https://crbug.com/3991246092
-Sectigo 'Tiger2027h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEmMQofpsDjCVYzF4jXdFWM/ioYBJIPcsQQrNAHE6v4lOsADoI+/jN1lph8x4K3NgnXDXwmyJcFwRYgVOBMhaYhA==,HJ9oLOn68EVpUPgbloqH3dsyENhM5siy44JSSsTPWZ8= *#https://tiger2027h1.ct.sectigo.com/2
-B
-ϹJ
-SectigoRsectigo_tiger2027h1https://crbug.com/3991246092
-Sectigo 'Tiger2027h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEb0AgkemhsPmYe1goCSy5ncf2lG9vtK6f+SzODKJMYEgPOT+z93cUEKM1EaTuo09rozfdqhjeihIl25y9A3JhyQ==,A4AqwmL24F4D+Lxve5hRMk/Xaj31t1lRdeIi+46b1fY= *#https://tiger2027h2.ct.sectigo.com/2
-B
-ϹJ
-SectigoRsectigo_tiger2027h2https://crbug.com/3991246092
-Let's Encrypt 'Oak2025h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEtXYwB63GyNLkS9L1vqKNnP10+jrW+lldthxg090fY4eG40Xg1RvANWqrJ5GVydc9u8H3cYZp9LNfkAmqrr2NqQ==,DeHyMCvTDcFAYhIJ6lUu/Ed0fLHX6TDvDkIetH5OqjQ= *&https://oak.ct.letsencrypt.org/2025h2/2
-B
-挫J
-Let's EncryptRletsencrypt_oak2025h2https://crbug.com/9636932
-Let's Encrypt 'Oak2026h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEmdRhcCL6d5MNs8eAliJRvyV5sQFC6UF7iwzHsmVaifT64gJG1IrHzBAHESdFSJAjQN56TYky+9cK616MovH2SQ==,GYbUxyiqb/66A294Kk0BkarOLXIxD67OXXBBLSVMx9Q= *&https://oak.ct.letsencrypt.org/2026h1/2
-ΗB
-J
-Let's EncryptRletsencrypt_oak2026h1https://crbug.com/414591432
-Let's Encrypt 'Oak2026h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEanCds5bj7IU2lcNPnIvZfMnVkSmu69aH3AS8O/Y0D/bbCPdSqYjvuz9Z1tT29PxcqYxf+w1g5CwPFuwqsm3rFQ==,rKswcGzr7IQx9BPS9JFfER5CJEOx8qaMTzwrO6ceAsM= *&https://oak.ct.letsencrypt.org/2026h2/2
-B
-J
-Let's EncryptRletsencrypt_oak2026h2https://crbug.com/414591432
-TrustAsia Log2025a|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEcOWxpAl5K534o6DfGO+VXQNse6GRqbiAfexcAgjibi98MnC9loRfpmLpZbV8kFi6ItX59WlUt6iUTjIJriYRTQ==,KOKBOP2DIUXpqdaqdTdtg3eohRKzwH9yQUgh3L3pjGY= *(https://ct2025-a.trustasia.com/log2025a/2
-һB
-挫J
-	TrustAsiaRtrustasia_log2025ahttps://crbug.com/14562142
-TrustAsia Log2025b|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEqqCL22cUXZeJHQiNBtfBlI6w+kxG1VMIeCsEU2zz3rHRU0DakFfmGp48xwO4vS+pz+h7XuFLYOU4Q2CXwVsvZQ==,KCyL3YEP+QkSCs4W1uDsIBvqgqOkrxnZ7/tZ6D/cQmg= *(https://ct2025-b.trustasia.com/log2025b/2
-һB
-挫J
-	TrustAsiaRtrustasia_log2025bhttps://crbug.com/14562142
-TrustAsia 'log2026a'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEp056yaYH+f907JjLSeEAJLNZLoP9wHA1M0xjynSDwDxbU0B8MR81pF8P5O5PiRfoWy7FrAAFyXY3RZcDFf9gWQ==,dNudWPfUfp39eHoWKpkcGM9pjafHKZGMmhiwRQ26RLw= *(https://ct2026-a.trustasia.com/log2026a/2
-ڬ΀B
-J
-	TrustAsiaٲRtrustasia_log2026acrbug.com/409178532
-TrustAsia 'log2026b'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEDxKMqebj7GLu31jIUOYmcHYQtwQ5s6f4THM7wzhaEgBM4NoOFopFMgoxqiLHnX0FU8eelOqbV0a/T6R++9/6hQ==,Jbfv3qETAZPtkweXcKoyKiZiDeNayKp8dRl94LGp4GU= *(https://ct2026-b.trustasia.com/log2026b/2
-ڬ΀B
-J
-	TrustAsiaٲRtrustasia_log2026bcrbug.com/409178532
-Geomys 'Tuscolo2025h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEK9d4GGtzbkwwsYpEtvnU9KKgZr67MsGlB7mnF8DW9bHnngHzPzXPbdo7n+FyCwSDYqEHbal1Z0CCVyZD6wQ/ow==,750EQi4gtDIQJ1TfUtJRRgJ/hEwH/YZeySLub86fe7w= <**https://tuscolo2025h2.sunlight.geomys.org/2
-ʌB
-J
-GeomysRgeomys_tuscolo2025h2Z*https://tuscolo2025h2.skylight.geomys.org/https://crbug.com/4166913302
-Geomys 'Tuscolo2026h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEflxzMg2Ajjg7h1+ZIvQ9LV6yFvdj6uRi9YbvtRnSCgS2SamkH56WcPRaBTRYARPDIr5JwLqgJAVA/NvDxdJXOw==,cX6V88I4im2x44RJPTHhWqliCHYtQgDgBQzQZ7WmYeI= <**https://tuscolo2026h1.sunlight.geomys.org/2
-B
-J
-GeomysRgeomys_tuscolo2026h1Z*https://tuscolo2026h1.skylight.geomys.org/https://crbug.com/4166913302
-Geomys 'Tuscolo2026h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEaA6P0i7JTsd9XfzF1/76avRWA3XXI4NStsFO/aFtBp6SY7olDEMiPSFSxGzFQjKA1r9vgG/oFQwurlWMy9FQNw==,Rq+GPTs+5Z+ld96oJF02sNntIqIj9GF3QSKUUu6VUF8= <**https://tuscolo2026h2.sunlight.geomys.org/2
-B
-J
-GeomysRgeomys_tuscolo2026h2Z*https://tuscolo2026h2.skylight.geomys.org/https://crbug.com/4166913302
-Geomys 'Tuscolo2027h1'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEOYwwGoaNpZ/SQW0VNGICP7wGRQsSeEowTRl4DPSdPjSkO/+ouvFH78I8sQTR3FWPZDScALbclBqnqL0ptY8beA==,WW5sM4aUsllyolbIoOjdkEp26Ag92oc7AQg4KBQ87lk= <**https://tuscolo2027h1.sunlight.geomys.org/2
-B
-J
-GeomysRgeomys_tuscolo2027h1Z*https://tuscolo2027h1.skylight.geomys.org/https://crbug.com/4166913302
-Geomys 'Tuscolo2027h2'|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEIAz2gOD7wIptaiLTnmR4k7AQwp5kFmqmGHY/8JmMJxaSHyAipoFA/YSBCTX7ZowxIkSKpZYGlqLtdLVcLWDS5w==,1d5V7roItgyf/BjFE75qYLoARga8WVuWu0T2LMV9Ofo= <**https://tuscolo2027h2.sunlight.geomys.org/2
-B
-J
-GeomysRgeomys_tuscolo2027h2Z*https://tuscolo2027h2.skylight.geomys.org/https://crbug.com/4166913302
-9Bogus placeholder log to unbreak misbehaving CT libraries|MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEj4lCAxWCY6SzIthkqZhwiUVzcK62i6Fc+/YS0WHaN6jjO1ITUFuu8beOiU9PdeNmdalZcC3iWovAfApvXS33Nw==,LtakTeuPDIZGZ3acTt0EH4QjZ1X6OqymNNCTXfzVmnA= *https://ct.example.com/bogus/2
-ƶB
-J
-GeomysRgeomys_bogus6962https://crbug.com/426624777  8ۡITd။'`6~w  n?Y"|k"o
-}Dn  Oo+̰X	1h)(tR_K  Уq{`>	OڗR
-4 !MVHaܫ3 !:"z@G[`O˫	^'KqQT} <WɝR]	b1UMqfD IdMDG,	D S ͕_=n_p݌ `t^tp888 x)!HdfӀfS>:Zonq׉ 	Ch`G1cpv#[ [*:lS+GVxtK *S^2MU6*F88 "WI9hAKfj. xz`,$3tdr7E ߹!BjrL]'^}.Q Y[M?\; %TxAm ~uyR^.5`O6i- Yf|uM8υFRMy5	 dL'T?%ĝ>wF$CMj o\.5
- ~gB{cW2
- |(j̖任"NAoE{ &jh u(e$LPYfþZ9{x UZ9m[KL<`6*\6 V< |%6Lُ$[1y 5j{;FI)n3jzDl=0 |z4@#?_ݙYAsZ /!^oLzCdzʼ~mXĈ 9MD yDdg? iK@	T XKqn<k;/*66ׇ)Rz DR7+߼p]M3!ޭyjL@ w#żĀF9 XpL6,a.M@'vr5J əwKx-,Y,2ۮ j ٳ c NMǙtXڃFߦkZ P+[׽\ȐSsD;<YT 	$ɜI7ύ'_q7%]e 	5	%sq#mN 	D']M\& K5_k'z#ߎ! 	)+˙$Lq`1S滾L 	*nn~ߥ-eΈC 	Bix(k5<}p]a 
-P_N*<%Flf~j\wS+ 
-s*aQudg_:%(s̴Q) 
-aF;V/^3<Aln| 
-Mޤw1sQ3S.; A~ݦeؐn<nN`q7 4*,`n`E'ltz9#V mbޅ.VQmHTZk> 1e[ƍ9c}fZe= $gE 
-H{~#	R&g+) ̣14l@QNUz2KJg >r	)RMn2rCeaDi8D Vv+㮗c?o?/LĪmU" 9jp#8JLJWGYt/q gek<tWЖ%!  ,]")Q&I)LQU|ێ.b XCnT>+˂Gҥ''Ie A/K;!|V1ff
-&GB 3f+=0>K˖w;qEg6YB NPBGdAG)ƆaDiL\! 
-2=+_ Zn@K@ JiذZ/G]eRx' z(!0ȃКۘN.'k. x]uyjor,vA
- &jn'6PK)+PGN' }HBjvra `y
-zVW)״kr,afRr ~3
-\"N '7x~Ȼ y|,YK-Aesx;:Aa ?<@cSk4ĕ{f0̀F* [hYćl_R >بf(މ muKA|b̥n'pؕ* "gԚ:FJaqͻZ	?jL vRszG,Aq:S =Sѵ*]yr 17=]Qfh =HFW=q9@7'0{4˻?*} d?\6Or*+w{ͨbi e?~6WPmJ^Դ8JWWk bGO8%}ry+>ZnqF @:>pX~_^ͥ$t' 7E'CMQySF@i1| $I-II
-{1FhO %u:ud;2
- ]>[+Khӗ8&oVl! Ҁ,ʐ8 pr*=QIs} 	JCixGuȽ3xd݉QA <lzz\%^A͐~]p @skI' 0!χ(?N$ _6dtxЅط[^\Je bvZN'[d B9r.y~L*{ ֍vu0DLkЈcGR 'H fk9s}#(%ʉ|ؖuf=\k ޽2!]&K큚5QHP dt%V\S妍0u¹Y ;'@sr1*%+xEd) ^A=2Y􀏀VOHFj0> f,JEV֭l?ꃭ{% 0({꜆ p ya&,ˋn p)ϷuS7W- Ét؇Q:`&I=:0 qg~P✣cml1: 5^9i?Sտxa41P^$ lkCbVsy"T2+"Ef rP1N
-1`ByG5O)6 0LkQ0yҳ$xeR Ɇ+6K. 32R' -VӲ \!&v#q$ȞT űEBEr?A8~GB< eA tjH5)Ua>m@kR1[ 9},o'4bZnbE%U*u ¶iЊ
-JDF\s=` ǵ3tYW~pP_ j(QcK<٢PqWpJmv  QP./ӿob㩡 z68hIkxy"ځ7~w.̫R Ҽ;MmDZ{O=砽K (ci*w|<EsU,Y|[ >~87u7nښ7W-zE  Z­T 2C\H<uX7)[ \]|	.WtW𢾬?" A_{z*%~@LHes:Xc Ԑ"Yn5-2j$<f?ّL ԟ[$H?lxpRmіVǜ7V z[H&\JM`/6Q<;N 0RϷt$G?RƝڌ&4#(};_ jֆf?~RxU2&e[̧uR x$agyX3-gS gRֺg/ x^퍇0*l qm8H^܊eBf"̬ /Ci '̻~qr#TUNEP  +u*'_@F?BЋCצ2  *,3α6{!%?)-_;=˱  mH?>-{$YLʘW zE !P;%{cb6D鄥|}KML[ !0힟\7!33L?ZZ[L !{-7Ăky6UjwΩ<XQ !8&Uh27ɝ7j@ "?n'tOJj}
-fov~[b "caz=C
-B;ajl&_ # 45fW~-"<G=CYM #
-$SP<H#,%:Y #G8DjE̊*~r2  Jq #OQdevܝASU $rxN0yu߮]ܹ=I{* U $>p-sHFry%e8@f8 $t^v.v;o#	F* %Vyx5ɲUZ*1CV &Ox኎KlA&}4tϴ '`Fa*y/}&=R/>s 'LcQz~Og%ao2 (sA>\^e(Dܹ}JHu (RTSwjnSwUnqS (&O밉{/(=K )L~,Qg"%X9@Gߠh?4 )DẊ$&j-Ap9Ch!q_ )Q=eJ	͞6Sc~T^Vbh )iro\$%}]u;Jٍ )u-5?	K+enz0sm-Y¨ *1mS7d7XZHǣec` *H?/%kӀ]cE +6>(	ȦpbnfS +8Q9NMWLk½}UF[ +w@*zI;ei>̥/BA +9iQۡ/M/egvP_$0 +d ᓵܹf"q⡅SA +V`ٔnhy$$'Teb~ +,NaR᫓=t +kٺi7%^y"Є,%u(4 , Iֿ3(0y;6}=R ,vT`/,"JAv06SwU%Q ,~hl 2t ȃ zv}8 ,%8cVfzeRV3 ,msaA.FaLQL1 -2|Tv"(۪x-F{@,Ə -U:Se*֭޼90^SR!|by6 -ð!;a/P5\ o4K}{ -8쏄O"qTĢCkl6 .pWjhaLcF#">Nz/v .guXB#;_-g .Y05?=[ndg۸U֋ 0	`N&~pSb{]ti!e 1J,W	Cܪ<@'](ݸ: 1r:07:Y s9}15 1+	X.%T ])KX!Z 2/Q-slnMdTC 2['9)6ܽ	2TgFpUlA9Pzp 2r%21X' JV|͋9Z> 2tt+ꉸf)Ԃ.E0t=H 2B\bBY1ص p̊Oa 3RG8zA<ЯukVojPM"C 	 3h~J\Z
-!1( g鞍 3Ȱ`hQWYϷAbO;Y 4Sn0ĖI8V#u1D1 4')uތi`;XL2 4كX!Wh*E~(`9* 5V^zU=8!Z m 6"aefr_SIGMYG3Yr; 6Ou
-/W}*EEќ9n"ѐi 6xzzFVҶp~=[IU<^7] 6Eݳ=ynzr 6ݾ̸ dhKʦjH) 7h34\`?:+
-6 7l닡û!ԖC4unS.)Y 7sGlU	vl0/v414 7Ol?A;y뭎<\a2Tc2 8I1B.ɴIقF> 8@P޸dckNg+~ Q 8H4YzlŶXd ͍w 8hIm3@pTւ%0_&Oh 8#TTUFFTR|mpf~lw} 8eI"0%Bsx!H%- 8^	$+۵ߠh,5j9pb˸x 98Bs'ġ󅳆Ťߘ 9UEAH5~0~ ?W2	V2 9nrQSm$a'y7zK䆶Q 92|MdI"ASL꽯0 9[źݕ9w:"RS& . 9 42HP%3P鍋Bc\q?ړwmQz 96W4q$m%Y -hƚ :+{.9^B("  :QVN[=pͿ#ȱ:g	7'> :)=Q%|Oǆ|* :~̉vs/pw^RrsP :Mr~rëI!\F$jQ ;f fcґ4^	?hf ;'K/Իm -D`w: ;7\,0GoHO2- ;PPaז6-b(x/RJd'Sup ;?97GV9Ҋe닟˴+ ;rsGyK	3ŤfE#p ;=!R7IF	̙8{)cL <-Nw3j 4sTn$	`v[ʍ <V)'T2LNɸ}aHUNj <gL,*	TV^;GIQޥ9h <c1(^)?S ҇?}A:b <d`*X2@n!ll <ct.~朗^ >a9Et5#tsr\g#b	 >-a}O,\j65K >ʗ|XK?m_;Z< >[,[_m,?8k+
-/+# >FH %R~us-XK. [bV ?cmU{ \ia$V ?[*ĤƦ1Ó f_HcqĀO\ ?ͺ
-wJSvYT-^JjY ?~1$8.N$A!oW&ZSn ?_':gSC|JT.7)j @R+@R8)wIH4*eϼ^ @quJzMc*	CͰbd9y駵ȣ A4W}   lՆ1*0Av
-b AcgbQ~Y)f
-*'|q*Y B/^!Zc LCkf6_Z BF*=j/Ti&%/P#{V6 B?E*r'rOEBx@˫[rB[ C^"(V¯.E_ D
-J!EԗpG._3  DR
-rf˲D3®.w Dd-v`Pzsa[_Z'+vj.%! Duop]Nq'p%mNg E.kaZ@:yRR$ E:XMO<U'!1EVu% EcC\K+\+v|[b,\x E{zQ?6LX |rW11ѻ ET$SK;Wq|Qل8/La F?pwjqxBJի'el~v
-t GՔ
-ܤU[-!çrjccO GP)D4j7=]jjHbb H%"c*S7#DD~b) IAGvfhQWogb I;9fS%93-"~Ҕ I=jȪ7/{c{]:Cs:X IJd<fBu*^z9-CZ&Jۄt IF2)rsS	"rL;(+5 J߽N@Wti'}.i JDKA5KZ'ȡ	J6vkVn穞38>ޠC J\)?)*PZ.[P" J)yX:wHKhL
-irm KĀUiIYY;x2pbi'仭6 KʱxI
-?h@Y3' 68 KU|oO	s(Ch} La`7HO:ƈS˪ZTFm¤3-_' LjdD`O"$O!ƻZ[<! L0'_Lm_	;9AG LH{d﵇_ej
-K]D/A LvQ.=J~W@Z)ߞ MRMhuNK?FZ{z M]D`*_eVރ"<)j^ Mzfp`;EjUIfkeBb Mb6UuI5dbrB_gk m MRFhu/mgDpF[* M0*č_
-=zvA[ ME'i~N.ˠH M4";&3wC FCX M`4=wjJ N7i`V5_-(g=?|Uyr N{/Gkdz.M{ ONRZ"
-[W]Ç	w5B`p.#F-X OZD$>Qq+$@t-S6oH8j Oi:r䵈ky/$l@ d50j Omd2bf&WHr?	_D OVŒ%5#Y]hv O(V"ZG-d OG0)Ί45KA<HdYqY Pb5H|)ǯ'. Ӆ)2^z P68('x٤' _N'0x Pk&<u!Ɓ
-?1Γ{O PpX6R4/sȜJaa*O<j P<J<:=L!WAᏙR>5 PQ;1,G_ba.El+z Ppv:K2
-m^ [&aA F PHTۃlfި"*ugl˖GUaP^+t5, Q7rY"?;Hhu2rd+N: Q*tW@iHYwiY> zd Q:]%Bیy!d041+D]W/: T
- Q:C>/8Y/a Wv(SZ RTN!;AF3y?QDI RZ
-,~\f/}2X#V:> R,	/5u:7hvRN) Rg$|u孛K4֙[FgrQ Sjs'5JTʑߘB S>>#o+ҟ&u1`,)M S-_i"f0TiXd8 Sg\U 8r:Pq3 TmdS-@!β®#3`yp Ud됁`\>ǆC$\$( ULw	^Z+J>jk[ĊgA/x: U*b*S,~#vK*toq Uru\nCM O.b U3ʸ_IʠxʼI Uޱ'=w}0wDqt[=7 Uz<$Mʤ&w Vu繳z<z:+I2:_G)m7 V 8&\7$J繐l-6 Wcb8˖B@MQMw W)ֱю[ߥkD`%7|<9 W<jrjm>23P_ԛ`pk Wi99~BGF!qLx?| WɃEUo"TcC]fl X;_C="qY˩~o~|9ڟ Xw
-;|h&jPy:`ʖP6y Xȕ}0$/)'rȗ XdakJB7\ Zo$҄j:hqVN6K<΄&W* Zgپ/
-Yk@vHi<h& [e=`=Լ$id323PQ [V[uUV_Yd]h^ƣ&5 ح [MEr@_^o ^ [v\LT tmd rTU3zK [z߉	Tr ,D-d [͠OH?x#Kmi / \!ķvԞɢ-LCcw \hG3Rd)nέN271= ]ݧo(GLaV%yP0 ^L5bp+quJbe_׉ ^	t-
-eօ͢w$op@2 _1ڤ+R7}"@Ti]cFTr% _`(N~0E$_#{R皐 _RDe/T{J_^l _]~^ZI1d51UP:rx _FOI;%:4.qE/K#[|	  `5Á	fEևPRDQz4 `B]Jq<)B.p. `O'Bۖ;=*`,W( `tҊľ>iu<RU >)8JB aSrG0  ÚZ\ aH#z1Y]CxV4Tҭ ayn1@tW 9 b'."bZ( a4z2-7dv a||Y^jkцEtJ+` bg,6jJDpoyؘ!}u@~ bn$G
-^+yؗ]d[?Ë, b)J\aE>:ʧpOp鞿 bBdl6"؄''JZak b\Ny#kn)4\ c!NZ2	>'7JA+Zi` c?ek#B2cY!lu( c`}&_Wj()]].50n	 dMsѤ-X;Xu:VlC d:Mnh,'.q&g`rMZ$0O,}{ dG>z0r{~3 d^JE]/PP4lA dٷcg߱xEEC dҁuChӲnT@\c&Tlpr$օ edlkRvtL>41 ͍; f=[N(|Bg"r$i fg;՚5g$a
-.$< f\LΌTflr]hq&ks fH7&4}vy3v=h5 f(0$Ҝ?Vqc;w} f
-g3 s0z
-޼~C;8GOy gL)챛d5ӫa$t@T	'd hݧK- 2Yl3M9ٚjB heks@Td0蒎匔fƙu iZ݌eeK{`7|p%{IBki iiDe.Z7d|YDH{+Omr` iQ^0׊["OjxĽlz pHU jM$D0!Xz:n j!yR9>uuPjqV>ҭ( j?ȱK>(Q%j	}e5]c jd7M/4(=e=e)! k"hSk8j)\:pT{*? kjenpS/Ys=]X\ ko >>3׏iC1L^Y kAu0,bx5z.A5!t/ k@ ˲ V!Hݥh&qԪa#  kBwӋgo v&87lrΏ l/̽9DoK+}d:* ln5?i˝[ޝL)|^u
- l8aVDdM%)/, lMޏ&9d(crS5%R mbw(fF>eNԜ8/M m'<~8/8es'Rs mV_*R	)C7vY oS@`Z՘zA( o.W"W	gmkԌ oZEzIbևx=ժ*C oʅݝ3RZ'ZhijP? pDůT=F{qW1#L p|;rȾtړ3B·8>J pXݑ}\>tTkm=T-Q1ND p}Mz*;y}6a R qeT)4IIJy1e>]3v q{"z<[ )t8FgIEh* q`:q [Ȳ+ KVm& r9ǁ턯;iյbj rl#Rnyxz1Wk~ r
-w3Rnsx`#p slf:솕vMB踱{7"b syFP|nO_<qЋA szzd>q79[l+U s'z`dNS[dUYe}9 t^BxǚJhuJP7[ tx9"(K˽Ma/^!%T1O t6A#sb<mN"dPQRHyΟÃ ta*ݭ$]2uxVD3Q*x@> th\_IKiY#d!-PZK
-qU uB5
-$h>2_!#{g uڵe}eUe1oOp-n| u~JgtO1.jGl5߫!, vu]#Q4oaǓzáH vćF&P (l}:Lwxs vҡC{A=_nP vy D`Iy|Ú4	;~gmŜ w?sٓo^_zY4Xo1 wQCY48\M7
-Uxx}? wbo+-iuG8CM[lO=e< wh!9Xjqaj#@ wbY!7<`7bqE wD[yVZ
-j(@I	fe! wm2SFDnvu/LW?!5 x m/D6hs,t(LD#⋨ y5͢W:b28S;9 yL.4{	Y+6zǀ'D\/> yhM▓i"ϓ57's zDC@!
-`ܙR*. z.	 #7`0sWݻ"KAH z0Ӌ>$'`G58"8 {[T|?؝8ڣ {."oLe@y?0]Җ4h_sYJ {TJiaKR`?jCER {hdyR&".?¢=eJŻUM {j i nDެX\f{ {|!Fj$b5Ǯr5MK* {:Ͱ?A[;G6`= {Y, -2Τj{qJw0(7 {£Hk2IsVR1;pm {rvL/aG ܫчĐ |$\#A+-'c{+?
-pH |)YrB@p		%/(trȃC' |2Ҧ1I5Hj3.z` |h-(ʣ
-X<LvWH 2&c |n'' 3iOpaL2
-w |aHVϚNZm
-z
-U6-%- |㚽rɦg/'	.!!D |pz^)-Gz:es |Py]:B,wuMڑ`ܫk`Gu }](m%cU핌]4FHX }_RI2qlQ!.t& }` (~_3tC#|+W[<{ }D7p;`m~3rs{V }6M~IOޣh}KX7wġ }H~Dr*_%f^v }R=˥ڶ3| FFֱk ~&t3;\
-XpªrMGs ~:ێRdRqvƃ4ne&r ~ofHGDF.U2 ~4pNƎ#\{
-'q/c7# ~_i{\c8TU/ y|[pVl饆	պ q`Bv3,.aU-d xnNn!♬0ɮI]IIH5 *j)4-dY+9V͹	7
-3 09F뭩1ԱHr70˿HmO NG{zG #\r%B?aP V	.Q rGNF  zҦ#s2#rMBt(qe(5. h w$.CzWXJ71"lٕMI uWc}vM} > "z`T&oE ?2q6.= 2y4rַ-޵N m42>ϦD_^g.R]3 w\ ]UUcq۸s?VsP~ |t;zA\Pb7o{C͞ <58u^Ϡv]Y&%*WEdIB# KZΥ,%DuFGG|m-$ GRPةr{<6`NnRm KD|̠[g#>*Sٷb w&Cb珊^JKsjEw+5B+ Iƨ4r^ 0g3	>-[L 2aIJ766EXR+^ )ǻmB"x">ӳLi o3 ێ1hV1KΤ%@%YJ z,-k̟<!WrP*M~,S"z3 +),TDѓ:9n[^w$  Hu6-D)hMEh/$%  HBQ|/l>S2ȴI,)i\x C°G0}"*na#"| x+mII(VJ_IX? ti"j
-0<$fVr߆RlYH &+{k:?\dx% :-F'v"pvlmͣO>A =ڕjU[<zP_ڮxF ۃv5X'BQˀ¨jrԶ JL'Tnz`N$Y{ J \g1^a2WN% 'Yۣn]~=+1wLhBbk)|E 1l_3zBUE74#m :9pu>~qsp4$TcKz\q<O DXg.phz咢Eʜ V FAhέ_?9+<-} W`WOJgKHZʊP@md)! ǿ=Vك!1.C3Uw Ѻ_9zil}q9u ^Tněn7ʯM"R Cڴ~`7rBF! [YC?Azj';R| [ ^
-CsU'(Mr"4Ѷ5 {8y6BL.͙'T &?J{f-OYfNJ_S ^-c>)|XLłg ͛ƪDhBQtck63sJg 9,KC.ld,Os|alhCh kUG'wٷ\Җq
-k4%b 6-by]ܚ0?Ju 0Ơ^>jp#cʠҸM  :\`ж,Ii|} 
-B_B<qYݥbϡ5r/'fՋ=| ϫ3Abfmq^*L_D ڄ9u"rͽ]%?ThuƢDK K]F-skQ{HS֪$ 
-ydLKn䨏qQ- '޹P@Cx*15c&l [w۠AWu_dCQ˜B4 Y0:ݺ?@0| TJY!iH;Yނ$c# r{[Q*ZQT>q}@{W ]K`dKȜ5y XҪmڙ7wH~8_r ??,}F$I,LΕ%A Xa]U9H^ό5[*>}8 `#+OB6*xEiJVDPLF% .p_"nd; F-
-hPw͹" N@(Q<lKg؇n]բ XݓMyK.j|ѳ*V" [2t,,w&˱r q%vI[rkh(9V!i xm]S^}ڬ7yVlw# hmJl<pQ!M-'N iyM@7-=F	DSoJ ^pUWCrgdW<71hI :tWQa%a|6SZ c;K˃#(Z3e4mmI(: B('x')I^,R d$0pf ʪ:|=h뼄cG qա`Y'G^w:>$3+M1 o
-$V\#408OZŲŠXN 	[cx$ܿG@i<B Od0$1ZKU@I|äj\0Q vlNL`ǰ\
-ׅWZN{ v,p쯣wTP02 r {8X&eJi(EE. Z6#pODYS0*fMXZ $kq)uhǽ؏	ҰԊ +yMʗ&9G;J%	k`! C\w&ٻmыV/.ߏn9G L7dRZ2),dB;`o f8:p)g1)`WX)Ld n$K^䦞p$)vU w۶v\1Jyf$:S	] x9P6X|KTb)?cwL7K lbf[uy鰄67պ) {Zo6e_&1D5*{p&o UZUh8c}'|uo!e8l ޜ'b'^]`i=ren- ה t+6ːJm%AӰv CrbF6-1;b XݸQ,9`$I 8\C? <}4+m2t(=C'@(Vd 
-">sّ{E]^9J)rY ժiO0t}\盝]OE-I r:5g-~p۷/_Q'T iuJk;O;f}UKpd[ FI$qa}QJ9iY8D>e["dV Kq\E	}\7w;Йm; %{4{R?X̰L=U E6/5fe-+T1n|E\ L0>uPh4kڱn0" UD@ɛc7{o707KD%P*q ]^)RhAGj͌pqWtD,~n  @QUXȢ.iiG- &i>эbx 
-3/y= &]Jy=2PKQk2Z[Cfɮ +>jDږ1<uh<fdF Iڪ߉S;3lPw|Jgtܭ 
-YivE&tV?Ro'3{n Y?MēL[e>}#(!3 ۘqe\qBF<!rP!9y d!IUk6ĦA:DЄC }}PCjUtӝ"u}J՗t }uۻsq((<B 7Z%e$p Xv"v֝µ,Ppp[2
-VmJ ͅ%e{Ҩ)F8/$ @)pQ,8UjjRm Y'?ɬI
-:u3ߴ ZУ4:芛d=9a2QfTQ Y)K嬯WUpä9rG Te!b0U$B)g67h@TՄ ˊleѻ$h2 0+W;S ;f(!IcGe)5;Dyim [Y7q:'nSF;{&3 |H8Uz`R-,pV^	jOx ]5`$bvxbYPYU5 @S7F%f];9ҵ@!> ib D%"Jp&N$e vBe,{g6ޞmFBc~x|k] t,(s0xihb Gobjʶ'C\MN2c v{y,/B(_L%^Vgjq '
-C%C~>bY{5Էbw3i2 D7edN~2:|r&>%Se\ P:?4Ũ"V*,@^~![l&N@ yO ףJSeDDؕzc<L fNӔ^eG' v!{m #ﶗa
-H>9%DB2 em d>mb0ScGeq5L !t7ϊ(⫣:FT= RLPZzC6 3_oG蛻!Ab7 q
-_gj߻h.5^͒bB ꚿ~t0Y;]UPαb uPK8S|-EbQԠ2Wve i,fFU*q,?h=D
-G# $g2lQ5b/қ|t<R? 2M|O_yxz s%P iyE4z9I3 L `rm\&g(Kqax*ɏ;a E `kqgz_0,k P?BM-%9x{w;8=`}n Q֕oflϓp7>\"u<f U]̏m{p'";R&Z^% 1D fɷ&AetVr9h\ ˽VgBF?rn+$at 0p%3xxN,L&9ۈi uߤā0[:f0e쟋 rބhm lӴF0BL(5"*_s Н/I^&^=8QT" @֡
- [q<vxMԋ+pGzo,Q Y!^tse.-<zBU9 'dF!IL@2ObɸdBR/> Iఒ O駈d:Kh Q1(ajᖲfMK#7@]g G"O̱r#'e%[hF,{ ~jzؕorxzCcmqbI Q_;hF[c)GoL xH7||v¢3m| $쾡XxLHx]Lac[ku)hˆIh0 TE,q$o2odت&=Qdy m)<UFPHrgOZe#& nzP˳{4"76{E5)+}RO} 	~	&MzO)j2CG@do\HaI 1|n\2` sj]^rP  lƨp KAOɽݼ$NYX;Ww ŊW#lD:jǤ\t) [x!UI7*,%XzjHlfi .)'T䝷w\hPw' Vޑa`;JJZ=D:!q| 03FHWzG*lޘ.E5T P(fy(5;Ŀqܵ < 6A'6z4qkПnP $Xs.ANj<q:pMugv0fv  yzc;}2\d-A8+ )icHѷkq@?I. 1!*C-&uB@g~ 0Ti\}&M MNۤ<.iqmG}i* [$L:CWR].]M  x8Nꉴsn}v  0~B@hg)̪qe 8B`\sRFU}@uYK y7Low(|3v!"#lF Dn YoB@2ʬxrXծD E$%Q=mК= *X?݉o c-M/İPˋw`=|* 1V^l;?69d#lïsrܒZo DǇ@}kZՖlbͯ89 *.]*3vѓ/%T;v j`L2kcX%¨\].zB 8Ay#rs%f<  ܂kdovH +vbQ[2G,t׶ k [ZdFW%
-
-2JtȔ ZIy/Ht09UO\#&T3* cfbt5뒈3T!g`y@; DlW#OWN2X]h	 SKrAi]Vsyrڒ bڼoĽf/LyI,|3Uũ hwGT6:9Arɮppԭ {-<D
-[S	 Q_ MXk8i1YO36' L ٠ebvE @Kh%:\H"AGѝ0quɖQ. T@
-z7^f>c 7H)2( ŷV[a[\<=É- MYVS/`'.][ K:ni?$`S}rq * ʉT8H_PLfHXM 	şyDÕM3JO:E渎	k fj٪_qT><hF
-	H Wkudڭ2jci`` q̰fI=60eONX; ϵݰXSj$CM^Bb= i'D}	dƚTT(BK HaۑGn略|_Mtwibi- g jOz}T`Vd9dO9Z& w
-}"fv, ɵo ;/ wRpȼQ=vե `( S!ڜ(WAyΏ_\ bXGڽcN8&i  
-	-בּq+e8z6w* mhS;5+D.A~ ]r|BZ	+:uyKE]< h.<й?F]b?[׶ 0xsO!Sm2p*84|u??W #
-5 cT4S0*x-_T.)
-Χ zaV*y
- *h #|h2Mri tۣtJ ½N4A%C`6Hf5LZ|m " OĐ0v.(%:|gz8R [d#vvn;>&ߙ$(Ri b-XI@e:UKCn+5 e0I/MJ#<d;@  fJU::m#ff7w-*!te fU9g}Oi/ϐ mW,z(M&q) vͷ'c-vȴcO 4(b]8oIXKooxyH$ә 8<f
-8٩>ʕ2,A02 7<rκ.֛'"|(d *!"!gdy'>3JR=4N¾c aoTL'7^WX@/
-Lr^7F@ ~N3aϑz=`eBѭ NDWZ-;ڰcԡfm&T 7<5@<~MaD4ވRs robkU/5{ <IK
-ʐ5Nd 좆{r%!Dc̫ި }-h4FPhoK2G1,(|Rљ 
-&kMU%]0n%)/- !#1;yֽ>`wNpƟ >G~+TU3^h)^
-j !PFkU5^q"uAm~0 W:zIˆu\ŅZg Cwn# n=A=#Lάb$a 0S["UU2T:?7o9[ u9ۿSM飊dy1WD*
-_pS 늬(</
-T࿽]`̣/Tj "墜-
-`J>.> !>Y&H>g_HKIY(Tq 1V,}H#,a:DkJ {_9t~*mhȱH̱U+ ?c'0o&<VJhjc["b y}EqB[j9YV[ zc)xqA$;Fyigev]u<}% (!0C8nL4}gfIhՑޚ"L~J 3?S3u -=L*; _s9dhyoe!zё*| :Ex9U n?+tP Ayd$S࠴. s`QmGK p1<<{r?8A2i/PT4 ^Ȭk+ơ"nfR _)Alzl?.%~RB8Ri !fZSˡwd@K8E+JM .[š|7ъ@[=YS Wh4 FSR_ĭ9^_kiR dARAND׬mЁP d3ru
-_ <+ПlH_oZ9ZGm1	V.  [9%1RŎ`m<m`cO YTI>{CfUch&ep	 q̂/L+|E4YP|ۢ7 sqߏip9G{EVb E~U.O9 _K9Pe~CD[_` ă;Q9? 4"Fi>P ĴZa5"hc]18^z, r#;*ҔSXJQ N{yk_?C%
-PY_] ņJHn' %xUb"Hq2=
-g ˚lzޔ]2x}7&M+JbI /67&'k',) abMG;o:T3%m 8N )jf]`~-wѐ XHzػ#APP ~Q?Ksu9a\#4;{aoeE Ǧ#7=]=CyE0 6"qjkl. ǷS7f_
-@**(	u  &ڶYhY5x
-nO S:=~<:dX]o Q󩇶u&F'rfEE ͋ A4@%:ijI0<A b 	<Ӯ)e`0% 8e1'L d#raAT >wuMꕎԥmDjeOԎO&{ OAvϢMeBjpVGtwt[e9s dm`EK1́T/'-#{f~) sna1rqqwyQM -|L.-=ndן~n@ HXy`G;H+lsap7; hnyJLwY	ie@sCGK ʽNKAE1=G;~? ;,
-)'a;*]Q6nw  cȞY{%bG~ _UnŤ"Y 'ØLλ;R `}iB:-b>-0ׯrٹWד :3a)+>	{[&nUK**h{# zn➠<s _vsB/ ˉXٮh-ёq@bf2 ]8 ?vo०sVrQSݕu |1U}`rBRw=r6D!y ~*2o!@AikTþ"/lIw ̛o_ږjc)|l ̺4A^1sw4",2Ͽ(vB) #] _d`Is0ʩ-"&S ćZ).`״#-t4tQuɕ eN%NqSeܳ}GЉe] DR ͅ5>ֽO\$`)=K ͜uܷSCb"3Ĥ* ͡]y޸lw(e9,Cه-h ͥZ.	DUH+U`7sa |iΕiW<y(^dV REl
-V6Y|ʓ1aY7"".g .G^BFLҪw%~' @XX&<^`=DVS WSNޥ!|Z=zyn:OL ШErMd|QxUx*܊3I
-ħ' ѥ;</TbKN$ PaD" %  8Ioe] pĤIPh
-! Xki1o ,AORNza(xp ][Fp_7*!7):Z&164N /OxEϯUk̈́rC=+ QG֌zA<366^ɝ X?R% z 5mEF Ӽ&Nڲa (qq?ew:) *RI-{:@2*Wh^D !|hCvk	ŋ(~ZSֽ qwK4	]pCrc=0&= $E	c u-dڊJ s 0c"Y ?کU,reEʜX V_CϷ
-Y^_ņ`(XTBB`e 7k7wYpoZ<lOL^ ,}zꗥE.i3ݯ!C mk^Aƃ^'	;1nq  ՜	[{^TTӝ$J,d6 첩
-1 sc$Ȭ
-[W- x1B'2YT/faVߏwN6 ף^8&Uc6t?q 'xa8fylbxL_D v)0l5 e7A^ª
-#ua( Bt}og}ǞgSx t<kwۻiNF:*%=#ټ &g"BB=.6Ӟ .'D'@7n]5&u6<M 6{Í]CȞ*V\=M{ B8IBc@ȝyTIx1"3-b2 .[VS>4I3ůhcoC2 $>e#8ve%OrN 0Eب~ў}9^ByG Y5U 0/-ozAhu	m&CN* گc^CyDUwxiEIV ˲8]C,<`pVDj݀ 9ZYΉ@Xٽ[> ?|4nd~{hJW Fw Rhm 1P9˘{EJ$ ~Eb:uLtȄ!'fs[.< ێDr5La ߝ?喁 `,Y6ǟ:f|!]2  UQy -E+={{A ܺ:zp߳g"EHOYV g;.b g*A\r rJ@MSR0}>Pd ݂jcZhkͪ:&/ ]S ݴCbL9LNoș7WG f04
-6_K:+]~<;aQZ% V_D#9]U㖿՘Q4!Kc `ex>c,y|=jraIvms :.ȬNK`wtNs'_'y= FPI >~mVP15WF SVׯ4j_[&VPUҕ _( }6}J`MRl3OR.  ?!*RBLPAX5`ڳt== f}Z % +UC  FH6BSJ0J+r?U*N |z^GfiQdH-DĒB ƛ<${+^QS1	y AͪE1cBlx1f }+s0|7Lx&st AfѣbU Dw[o`ZtM TWe
-QYђI#A^ 屺xe$*ȅZ~f-N1ZCPB.; Jm B~A=Ɩ}QƓq%\{g QƸ[f"neIB忊.ˁ -\ MD&F^ȣK/KNUTo <0(5h$dm>r) J+QdMT$Ƙ hm+@}"H#:lO&I +6z\L%jQ ltt5` ֲr>ghŃB&M=_ e<я*VYK>G鏧)Mo oץ$2<ny;ENx?;9 .v32psI٘exVl$ #nUV壒ʁǺ q+	b;fToQ|3<V !8
-LDͰHKO46T`:;4 4:-'p(+x6+ qE%v
-*`UV9 >p+uNІIQñ
-gð| ~(2 ~eu
-ǢI=Iřn~L 鬇(=|I|hX58<Fe r/Qtm2pߐ
-S(\O- +؜BrtLxWx.y 4FOrʭ;P#+л ^]&M<Z79uPb2^LDtd j\b^&pf80IZk,:E [':3ȯݕ*sy]k
-0 ]*<{̈-Kt58<Vm6  tʹknrOy v_*c %۩RHM̅VݍFL# xB|x	peW'tLm(}o y	$0D֠Wѐ a"2zpaN<Ʌ؞z Ƭ|Dm۫65"CZnY qſW)? ^^wt+ꎏj$ 9\X=e@vQ]IFx!U 틮vo{6 j1fGPW DJDjh16,_4>l(mr *GaJZMٳ,&t] L!'%5ЖTxDkfc8ҦT O[ZPl'n'ܪ.f)6 Z!0o'-bsa(9 Zo%tzOz&Y%m^B2Oڇ kCC	n%7BŮ9 DHL3nO9zڣɘ,Vw .!]7.,
-?׬Y V@;fm͙y\DRYeʪ6 Dᰵ/y;Nv8TTC \MA[ZVۈOI[UM- ]v5>fuJw.DмU `?@6%mH"< zWVw<T֚jƳ:R4~ 郁VHF!J{ŮlSF Z79;VXVܽ˿+y:tQ 8K&%q"3kIF{&_ ab^(Xr:ѓ9l1 {zl!lQ PΪM*{ =Gj3O4=u:X#RD B6,o7tg02ʡiq Hfh{p,I6Y
-> .Klpq1SPg7ILtx`u :ܒ=!
-?h_;v:=%ih  A{5R pi6]4A [}PfRJVw͛W6Y N%1긁s.pdZr gH8d( \(mg b>' {0SI/{釨:;}}G6Y4 2c #N<o9Uևe]c^&Tm D(gO&hA%ſ좈w 6]_9HC۰΄TBɢ[ ܸm&:Z>^cXf5)X! B=0ǱfA=i]{~ ˹t<]o 5? f_kv|,+-Щ*V9 j:3Ea!mgE_D#oW`o 䧉"KI#&RK[ |M-ApP|k%RtY$ 0~Pq<qPrAϙsW 5$륚hC9y;Ji ȉ2̶M|e~WIٹ&|s Nx~`SXwNm׺]Jg ha\K`5-Q:m> i!oI5~$sV\qM? #[İ'k!tSWPբUᣨ $jS>3Nɡ奔
-/0  Uvll䲓dMfw' U  `޶DȫRyY#9){K~ ~	D/RWpxqh|. Xs8- v
-Cѻe؞š) Yl"0fӵ$L~o
-ݟp% d̏)Zka&=ztQo) lNbh}>q_FU"O 	E
-do4u59TWڜ 5=K3}@,#v<I* 7vi<6Пզ
-_ɴ GիTc-(ra& фyƲy?~[Sl
-?9X^QM" H!V;~XgڟTzފ y6dGL#}W:kNP$!5y ynHh.M=h,ΕbRµ 3Ťg$	2TI{/u), :xu~i8
-8t#t {a-fjHܐE8E1LF osӹh?=izgbᖎ8D: ,TIпQ5'za=_jWdR+ okʑ5Yt8[؈=8S$ ~6[XuGm:zLy R,%B!6h  J)ZF;קgBp"«
\ No newline at end of file
@@ -1,19 +1,38 @@
 import time
 import random
 import sys
+import argparse
+import itertools
 from typing import Dict
-import pandas as pd
-import os
-from urllib.parse import urlparse
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import WebDriverException, TimeoutException
 
+from driver_launch import launch_driver, release_disk_cache
+from chrome_profile import ChromeProfile
+from session import has_session, is_login_page
+from resource_blocking import ResourceBlocker
+from snapshot_extract import take_snapshot, extract_snapshot, extract_company_snapshot
+from selector_probe import wait_for_profile_ready, run_with_probing
+from js_extract import extract_profile_js, extract_company_js
+from dom_wait import wait_for_dom_settled
+from company_cache import CompanyCache
+from company_tab import switch_to_company_tab, return_from_company_tab
+from url_utils import classify_url, is_sales_navigator_url, set_site_origin, is_site_overridden, site_url
+from url_input import iter_profile_urls, InputStats
+from pipeline import SnapshotPipeline, PageSnapshot, PIPELINE_WORKERS
+from snapshot_extract import parse_snapshot
+from snapshot_archive import open_archive, archive_page
+from result_sink import open_sink, export_to_excel, completed_profile_urls
+from run_trace import RunTrace
+from selector_cascade import CascadeStats
+from page_variant import detect_variant, variant_field
+from driver_watchdog import RecyclingDriver, MAX_BROWSER_MEMORY_MB, MAX_PAGES_PER_DRIVER
+
 # ---------------------------
 # Guardrails & configuration
 # ---------------------------
@@ -23,81 +42,90 @@ PAGE_LOAD_TIMEOUT = 10
 IMPLICIT_WAIT = 2
 LINKEDIN_URL = "https://www.linkedin.com/"
 SALES_NAVIGATOR_URL = "https://www.linkedin.com/sales/"
+# "live" runs every selector through WebDriver; "snapshot" parses one page_source with lxml;
+# "js" evaluates all selectors in the page with a single execute_script call
+EXTRACTION_MODE = "live"
+# Run selectors with implicit wait 0 behind one explicit "profile rendered" wait
+PROBE_MODE = False
+# Company pages are cached on disk so shared employers are only loaded once
+COMPANY_CACHE_PATH = "company_cache.sqlite"
+COMPANY_CACHE_TTL_DAYS = 30
+# Each record is appended here as soon as it is scraped; result.xlsx is exported from it
+RESULTS_PATH = "results.jsonl"
+# Set to e.g. "snapshots.pack" to keep a compressed copy of every visited page
+SNAPSHOT_ARCHIVE_PATH = None
+# URL list: .csv (first/url column), .jsonl, .txt or .xlsx; read as a stream
+INPUT_PATH = "profiles (1).csv"
+# Per-phase timing spans of every profile visit are appended here (None to keep only the summary)
+TRACE_PATH = "trace.jsonl"
+# Selector hit rates are learned across runs; each fallback list is tried best-first
+SELECTOR_STATS_PATH = "selector_stats.json"
+# Block images, media and fonts through CDP (text and hrefs are all we read)
+BLOCK_RESOURCES = True
+
+# Exact column order of the result store and result.xlsx
+COLUMN_ORDER = [
+    "First Name", "Last Name", "Full Name", "Designation", "Current Position", "About", "Location", 
+    "Email", "Mobile No.", "Experience", "Company Name", "Company Url", 
+    "Company Website", "Company Description", "Profile Url", "Landed Url"
+]
+
+company_cache = CompanyCache(COMPANY_CACHE_PATH, COMPANY_CACHE_TTL_DAYS * 24 * 3600, namespace="test2")
+snapshot_archive = open_archive(SNAPSHOT_ARCHIVE_PATH)
+chrome_profile = ChromeProfile()
+tracer = RunTrace(TRACE_PATH)
+selector_stats = CascadeStats(SELECTOR_STATS_PATH)
+resource_blocker = ResourceBlocker(BLOCK_RESOURCES)
+# Every settle wait (the former fixed sleeps) is timed as its own span
+wait_for_dom_settled = tracer.traced("settle")(wait_for_dom_settled)
 
-def human_delay():
-    """Random delay to mimic human behavior."""
+def human_delay(wait=time.sleep) -> float:
+    """Random delay to mimic human behavior (wait does the actual waiting).
+
+    Returns the seconds spent waiting: what wait reports when it returns a
+    number (pipeline idle excludes the page loads it served), else the delay.
+    """
     delay = random.uniform(MIN_DELAY_SECONDS, MAX_DELAY_SECONDS)
     print(f"Waiting {delay:.1f} seconds...")
-    time.sleep(delay)
+    waited = wait(delay)
+    return delay if waited is None else waited
 
-def init_driver() -> webdriver.Chrome:
-    """Initialize Chrome with fallback options."""
-    chrome_options = Options()
-    
-    # Basic options that usually work
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    
-    # Try different approaches in order of preference
-    approaches = [
-        {
-            "name": "temporary profile", 
-            "options": [
-                f"--user-data-dir={os.getcwd()}\\temp_chrome_profile",
-                "--profile-directory=Default"
-            ]
-        },
-        {
-            "name": "default",
-            "options": []
-        }
-    ]
-    
-    for approach in approaches:
-        try:
-            print(f"Trying to start Chrome with {approach['name']}...")
-            
-            # Create fresh options for each attempt
-            options = Options()
-            options.add_argument("--start-maximized")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            
-            # Add approach-specific options
-            for arg in approach["options"]:
-                options.add_argument(arg)
-            
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-            driver.implicitly_wait(IMPLICIT_WAIT)
-            
-            # Test if driver works
-            driver.get("https://www.google.com")
-            print(f"Successfully started Chrome with {approach['name']}")
-            return driver
-            
-        except WebDriverException as e:
-            print(f"Failed with {approach['name']}: {str(e)[:100]}...")
-            if 'driver' in locals():
-                try:
-                    driver.quit()
-                except:
-                    pass
-            continue
-    
+def init_driver(headless: bool = False, exit_on_failure: bool = True) -> webdriver.Chrome:
+    """Start Chrome, trying the launch approach that last worked on this host first.
+
+    With exit_on_failure=False (standby browsers) a failed start returns None.
+    """
+    profile_dir = chrome_profile.materialize()
+    driver = launch_driver(PAGE_LOAD_TIMEOUT, IMPLICIT_WAIT, headless=headless, performance_log=True,
+                           user_data_dir=profile_dir)
+    if driver is not None:
+        driver.profile_dir = profile_dir
+        restored = chrome_profile.restore_cookies(driver)
+        if restored:
+            print(f"Restored {restored} saved session cookies")
+        return driver
+
+    chrome_profile.cleanup(profile_dir)
+    if not exit_on_failure:
+        return None
     print("All Chrome startup approaches failed. Please try:")
     print("1. Close all Chrome windows completely")
     print("2. Check if ChromeDriver is installed and in PATH")
     print("3. Update Chrome and ChromeDriver to compatible versions")
     sys.exit(1)
 
+def close_driver(driver):
+    """Save the session cookies, quit Chrome and remove its runtime profile."""
+    try:
+        chrome_profile.save_cookies(driver)
+        driver.quit()
+    except Exception as e:
+        # A dead chromedriver fails with connection errors, not WebDriverException
+        print(f"   ⚠️ Browser did not quit cleanly: {e}")
+    finally:
+        chrome_profile.cleanup(driver.profile_dir)
+        release_disk_cache(driver)
+
 def safe_text(element):
     """Safely extract text from an element"""
     try:
@@ -105,11 +133,6 @@ def safe_text(element):
     except:
         return ""
 
-def is_sales_navigator_url(url: str) -> bool:
-    """Check if the URL is a Sales Navigator URL."""
-    parsed_url = urlparse(url)
-    return "sales" in parsed_url.netloc or "sales" in parsed_url.path
-
 def wait_for_manual_login(driver, is_sales_navigator: bool = False):
     """Wait for user to manually log in to LinkedIn or Sales Navigator."""
     target_url = SALES_NAVIGATOR_URL if is_sales_navigator else LINKEDIN_URL
@@ -121,10 +144,33 @@ def wait_for_manual_login(driver, is_sales_navigator: bool = False):
     print(f"2. Navigate to {'Sales Navigator homepage' if is_sales_navigator else 'LinkedIn homepage'}")
     print("3. Come back here and press ENTER when ready")
     print("="*60)
-    driver.get(target_url)
+    driver.get(site_url(target_url))
     input("Press ENTER after you've logged in... ")
+    # Persist the new session now, so it survives a crash before the run ends
+    chrome_profile.save_cookies(driver)
     print("Continuing with profile scraping...\n")
 
+def ensure_logged_in(driver, url: str, logged_in: set):
+    """Reuse the stored session of url's platform, or prompt for a manual login the first time it is needed."""
+    is_sales_navigator = is_sales_navigator_url(url)
+    if is_sales_navigator not in logged_in:
+        # A local stand-in site needs no login
+        if is_site_overridden():
+            pass
+        elif has_session(driver, is_sales_navigator):
+            print(f"Reusing the stored {'Sales Navigator' if is_sales_navigator else 'LinkedIn'} session")
+        else:
+            wait_for_manual_login(driver, is_sales_navigator)
+        logged_in.add(is_sales_navigator)
+
+def recover_session(driver, url: str):
+    """Log in again and reload url when the stored session turned out to be expired."""
+    if is_login_page(driver):
+        print("Session expired; a manual login is needed")
+        wait_for_manual_login(driver, is_sales_navigator_url(url))
+        driver.get(site_url(url))
+
+@tracer.traced("about")
 def extract_about_section(driver, is_sales_navigator: bool = False) -> str:
     """Extract the About section text, handling expansion if needed."""
     about_text = ""
@@ -140,14 +186,15 @@ def extract_about_section(driver, is_sales_navigator: bool = False) -> str:
                 "button:contains('Show more')"
             ]
             clicked = False
-            for selector in show_more_selectors:
+            for selector in selector_stats.cascade("sales_navigator.about_show_more", show_more_selectors):
                 try:
                     btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if btn.is_displayed():
                         driver.execute_script("arguments[0].click();", btn)
-                        time.sleep(1)
+                        wait_for_dom_settled(driver, "main", cap_seconds=1)
                         clicked = True
                         print("   → Clicked 'Show more' in Sales Navigator About section")
+                        selector_stats.hit("sales_navigator.about_show_more", selector)
                         break
                 except:
                     continue
@@ -193,14 +240,15 @@ def extract_about_section(driver, is_sales_navigator: bool = False) -> str:
                 "a:contains('see more')"
             ]
             clicked = False
-            for selector in show_more_selectors:
+            for selector in selector_stats.cascade("linkedin.about_see_more", show_more_selectors):
                 try:
                     btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if btn.is_displayed():
                         driver.execute_script("arguments[0].click();", btn)
-                        time.sleep(1)
+                        wait_for_dom_settled(driver, "main", cap_seconds=1)
                         clicked = True
                         print("   → Clicked 'see more' in LinkedIn About section")
+                        selector_stats.hit("linkedin.about_see_more", selector)
                         break
                 except:
                     continue
@@ -214,12 +262,13 @@ def extract_about_section(driver, is_sales_navigator: bool = False) -> str:
                 "div.qmdGMKYuIypnxyEHNTIvfxuATDBMXQom span[aria-hidden='true']",
                 "div.FwOlsjQqkKryZHlZOACWZtVIHRMuhoM span"
             ]
-            for selector in text_selectors:
+            for selector in selector_stats.cascade("linkedin.about_text", text_selectors):
                 try:
                     elem = driver.find_element(By.CSS_SELECTOR, selector)
                     text = safe_text(elem)
                     if text and len(text) > 20:
                         about_text = text
+                        selector_stats.hit("linkedin.about_text", selector)
                         break
                 except:
                     continue
@@ -243,9 +292,41 @@ def extract_about_section(driver, is_sales_navigator: bool = False) -> str:
     
     return about_text
 
-def scrape_company_info(driver, company_url: str) -> tuple:
+@tracer.traced("company")
+def scrape_company_info(driver, company_url: str, run_in_browser=None) -> tuple:
     """
-    Navigate to company URL and extract company name, website, and description information.
+    Return company name, website and description, from the company cache when possible.
+    On a miss the page is loaded through run_in_browser when called off the browser thread.
+    Returns tuple: (company_name, website_url, company_description)
+    """
+    if not company_url:
+        return "", "", ""
+
+    def fetch():
+        # Load the company in its own tab so the profile tab never needs a reload
+        with tracer.span("company_hop"):
+            profile_handle = switch_to_company_tab(driver)
+            try:
+                company_name, website_url, company_description = fetch_company_info(driver, company_url)
+            finally:
+                return_from_company_tab(driver, profile_handle)
+        if not (company_name or website_url or company_description):
+            return None
+        return {"name": company_name, "website": website_url, "description": company_description}
+
+    if run_in_browser is not None:
+        company, from_cache = company_cache.get_or_fetch(company_url, lambda: run_in_browser(fetch))
+    else:
+        company, from_cache = company_cache.get_or_fetch(company_url, fetch)
+    if company is None:
+        return "", "", ""
+    if from_cache:
+        print(f"   ✅ Company from cache: {company.get('name', '')}")
+    return company.get("name", ""), company.get("website", ""), company.get("description", "")
+
+def fetch_company_info(driver, company_url: str) -> tuple:
+    """
+    Navigate the current tab to company URL and extract company name, website, and description information.
     Returns tuple: (company_name, website_url, company_description)
     """
     if not company_url:
@@ -254,19 +335,29 @@ def scrape_company_info(driver, company_url: str) -> tuple:
     try:
         print(f"   → Scraping company info from: {company_url}")
         
-        # Store current URL to return later
-        current_url = driver.current_url
-        
         # Navigate to company page
-        driver.get(company_url)
+        resource_blocker.before_load(driver, company_url)
+        driver.get(site_url(company_url))
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "main"))
         )
-        time.sleep(2)
+        wait_for_dom_settled(driver, "main", cap_seconds=2)
+        resource_blocker.after_load(driver)
+        archive_page(snapshot_archive, driver, company_url)
+        
+        if EXTRACTION_MODE in ("snapshot", "js"):
+            if EXTRACTION_MODE == "js":
+                company_name, website_url, company_description = extract_company_js(driver, company_url)
+            else:
+                company_name, website_url, company_description = extract_company_snapshot(take_snapshot(driver), company_url)
+            print(f"   ✅ Company from {EXTRACTION_MODE}: {company_name} | {website_url}")
+            return company_name, website_url, company_description
         
         company_name = ""
         website_url = ""
         company_description = ""
+        # LinkedIn and Sales Navigator company pages keep separate selector stats
+        kind = classify_url(company_url).kind
         
         # Extract company name from h1 element
         company_name_selectors = [
@@ -276,12 +367,13 @@ def scrape_company_info(driver, company_url: str) -> tuple:
             "h1"  # Fallback to any h1
         ]
         
-        for selector in company_name_selectors:
+        for selector in selector_stats.cascade(f"{kind}.name", company_name_selectors):
             try:
                 company_name_elem = driver.find_element(By.CSS_SELECTOR, selector)
                 company_name = safe_text(company_name_elem)
                 if company_name:
                     print(f"   ✅ Found company name: {company_name}")
+                    selector_stats.hit(f"{kind}.name", selector)
                     break
             except:
                 continue
@@ -297,7 +389,7 @@ def scrape_company_info(driver, company_url: str) -> tuple:
             "a[href^='www.']"
         ]
         
-        for selector in website_selectors:
+        for selector in selector_stats.cascade(f"{kind}.website", website_selectors):
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 for element in elements:
@@ -306,6 +398,7 @@ def scrape_company_info(driver, company_url: str) -> tuple:
                         if href.startswith('http'):
                             website_url = href
                             print(f"   ✅ Found website: {website_url}")
+                            selector_stats.hit(f"{kind}.website", selector)
                             break
                 if website_url:
                     break
@@ -327,13 +420,14 @@ def scrape_company_info(driver, company_url: str) -> tuple:
                     "button:contains('Show more')"
                 ]
                 
-                for btn_sel in show_more_selectors:
+                for btn_sel in selector_stats.cascade("sales_navigator.company_show_more", show_more_selectors):
                     try:
                         show_more_btn = driver.find_element(By.CSS_SELECTOR, btn_sel)
                         if show_more_btn.is_displayed():
                             driver.execute_script("arguments[0].click();", show_more_btn)
-                            time.sleep(1)
+                            wait_for_dom_settled(driver, "main", cap_seconds=1)
                             print("   → Clicked 'Show more' button for Sales Navigator description")
+                            selector_stats.hit("sales_navigator.company_show_more", btn_sel)
                             break
                     except:
                         continue
@@ -346,13 +440,14 @@ def scrape_company_info(driver, company_url: str) -> tuple:
                     ".pb1 p[data-anonymize='company-blurb']"  # More specific
                 ]
                 
-                for selector in sales_nav_desc_selectors:
+                for selector in selector_stats.cascade("sales_navigator.company_description", sales_nav_desc_selectors):
                     try:
                         desc_elem = driver.find_element(By.CSS_SELECTOR, selector)
                         desc_text = safe_text(desc_elem)
                         if desc_text and len(desc_text.strip()) > 20:
                             company_description = desc_text.strip()
                             print(f"   ✅ Found Sales Navigator description: {company_description[:100]}...")
+                            selector_stats.hit("sales_navigator.company_description", selector)
                             break
                     except:
                         continue
@@ -370,13 +465,14 @@ def scrape_company_info(driver, company_url: str) -> tuple:
                     "button[aria-label*='See more details']"
                 ]
                 
-                for btn_sel in see_more_selectors:
+                for btn_sel in selector_stats.cascade("company.see_more", see_more_selectors):
                     try:
                         see_more_btn = driver.find_element(By.CSS_SELECTOR, btn_sel)
                         if see_more_btn.is_displayed():
                             driver.execute_script("arguments[0].click();", see_more_btn)
-                            time.sleep(1)
+                            wait_for_dom_settled(driver, "main", cap_seconds=1)
                             print("   → Clicked 'see more' button for LinkedIn description")
+                            selector_stats.hit("company.see_more", btn_sel)
                             break
                     except:
                         continue
@@ -390,13 +486,14 @@ def scrape_company_info(driver, company_url: str) -> tuple:
                     ".organization-about-module__content-consistant-cards-description"  # Container fallback
                 ]
                 
-                for selector in linkedin_desc_selectors:
+                for selector in selector_stats.cascade("company.description", linkedin_desc_selectors):
                     try:
                         desc_elem = driver.find_element(By.CSS_SELECTOR, selector)
                         desc_text = safe_text(desc_elem)
                         if desc_text and len(desc_text.strip()) > 20:
                             company_description = desc_text.strip()
                             print(f"   ✅ Found LinkedIn description: {company_description[:100]}...")
+                            selector_stats.hit("company.description", selector)
                             break
                     except:
                         continue
@@ -408,7 +505,7 @@ def scrape_company_info(driver, company_url: str) -> tuple:
                         ".organization-about-module__content-consistant-cards-description span"
                     ]
                     
-                    for selector in truncated_selectors:
+                    for selector in selector_stats.cascade("company.description_lines", truncated_selectors):
                         try:
                             desc_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                             if desc_elements:
@@ -417,6 +514,7 @@ def scrape_company_info(driver, company_url: str) -> tuple:
                                 if combined_text and len(combined_text.strip()) > 20:
                                     company_description = combined_text.strip()
                                     print(f"   ✅ Found LinkedIn description (truncated): {company_description[:100]}...")
+                                    selector_stats.hit("company.description_lines", selector)
                                     break
                         except:
                             continue
@@ -437,7 +535,7 @@ def scrape_company_info(driver, company_url: str) -> tuple:
                     "[data-test='company-about-us'] p"
                 ]
                 
-                for selector in fallback_selectors:
+                for selector in selector_stats.cascade(f"{kind}.description_fallback", fallback_selectors):
                     try:
                         desc_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                         for desc_elem in desc_elements:
@@ -445,6 +543,7 @@ def scrape_company_info(driver, company_url: str) -> tuple:
                             if desc_text and len(desc_text.strip()) > 20:
                                 company_description = desc_text.strip()
                                 print(f"   ✅ Found description with fallback: {company_description[:100]}...")
+                                selector_stats.hit(f"{kind}.description_fallback", selector)
                                 break
                         if company_description:
                             break
@@ -453,18 +552,13 @@ def scrape_company_info(driver, company_url: str) -> tuple:
             except:
                 pass
         
-        # Navigate back to original page
-        driver.get(current_url)
         return company_name, website_url, company_description
         
     except Exception as e:
         print(f"   ❌ Error scraping company info: {str(e)}")
-        try:
-            driver.get(current_url)
-        except:
-            pass
         return "", "", ""
 
+@tracer.traced("first_company")
 def extract_first_company_info(driver, is_sales_navigator: bool = False) -> Dict[str, str]:
     """
     Extract all experience information and first company details.
@@ -601,11 +695,12 @@ def extract_first_company_info(driver, is_sales_navigator: bool = False) -> Dict
                         "span.t-bold span[aria-hidden='true']",
                         ".display-flex.align-items-center .t-bold span[aria-hidden='true']"
                     ]
-                    for role_sel in role_selectors:
+                    for role_sel in selector_stats.cascade("linkedin.experience_role", role_selectors):
                         try:
                             role_elem = item.find_element(By.CSS_SELECTOR, role_sel)
                             role = safe_text(role_elem)
                             if role and len(role) > 1:
+                                selector_stats.hit("linkedin.experience_role", role_sel)
                                 break
                         except:
                             continue
@@ -616,13 +711,14 @@ def extract_first_company_info(driver, is_sales_navigator: bool = False) -> Dict
                         "span.t-14.t-normal span[aria-hidden='true']",
                         ".t-14.t-normal span[aria-hidden='true']"
                     ]
-                    for comp_sel in company_selectors:
+                    for comp_sel in selector_stats.cascade("linkedin.experience_company", company_selectors):
                         try:
                             comp_elem = item.find_element(By.CSS_SELECTOR, comp_sel)
                             comp_text = safe_text(comp_elem)
                             # Filter out duration info (contains "·" or time indicators)
                             if comp_text and "·" not in comp_text and "yr" not in comp_text and "mo" not in comp_text and "Present" not in comp_text:
                                 company_name = comp_text
+                                selector_stats.hit("linkedin.experience_company", comp_sel)
                                 break
                         except:
                             continue
@@ -633,13 +729,14 @@ def extract_first_company_info(driver, is_sales_navigator: bool = False) -> Dict
                         "span.pvs-entity__caption-wrapper[aria-hidden='true']",
                         ".t-14.t-normal.t-black--light span[aria-hidden='true']"
                     ]
-                    for dur_sel in duration_selectors:
+                    for dur_sel in selector_stats.cascade("linkedin.experience_duration", duration_selectors):
                         try:
                             dur_elem = item.find_element(By.CSS_SELECTOR, dur_sel)
                             duration_text = safe_text(dur_elem)
                             # Look for time-related text
                             if duration_text and any(keyword in duration_text for keyword in ["yr", "mo", "Present", "–", "-"]):
                                 duration = duration_text
+                                selector_stats.hit("linkedin.experience_duration", dur_sel)
                                 break
                         except:
                             continue
@@ -685,12 +782,13 @@ def extract_first_company_info(driver, is_sales_navigator: bool = False) -> Dict
                                 "a[href*='/company/']",
                                 "a.optional-action-target-wrapper[href*='/company/']"
                             ]
-                            for link_sel in company_link_selectors:
+                            for link_sel in selector_stats.cascade("linkedin.experience_company_link", company_link_selectors):
                                 try:
                                     company_link_elem = item.find_element(By.CSS_SELECTOR, link_sel)
                                     first_company_url = company_link_elem.get_attribute("href")
                                     if first_company_url:
                                         company_info["Company Url"] = first_company_url
+                                        selector_stats.hit("linkedin.experience_company_link", link_sel)
                                         break
                                 except:
                                     continue
@@ -738,7 +836,7 @@ def extract_first_company_info(driver, is_sales_navigator: bool = False) -> Dict
     
     return company_info
 
-def extract_linkedin_profile(driver) -> Dict[str, str]:
+def extract_linkedin_profile(driver, variant: str = None) -> Dict[str, str]:
     """Extract basic LinkedIn profile information."""
     data = {
         "First Name": "",
@@ -758,6 +856,17 @@ def extract_linkedin_profile(driver) -> Dict[str, str]:
         "Profile Url": driver.current_url
     }
 
+    # Top card: one lookup per field for a recognised layout, the cascade otherwise
+    # (variant comes from page_variant.detect_variant; None means unrecognised)
+    full_name = variant_field(driver, variant, "name")
+    if full_name:
+        data["Full Name"] = full_name
+        name_parts = full_name.split(" ", 1)
+        data["First Name"] = name_parts[0]
+        data["Last Name"] = name_parts[1] if len(name_parts) > 1 else ""
+    data["Designation"] = variant_field(driver, variant, "headline")
+    data["Location"] = variant_field(driver, variant, "location")
+
     # Extract name
     name_selectors = [
         "h1",
@@ -765,18 +874,20 @@ def extract_linkedin_profile(driver) -> Dict[str, str]:
         "h1.text-heading-xlarge"
     ]
     
-    for selector in name_selectors:
-        try:
-            name_elem = driver.find_element(By.CSS_SELECTOR, selector)
-            full_name = safe_text(name_elem)
-            if full_name and len(full_name) > 1:
-                data["Full Name"] = full_name
-                name_parts = full_name.split(" ", 1)
-                data["First Name"] = name_parts[0]
-                data["Last Name"] = name_parts[1] if len(name_parts) > 1 else ""
-                break
-        except:
-            continue
+    if not data["Full Name"]:
+        for selector in selector_stats.cascade("linkedin.name", name_selectors):
+            try:
+                name_elem = driver.find_element(By.CSS_SELECTOR, selector)
+                full_name = safe_text(name_elem)
+                if full_name and len(full_name) > 1:
+                    data["Full Name"] = full_name
+                    name_parts = full_name.split(" ", 1)
+                    data["First Name"] = name_parts[0]
+                    data["Last Name"] = name_parts[1] if len(name_parts) > 1 else ""
+                    selector_stats.hit("linkedin.name", selector)
+                    break
+            except:
+                continue
 
     # Extract headline (designation)
     headline_selectors = [
@@ -785,15 +896,17 @@ def extract_linkedin_profile(driver) -> Dict[str, str]:
         ".pv-text-details__left-panel .text-body-medium"
     ]
     
-    for selector in headline_selectors:
-        try:
-            headline_elem = driver.find_element(By.CSS_SELECTOR, selector)
-            designation = safe_text(headline_elem)
-            if designation and len(designation) > 1:
-                data["Designation"] = designation
-                break
-        except:
-            continue
+    if not data["Designation"]:
+        for selector in selector_stats.cascade("linkedin.headline", headline_selectors):
+            try:
+                headline_elem = driver.find_element(By.CSS_SELECTOR, selector)
+                designation = safe_text(headline_elem)
+                if designation and len(designation) > 1:
+                    data["Designation"] = designation
+                    selector_stats.hit("linkedin.headline", selector)
+                    break
+            except:
+                continue
 
     # Extract location
     location_selectors = [
@@ -802,15 +915,17 @@ def extract_linkedin_profile(driver) -> Dict[str, str]:
         "div.ph5 span.text-body-small"
     ]
     
-    for selector in location_selectors:
-        try:
-            location_elem = driver.find_element(By.CSS_SELECTOR, selector)
-            location = safe_text(location_elem)
-            if location and len(location) > 1:
-                data["Location"] = location
-                break
-        except:
-            continue
+    if not data["Location"]:
+        for selector in selector_stats.cascade("linkedin.location", location_selectors):
+            try:
+                location_elem = driver.find_element(By.CSS_SELECTOR, selector)
+                location = safe_text(location_elem)
+                if location and len(location) > 1:
+                    data["Location"] = location
+                    selector_stats.hit("linkedin.location", selector)
+                    break
+            except:
+                continue
 
     # Extract contact info
     # contact_info = extract_contact_info(driver)
@@ -841,7 +956,7 @@ def extract_linkedin_profile(driver) -> Dict[str, str]:
     data["About"] = extract_about_section(driver, is_sales_navigator=False)
     return data
 
-def extract_sales_navigator_profile(driver) -> Dict[str, str]:
+def extract_sales_navigator_profile(driver, variant: str = None) -> Dict[str, str]:
     """Extract Sales Navigator profile information."""
     data = {
         "First Name": "",
@@ -861,6 +976,17 @@ def extract_sales_navigator_profile(driver) -> Dict[str, str]:
         "Profile Url": driver.current_url
     }
 
+    # Top card: one lookup per field for a recognised layout, the cascade otherwise
+    # (variant comes from page_variant.detect_variant; None means unrecognised)
+    full_name = variant_field(driver, variant, "name")
+    if full_name:
+        data["Full Name"] = full_name
+        name_parts = full_name.split(" ", 1)
+        data["First Name"] = name_parts[0]
+        data["Last Name"] = name_parts[1] if len(name_parts) > 1 else ""
+    data["Designation"] = variant_field(driver, variant, "headline")
+    data["Location"] = variant_field(driver, variant, "location")
+
     # Extract name
     name_selectors = [
         "#profile-card-section section:first-child div:first-child div:nth-child(2) h1",
@@ -868,23 +994,25 @@ def extract_sales_navigator_profile(driver) -> Dict[str, str]:
         "h1.profile-topcard-person__name",
         "#profile-card-section h1"
     ]
-    for selector in name_selectors:
-        try:
-            if selector.startswith("#profile-card-section section"):
-                xpath = "//*[@id='profile-card-section']/section[1]/div[1]/div[2]/h1"
-                name_elem = driver.find_element(By.XPATH, xpath)
-            else:
-                name_elem = driver.find_element(By.CSS_SELECTOR, selector)
+    if not data["Full Name"]:
+        for selector in selector_stats.cascade("sales_navigator.name", name_selectors):
+            try:
+                if selector.startswith("#profile-card-section section"):
+                    xpath = "//*[@id='profile-card-section']/section[1]/div[1]/div[2]/h1"
+                    name_elem = driver.find_element(By.XPATH, xpath)
+                else:
+                    name_elem = driver.find_element(By.CSS_SELECTOR, selector)
             
-            full_name = safe_text(name_elem)
-            if full_name and len(full_name) > 1:
-                data["Full Name"] = full_name
-                name_parts = full_name.split(" ", 1)
-                data["First Name"] = name_parts[0]
-                data["Last Name"] = name_parts[1] if len(name_parts) > 1 else ""
-                break
-        except:
-            continue
+                full_name = safe_text(name_elem)
+                if full_name and len(full_name) > 1:
+                    data["Full Name"] = full_name
+                    name_parts = full_name.split(" ", 1)
+                    data["First Name"] = name_parts[0]
+                    data["Last Name"] = name_parts[1] if len(name_parts) > 1 else ""
+                    selector_stats.hit("sales_navigator.name", selector)
+                    break
+            except:
+                continue
 
     # Extract current position
     try:
@@ -914,42 +1042,46 @@ def extract_sales_navigator_profile(driver) -> Dict[str, str]:
         "[data-anonymize='headline']",
         "#profile-card-section section:first-child div:first-child div:nth-child(3)"  # XPath approximation
     ]
-    for selector in headline_selectors:
-        try:
-            if selector.startswith("#profile-card-section section"):
-                # Use explicit XPath for headline
-                xpath = "//*[@id='profile-card-section']/section[1]/div[1]/div[3]"
-                headline_elem = driver.find_element(By.XPATH, xpath)
-            else:
-                headline_elem = driver.find_element(By.CSS_SELECTOR, selector)
+    if not data["Designation"]:
+        for selector in selector_stats.cascade("sales_navigator.headline", headline_selectors):
+            try:
+                if selector.startswith("#profile-card-section section"):
+                    # Use explicit XPath for headline
+                    xpath = "//*[@id='profile-card-section']/section[1]/div[1]/div[3]"
+                    headline_elem = driver.find_element(By.XPATH, xpath)
+                else:
+                    headline_elem = driver.find_element(By.CSS_SELECTOR, selector)
             
-            designation = safe_text(headline_elem)
-            if designation and len(designation) > 1:
-                data["Designation"] = designation
-                print(f"   Headline found with selector: {selector}")
-                break
-        except Exception as e:
-            continue
+                designation = safe_text(headline_elem)
+                if designation and len(designation) > 1:
+                    data["Designation"] = designation
+                    print(f"   Headline found with selector: {selector}")
+                    selector_stats.hit("sales_navigator.headline", selector)
+                    break
+            except Exception as e:
+                continue
 
     # Extract location
     location_selectors = [
         ".profile-topcard__location",
         ".profile-topcard-person__location"
     ]
-    for selector in location_selectors:
-        try:
-            if selector.startswith("#profile-card-section section"):
-                xpath = "//*[@id='profile-card-section']/section[1]/div[1]/div[4]"
-                location_elem = driver.find_element(By.XPATH, xpath)
-            else:
-                location_elem = driver.find_element(By.CSS_SELECTOR, selector)
+    if not data["Location"]:
+        for selector in selector_stats.cascade("sales_navigator.location", location_selectors):
+            try:
+                if selector.startswith("#profile-card-section section"):
+                    xpath = "//*[@id='profile-card-section']/section[1]/div[1]/div[4]"
+                    location_elem = driver.find_element(By.XPATH, xpath)
+                else:
+                    location_elem = driver.find_element(By.CSS_SELECTOR, selector)
             
-            location = safe_text(location_elem)
-            if location and len(location) > 1:
-                data["Location"] = location
-                break
-        except:
-            continue
+                location = safe_text(location_elem)
+                if location and len(location) > 1:
+                    data["Location"] = location
+                    selector_stats.hit("sales_navigator.location", selector)
+                    break
+            except:
+                continue
 
 
     data["About"] = extract_about_section(driver, is_sales_navigator=True)
@@ -988,11 +1120,12 @@ def extract_sales_navigator_profile(driver) -> Dict[str, str]:
                 "h2._bodyText_1e5nen._default_1i6ulk._sizeMedium_1e5nen._weightBold_1e5nen"
             ]
             role = ""
-            for role_sel in role_selectors:
+            for role_sel in selector_stats.cascade("sales_navigator.experience_role", role_selectors):
                 try:
                     role_elem = first_item.find_element(By.CSS_SELECTOR, role_sel)
                     role = safe_text(role_elem)
                     if role:
+                        selector_stats.hit("sales_navigator.experience_role", role_sel)
                         break
                 except:
                     continue
@@ -1003,29 +1136,112 @@ def extract_sales_navigator_profile(driver) -> Dict[str, str]:
 
     return data
 
-def visit_profile(driver, url: str) -> Dict[str, str]:
-    """Visit a LinkedIn or Sales Navigator profile and extract data."""
+def extract_profile_snapshot(driver, url: str) -> Dict[str, str]:
+    """Extract a profile from a single page_source snapshot, then visit its first company."""
+    profile = extract_snapshot(take_snapshot(driver), driver.current_url, is_sales_navigator_url(url))
+    if profile["Experience"]:
+        print(f"   ✅ Experience entries from snapshot: {len(profile['Experience'].splitlines())}")
+    return add_first_company_info(driver, profile)
+
+def extract_profile_with_js(driver, url: str) -> Dict[str, str]:
+    """Extract a profile with one in-page JavaScript call, then visit its first company."""
+    result = extract_profile_js(driver, is_sales_navigator_url(url))
+    profile = result["profile"]
+    print(f"   ✅ Experience entries from JS extractor: {len(result['experience'])}")
+    return add_first_company_info(driver, profile)
+
+def add_first_company_info(driver, profile: Dict[str, str], run_in_browser=None) -> Dict[str, str]:
+    """Fill Company Name/Website/Description from the profile's first company page."""
+    if profile["Company Url"]:
+        print(f"   → Processing first company: {profile['Company Url']}")
+        company_name, website, description = scrape_company_info(driver, profile["Company Url"], run_in_browser)
+        if company_name:
+            profile["Company Name"] = company_name
+        if website:
+            profile["Company Website"] = website
+        if description:
+            profile["Company Description"] = description
+    else:
+        print("   ⚠️ No company URL found for first experience")
+    return profile
+
+def extract_profile(driver, url: str) -> Dict[str, str]:
+    """Run the extractor that matches the URL type and extraction mode."""
+    if EXTRACTION_MODE == "snapshot":
+        print("Processing from page snapshot...")
+        return extract_profile_snapshot(driver, url)
+    if EXTRACTION_MODE == "js":
+        print("Processing with in-page JavaScript extractor...")
+        return extract_profile_with_js(driver, url)
+    variant = detect_variant(driver)
+    print(f"Page variant: {variant or 'unknown (full selector cascades)'}")
+    if is_sales_navigator_url(url):
+        print("Processing as Sales Navigator profile...")
+        return extract_sales_navigator_profile(driver, variant)
+    print("Processing as LinkedIn profile...")
+    return extract_linkedin_profile(driver, variant)
+
+def load_profile_page(driver, url: str) -> str:
+    """Navigate to a profile and wait for it to settle. Returns an error message or ""."""
     print(f"Visiting: {url}")
     
     try:
-        driver.get(url)
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "main"))
-        )
-        time.sleep(3)
+        with tracer.span("navigation"):
+            resource_blocker.before_load(driver, url)
+            driver.get(site_url(url))
+            recover_session(driver, url)
+        with tracer.span("ready_wait"):
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.TAG_NAME, "main"))
+            )
+        wait_for_dom_settled(driver, "main", cap_seconds=3)
+        resource_blocker.after_load(driver)
     except TimeoutException:
         print("Page load timeout; continuing with extraction...")
     except Exception as e:
         print(f"Error loading page: {e}")
-        return {"error": str(e), "Profile Url": url}
+        return str(e)
+    return ""
 
-    if is_sales_navigator_url(url):
-        print("Processing as Sales Navigator profile...")
-        profile = extract_sales_navigator_profile(driver)
+def visit_profile(driver, url: str) -> Dict[str, str]:
+    """Visit a LinkedIn or Sales Navigator profile and extract data."""
+    error = load_profile_page(driver, url)
+    if error:
+        return {"error": error, "Profile Url": url}
+    with tracer.span("archive"):
+        archive_page(snapshot_archive, driver, url)
+
+    if PROBE_MODE:
+        with tracer.span("ready_wait"):
+            wait_for_profile_ready(driver, is_sales_navigator_url(url))
+        with tracer.span("extract"):
+            profile, _ = run_with_probing(driver, lambda d: extract_profile(d, url), IMPLICIT_WAIT)
     else:
-        print("Processing as LinkedIn profile...")
-        profile = extract_linkedin_profile(driver)
+        with tracer.span("extract"):
+            profile = extract_profile(driver, url)
+
+    report_profile(profile)
+    return profile
 
+def process_profile_snapshot(driver, snapshot: PageSnapshot, run_in_browser) -> Dict[str, str]:
+    """Pipeline worker: extract a captured profile and add its first company.
+
+    Runs off the browser thread; the driver is only used through run_in_browser.
+    """
+    try:
+        with tracer.profile(snapshot.url, phase="process"):
+            with tracer.span("extract"):
+                tree = parse_snapshot(snapshot.page_source, snapshot.page_url)
+                profile = extract_snapshot(tree, snapshot.page_url, is_sales_navigator_url(snapshot.url))
+            profile = add_first_company_info(driver, profile, run_in_browser)
+        report_profile(profile)
+        return ordered_record(profile, snapshot.url)
+    except Exception as e:
+        print(f"Error processing {snapshot.url}: {e}")
+        return error_record(snapshot.url, e)
+
+def report_profile(profile: Dict[str, str]):
+    """Print the headline fields of an extracted profile."""
     print(f"Extracted: {profile['Full Name']} - {profile['Designation'][:50]}...")
     if profile.get('Email'):
         print(f"Email: {profile['Email']}")
@@ -1033,113 +1249,182 @@ def visit_profile(driver, url: str) -> Dict[str, str]:
         print(f"Phone: {profile['Mobile No.']}")
     if profile.get('Company Website'):
         print(f"Company Website: {profile['Company Website']}")
-    
-    return profile
+
+def ordered_record(profile: Dict[str, str], url: str) -> Dict[str, str]:
+    """Ensure all columns exist in profile with correct order.
+
+    Profile Url is the input URL, the resume key that error records and the
+    input dedup use too; the URL the browser was redirected to (what the
+    extractors report) goes in Landed Url.
+    """
+    record = {col: profile.get(col, "") for col in COLUMN_ORDER}
+    record["Landed Url"] = profile.get("Profile Url", "")
+    record["Profile Url"] = url
+    return record
+
+def error_record(url: str, error) -> Dict[str, str]:
+    """Error row with the same column structure as a profile."""
+    record = {col: "" for col in COLUMN_ORDER}
+    record["Profile Url"] = url
+    record["Full Name"] = f"ERROR: {str(error)}"
+    return record
+
+def parse_args():
+    """Command-line options."""
+    parser = argparse.ArgumentParser(description="LinkedIn profile scraper")
+    parser.add_argument("--input", default=INPUT_PATH,
+                        help=f"URL list (.csv, .jsonl, .txt or .xlsx; default {INPUT_PATH})")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="only navigate/capture on the browser thread; extract and store on worker threads")
+    parser.add_argument("--workers", type=int, default=PIPELINE_WORKERS,
+                        help=f"worker threads for --pipeline (default {PIPELINE_WORKERS})")
+    parser.add_argument("--base-url", default=None,
+                        help="send navigation to this origin instead of linkedin.com (local stand-in server)")
+    parser.add_argument("--headless", action="store_true", help="run Chrome headless")
+    parser.add_argument("--no-delay", action="store_true",
+                        help="skip the politeness delay; only allowed together with --base-url")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip URLs that already have a successful record in the result store")
+    return parser.parse_args()
 
 def main():
     """Main function to run the scraper."""
+    args = parse_args()
+    if args.no_delay and not args.base_url:
+        print("--no-delay is only allowed with --base-url (never against the real site).")
+        sys.exit(1)
+    if args.base_url:
+        set_site_origin(args.base_url)
+        print(f"Navigating to stand-in site {args.base_url}")
     print("LinkedIn & Sales Navigator Profile Scraper Starting...")
 
-    try:
-        # Read only the first column as raw text (no splitting on commas)
-        df = pd.read_csv("profiles (1).csv", usecols=[0], names=["url"], header=0)
-
-        urls = []
-        for u in df["url"].dropna().tolist():
-            if isinstance(u, str):
-                clean = u.strip().strip('"').strip("'")  # remove quotes
-                # if there are still commas, keep only the part before first comma
-                clean = clean.split(",")[0]
-                if clean.startswith("http"):
-                    urls.append(clean)
+    # Resume: URLs that already have a good record are skipped as they stream in
+    completed = completed_profile_urls(RESULTS_PATH) if args.resume else None
 
+    # Stream URLs from the input file; nothing is loaded up front
+    stats = InputStats()
+    try:
+        urls = iter_profile_urls(args.input, skip=completed, stats=stats)
+        first_url = next(urls, None)
     except FileNotFoundError:
-        print("profiles.csv not found. Please create it with a 'url' column.")
+        print(f"{args.input} not found. Please create it with a 'url' column.")
         sys.exit(1)
     except Exception as e:
-        print(f"Error reading profiles.csv: {e}")
+        print(f"Error reading {args.input}: {e}")
         sys.exit(1)
 
-    if not urls:
-        print("No valid URLs found in profiles.csv. Exiting.")
+    if first_url is None:
+        if stats.resumed:
+            print(f"Nothing left to scrape ({stats.resumed} already scraped).")
+            return
+        print(f"No valid URLs found in {args.input}. Exiting.")
         sys.exit(1)
 
-    # Check if any URLs are Sales Navigator
-    has_sales_navigator = any(is_sales_navigator_url(url) for url in urls)
-    has_linkedin = any(not is_sales_navigator_url(url) for url in urls)
-
     # Initialize driver
-    driver = init_driver()
+    with tracer.span("startup"):
+        driver = RecyclingDriver(init_driver(headless=args.headless),
+                                 lambda: init_driver(headless=args.headless, exit_on_failure=False),
+                                 close_driver, chrome_profile.restore_cookies,
+                                 max_memory_mb=MAX_BROWSER_MEMORY_MB, max_pages=MAX_PAGES_PER_DRIVER)
     
     try:
-        # Handle login based on URL types
-        if has_sales_navigator and has_linkedin:
-            print("Profiles contain both LinkedIn and Sales Navigator URLs.")
-            print("Please log in to both platforms if necessary.")
-            wait_for_manual_login(driver, is_sales_navigator=True)
-            print("Now please log in to LinkedIn...")
-            wait_for_manual_login(driver, is_sales_navigator=False)
-        elif has_sales_navigator:
-            print("Opening Sales Navigator...")
-            wait_for_manual_login(driver, is_sales_navigator=True)
-        else:
-            print("Opening LinkedIn...")
-            wait_for_manual_login(driver, is_sales_navigator=False)
+        # Log in to LinkedIn / Sales Navigator the first time a URL needs it
+        logged_in = set()
 
         output_file = "result.xlsx"
 
-        # Define the exact column order you want
-        column_order = [
-            "First Name", "Last Name", "Full Name", "Designation", "Current Position", "About", "Location", 
-            "Email", "Mobile No.", "Experience", "Company Name", "Company Url", 
-            "Company Website", "Company Description", "Profile Url"
-        ]
+        # Stream each profile to the result store as soon as it is scraped
+        sink = open_sink(RESULTS_PATH)
+        pipeline = None
+        delay_seconds = 0.0
+        processed = 0
+        run_started = time.monotonic()
+        try:
+            if args.pipeline:
+                pipeline = SnapshotPipeline(
+                    lambda snapshot, run_in_browser: process_profile_snapshot(driver, snapshot, run_in_browser),
+                    sink, workers=args.workers
+                )
+                print(f"Pipeline: {args.workers} workers extract while the browser waits")
 
-        # Initialize results list to collect all profiles
-        all_profiles = []
+            for i, url in enumerate(itertools.chain([first_url], urls), 1):
+                if i > 1 and not args.no_delay:
+                    print(f"Rate limiting...")
+                    # In pipeline mode the browser serves company lookups during the delay
+                    delay_seconds += human_delay(pipeline.idle if pipeline else time.sleep)
+                if i > 1:
+                    # Swap in a fresh browser when this one is too big, too old or dead
+                    try:
+                        driver.page_boundary()
+                    except Exception as e:
+                        print(f"⚠️ Browser recycling failed; continuing with the current browser: {e}")
 
-        for i, url in enumerate(urls, 1):
-            print(f"\nProcessing profile {i}/{len(urls)}")
-            
-            try:
-                profile = visit_profile(driver, url.strip())
-                
-                # Ensure all columns exist in profile with correct order
-                ordered_profile = {}
-                for col in column_order:
-                    ordered_profile[col] = profile.get(col, "")
+                print(f"\nProcessing profile {i}")
+                processed = i
+
+                if pipeline:
+                    try:
+                        ensure_logged_in(driver, url, logged_in)
+                        with tracer.profile(url, driver, phase="load") as traced_driver:
+                            error = load_profile_page(traced_driver, url)
+                            if not error:
+                                with tracer.span("archive"):
+                                    page_source = archive_page(snapshot_archive, driver, url, driver.page_source)
+                                snapshot = PageSnapshot(url, driver.current_url, page_source)
+                        if error:
+                            pipeline.write(error_record(url, error))
+                        else:
+                            pipeline.submit(snapshot)
+                    except Exception as e:
+                        print(f"Error processing {url}: {e}")
+                        pipeline.write(error_record(url, e))
+                    continue
                 
-                all_profiles.append(ordered_profile)
-                print(f"Profile saved: {profile.get('Full Name', 'Unknown')}")
+                try:
+                    ensure_logged_in(driver, url, logged_in)
+                    with tracer.profile(url, driver) as traced_driver:
+                        profile = visit_profile(traced_driver, url.strip())
+                        with tracer.span("sink_write"):
+                            sink.write(ordered_record(profile, url))
+                    print(f"Profile saved: {profile.get('Full Name', 'Unknown')}")
 
-            except Exception as e:
-                print(f"Error processing {url}: {e}")
-                # Create error profile with same column structure
-                error_profile = {}
-                for col in column_order:
-                    if col == "Profile Url":
-                        error_profile[col] = url
-                    elif col == "Full Name":
-                        error_profile[col] = f"ERROR: {str(e)}"
-                    else:
-                        error_profile[col] = ""
-                all_profiles.append(error_profile)
-
-            if i < len(urls):
-                print(f"Rate limiting...")
-                human_delay()
-
-        # Write all profiles to Excel at once with proper formatting
-        if all_profiles:
-            results_df = pd.DataFrame(all_profiles, columns=column_order)
-            results_df.to_excel(output_file, index=False, engine='openpyxl')
-            print(f"\n✅ Successfully saved {len(all_profiles)} profiles to {output_file}")
+                except Exception as e:
+                    print(f"Error processing {url}: {e}")
+                    sink.write(error_record(url, e))
+
+        finally:
+            # Workers may still be writing: stop them before the sink closes
+            if pipeline:
+                pipeline.close()
+            sink.close()
+
+        print(f"\nInput: {stats.summary()}")
+        tracer.print_summary()
+        print(resource_blocker.summary())
+        print(driver.summary())
+        if TRACE_PATH:
+            print(f"Span trace: {TRACE_PATH} (python run_trace.py {TRACE_PATH})")
+        active_seconds = time.monotonic() - run_started - delay_seconds
+        if processed and active_seconds > 0:
+            print(f"Throughput: {processed / active_seconds * 60:.1f} profiles/min excluding politeness delay "
+                  f"({processed} profiles, {active_seconds:.1f}s active, {delay_seconds:.1f}s delay)")
+
+        # Export the result store to Excel
+        if sink.written:
+            total = export_to_excel(RESULTS_PATH, output_file, COLUMN_ORDER)
+            print(f"\n✅ Saved {sink.written} new profiles ({total} total) to {output_file}")
         else:
             print("No profiles were processed.")
 
     finally:
         print("Closing browser...")
+        chrome_profile.save_cookies(driver)
         driver.quit()
+        chrome_profile.cleanup()
+        if snapshot_archive:
+            snapshot_archive.close()
+        tracer.close()
+        selector_stats.save()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,18 +1,29 @@
 import time
 import random
 import sys
+import argparse
+import itertools
 from typing import List, Dict
 import pandas as pd
 import os
-from urllib.parse import urlparse
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.common.exceptions import TimeoutException
+
+from driver_launch import launch_driver
+from chrome_profile import ChromeProfile
+from session import has_session, is_login_page
+from snapshot_extract import take_snapshot, extract_top_card_snapshot, extract_experience_snapshot
+from dom_wait import wait_for_dom_settled
+from company_cache import CompanyCache
+from company_tab import switch_to_company_tab, return_from_company_tab
+from url_utils import is_sales_navigator_url
+from url_input import iter_profile_urls, InputStats
+from snapshot_archive import open_archive, archive_page
 
 # ---------------------------
 # Guardrails & configuration
@@ -23,6 +34,19 @@ PAGE_LOAD_TIMEOUT = 10
 IMPLICIT_WAIT = 4
 LINKEDIN_URL = "https://www.linkedin.com/"
 SALES_NAVIGATOR_URL = "https://www.linkedin.com/sales/"
+# "live" runs every selector through WebDriver; "snapshot" parses one page_source with lxml
+EXTRACTION_MODE = "live"
+# Company pages are cached on disk so shared employers are only loaded once
+COMPANY_CACHE_PATH = "company_cache.sqlite"
+COMPANY_CACHE_TTL_DAYS = 30
+# Set to e.g. "snapshots.pack" to keep a compressed copy of every visited page
+SNAPSHOT_ARCHIVE_PATH = None
+# URL list: .csv (url column), .jsonl, .txt or .xlsx; read as a stream
+INPUT_PATH = "profiles (1).csv"
+
+company_cache = CompanyCache(COMPANY_CACHE_PATH, COMPANY_CACHE_TTL_DAYS * 24 * 3600, namespace="testscrape")
+snapshot_archive = open_archive(SNAPSHOT_ARCHIVE_PATH)
+chrome_profile = ChromeProfile()
 
 def human_delay():
     """Random delay to mimic human behavior."""
@@ -31,67 +55,15 @@ def human_delay():
     time.sleep(delay)
 
 def init_driver() -> webdriver.Chrome:
-    """Initialize Chrome with fallback options."""
-    chrome_options = Options()
-    
-    # Basic options that usually work
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    
-    # Try different approaches in order of preference
-    approaches = [
-        {
-            "name": "temporary profile", 
-            "options": [
-                f"--user-data-dir={os.getcwd()}\\temp_chrome_profile",
-                "--profile-directory=Default"
-            ]
-        },
-        {
-            "name": "default",
-            "options": []
-        }
-    ]
-    
-    for approach in approaches:
-        try:
-            print(f"Trying to start Chrome with {approach['name']}...")
-            
-            # Create fresh options for each attempt
-            options = Options()
-            options.add_argument("--start-maximized")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            
-            # Add approach-specific options
-            for arg in approach["options"]:
-                options.add_argument(arg)
-            
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-            driver.implicitly_wait(IMPLICIT_WAIT)
-            
-            # Test if driver works
-            driver.get("https://www.google.com")
-            print(f"✅ Successfully started Chrome with {approach['name']}")
-            return driver
-            
-        except WebDriverException as e:
-            print(f"❌ Failed with {approach['name']}: {str(e)[:100]}...")
-            if 'driver' in locals():
-                try:
-                    driver.quit()
-                except:
-                    pass
-            continue
-    
+    """Start Chrome, trying the launch approach that last worked on this host first."""
+    driver = launch_driver(PAGE_LOAD_TIMEOUT, IMPLICIT_WAIT, user_data_dir=chrome_profile.materialize())
+    if driver is not None:
+        restored = chrome_profile.restore_cookies(driver)
+        if restored:
+            print(f"Restored {restored} saved session cookies")
+        return driver
+
+    chrome_profile.cleanup()
     print("❌ All Chrome startup approaches failed. Please try:")
     print("1. Close all Chrome windows completely")
     print("2. Check if ChromeDriver is installed and in PATH")
@@ -105,11 +77,6 @@ def safe_text(element):
     except:
         return ""
 
-def is_sales_navigator_url(url: str) -> bool:
-    """Check if the URL is a Sales Navigator URL."""
-    parsed_url = urlparse(url)
-    return "sales" in parsed_url.netloc or "sales" in parsed_url.path
-
 def wait_for_manual_login(driver, is_sales_navigator: bool = False):
     """Wait for user to manually log in to LinkedIn or Sales Navigator."""
     target_url = SALES_NAVIGATOR_URL if is_sales_navigator else LINKEDIN_URL
@@ -123,8 +90,27 @@ def wait_for_manual_login(driver, is_sales_navigator: bool = False):
     print("="*60)
     driver.get(target_url)
     input("Press ENTER after you've logged in... ")
+    # Persist the new session now, so it survives a crash before the run ends
+    chrome_profile.save_cookies(driver)
     print("Continuing with profile scraping...\n")
 
+def ensure_logged_in(driver, url: str, logged_in: set):
+    """Reuse the stored session of url's platform, or prompt for a manual login the first time it is needed."""
+    is_sales_navigator = is_sales_navigator_url(url)
+    if is_sales_navigator not in logged_in:
+        if has_session(driver, is_sales_navigator):
+            print(f"✅ Reusing the stored {'Sales Navigator' if is_sales_navigator else 'LinkedIn'} session")
+        else:
+            wait_for_manual_login(driver, is_sales_navigator)
+        logged_in.add(is_sales_navigator)
+
+def recover_session(driver, url: str):
+    """Log in again and reload url when the stored session turned out to be expired."""
+    if is_login_page(driver):
+        print("⚠️  Session expired; a manual login is needed")
+        wait_for_manual_login(driver, is_sales_navigator_url(url))
+        driver.get(url)
+
 def extract_contact_info(driver) -> Dict[str, str]:
     """Extract publicly available contact information."""
     contact_data = {
@@ -149,7 +135,7 @@ def extract_contact_info(driver) -> Dict[str, str]:
                 contact_button = driver.find_element(By.CSS_SELECTOR, selector)
                 if contact_button.is_displayed():
                     driver.execute_script("arguments[0].click();", contact_button)
-                    time.sleep(2)
+                    wait_for_dom_settled(driver, "#artdeco-modal-outlet", cap_seconds=2)
                     contact_clicked = True
                     break
             except:
@@ -231,7 +217,7 @@ def extract_contact_info(driver) -> Dict[str, str]:
                     close_btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if close_btn.is_displayed():
                         close_btn.click()
-                        time.sleep(1)
+                        wait_for_dom_settled(driver, "#artdeco-modal-outlet", cap_seconds=1)
                         break
                 except:
                     continue
@@ -629,7 +615,7 @@ def extract_sales_navigator_profile(driver) -> Dict[str, str]:
             show_more = driver.find_element(By.CSS_SELECTOR, "button[aria-label*='Show more']")
             if show_more.is_displayed():
                 driver.execute_script("arguments[0].click();", show_more)
-                time.sleep(2)
+                wait_for_dom_settled(driver, "#scroll-to-experience-section", cap_seconds=2)
         except:
             pass
 
@@ -738,7 +724,7 @@ def extract_sales_navigator_profile(driver) -> Dict[str, str]:
                     print(f"   → [{idx}/{len(company_links)}] Scraping company: {comp['name']}")
                     print(f"   → Loading: {comp['link']}")
                     
-                    company_data = scrape_salesnav_company_page(driver, comp["link"])
+                    company_data, from_cache = scrape_salesnav_company_page(driver, comp["link"])
                     
                     if company_data and not company_data.get("error"):
                         # Extract company ID from URL
@@ -767,7 +753,8 @@ def extract_sales_navigator_profile(driver) -> Dict[str, str]:
                         
                         print(f"   ✅ Successfully scraped: {comp['name']}")
                         
-                        if idx < len(company_links):
+                        # Pace only after a real page load, not a cache hit
+                        if idx < len(company_links) and not from_cache:
                             time.sleep(2)
                     else:
                         print(f"   ⚠️ No data returned for: {comp['name']}")
@@ -845,6 +832,24 @@ def extract_sales_navigator_profile(driver) -> Dict[str, str]:
     return data
 
 def scrape_salesnav_company_page(driver, company_url):
+    """Return (company data, from_cache), using the company cache when possible."""
+    def fetch():
+        # Load the company in its own tab so the profile tab stays on the lead page
+        profile_handle = switch_to_company_tab(driver)
+        try:
+            company_data = fetch_salesnav_company_page(driver, company_url)
+        finally:
+            return_from_company_tab(driver, profile_handle)
+        return None if company_data.get("error") else company_data
+
+    company_data, from_cache = company_cache.get_or_fetch(company_url, fetch)
+    if company_data is None:
+        return {"error": f"Failed to load page: {company_url}"}, False
+    if from_cache:
+        print(f"   ✓ Company data from cache: {company_data.get('name', 'Unknown Company')}")
+    return company_data, from_cache
+
+def fetch_salesnav_company_page(driver, company_url):
     """Enhanced company page scraping with better error handling."""
     print(f"   → Loading company page: {company_url}")
     
@@ -853,10 +858,11 @@ def scrape_salesnav_company_page(driver, company_url):
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        time.sleep(3)  # Wait for dynamic content
+        wait_for_dom_settled(driver, "main", cap_seconds=3)  # Wait for dynamic content
     except Exception as e:
         print(f"   ⚠️ Failed to load company page: {e}")
         return {"error": f"Failed to load page: {e}"}
+    archive_page(snapshot_archive, driver, company_url)
 
     company_data = {"scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")}
 
@@ -994,25 +1000,45 @@ def visit_profile(driver, url: str) -> Dict[str, str]:
     
     try:
         driver.get(url)
+        recover_session(driver, url)
         WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.TAG_NAME, "main"))
         )
-        time.sleep(3)
+        wait_for_dom_settled(driver, "main", cap_seconds=3)
     except TimeoutException:
         print("⚠️  Page load timeout; continuing with extraction...")
     except Exception as e:
         print(f"⚠️  Error loading page: {e}")
         return {"error": str(e), "profile_url": url, "source": "Unknown"}
+    archive_page(snapshot_archive, driver, url)
 
     if is_sales_navigator_url(url):
         print("   📊 Processing as Sales Navigator profile...")
         profile = extract_sales_navigator_profile(driver)
     else:
         print("   📊 Processing as LinkedIn profile...")
-        profile = extract_top_card(driver)
+        if EXTRACTION_MODE == "snapshot":
+            tree = take_snapshot(driver)
+            top_card = extract_top_card_snapshot(tree, driver.current_url)
+            name_parts = top_card["name"].split(" ", 1)
+            profile = {
+                "name": top_card["name"],
+                "First Name": name_parts[0],
+                "Last Name": name_parts[1] if len(name_parts) > 1 else "",
+                "headline": top_card["headline"],
+                "location": top_card["location"],
+                "current_position": "",
+                "profile_url": top_card["profile_url"],
+                "source": "LinkedIn"
+            }
+        else:
+            profile = extract_top_card(driver)
         contact_info = extract_contact_info(driver)
         profile.update(contact_info)
-        experiences = extract_experience(driver)
+        if EXTRACTION_MODE == "snapshot":
+            experiences = extract_experience_snapshot(tree)
+        else:
+            experiences = extract_experience(driver)
         if experiences:
             profile["experience"] = "; ".join(experiences)
         else:
@@ -1026,52 +1052,49 @@ def visit_profile(driver, url: str) -> Dict[str, str]:
     
     return profile
 
+def parse_args():
+    """Command-line options."""
+    parser = argparse.ArgumentParser(description="LinkedIn & Sales Navigator profile scraper")
+    parser.add_argument("--input", default=INPUT_PATH,
+                        help=f"URL list (.csv, .jsonl, .txt or .xlsx; default {INPUT_PATH})")
+    return parser.parse_args()
+
 def main():
     """Main function to run the scraper."""
+    args = parse_args()
     print("🚀 LinkedIn & Sales Navigator Profile Scraper Starting...")
-    
+
+    # Stream URLs from the input file; nothing is loaded up front
+    stats = InputStats()
     try:
-        df = pd.read_csv("profiles (1).csv")
-        urls = [u for u in df["url"].dropna().tolist() 
-                if isinstance(u, str) and u.strip().startswith("http")]
+        urls = iter_profile_urls(args.input, stats=stats)
+        first_url = next(urls, None)
     except FileNotFoundError:
-        print("❌ profiles.csv not found. Please create it with a 'url' column.")
+        print(f"❌ {args.input} not found. Please create it with a 'url' column.")
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Error reading profiles.csv: {e}")
+        print(f"❌ Error reading {args.input}: {e}")
         sys.exit(1)
 
-    if not urls:
-        print("❌ No valid URLs found in profiles.csv. Exiting.")
+    if first_url is None:
+        print(f"❌ No valid URLs found in {args.input}. Exiting.")
         sys.exit(1)
-    
-    print(f"📋 Found {len(urls)} profiles to scrape")
-    
-    # Check if any URLs are Sales Navigator
-    has_sales_navigator = any(is_sales_navigator_url(url) for url in urls)
-    has_linkedin = any(not is_sales_navigator_url(url) for url in urls)
 
     # Initialize driver
     driver = init_driver()
     
     try:
-        # Handle login based on URL types
-        if has_sales_navigator and has_linkedin:
-            print("🌐 Profiles contain both LinkedIn and Sales Navigator URLs.")
-            print("   Please log in to both platforms if necessary.")
-            wait_for_manual_login(driver, is_sales_navigator=True)
-            print("   Now please log in to LinkedIn...")
-            wait_for_manual_login(driver, is_sales_navigator=False)
-        elif has_sales_navigator:
-            print("🌐 Opening Sales Navigator...")
-            wait_for_manual_login(driver, is_sales_navigator=True)
-        else:
-            print("🌐 Opening LinkedIn...")
-            wait_for_manual_login(driver, is_sales_navigator=False)
+        # Log in to LinkedIn / Sales Navigator the first time a URL needs it
+        logged_in = set()
 
         results = []
-        for i, url in enumerate(urls, 1):
-            print(f"\n📊 Processing profile {i}/{len(urls)}")
+        for i, url in enumerate(itertools.chain([first_url], urls), 1):
+            if i > 1:
+                print(f"⏳ Rate limiting...")
+                human_delay()
+
+            ensure_logged_in(driver, url, logged_in)
+            print(f"\n📊 Processing profile {i}")
             
             try:
                 profile = visit_profile(driver, url.strip())
@@ -1080,10 +1103,6 @@ def main():
                 print(f"❌ Error processing {url}: {e}")
                 results.append({"error": str(e), "profile_url": url, "source": "Unknown"})
 
-            if i < len(urls):
-                print(f"⏳ Rate limiting...")
-                human_delay()
-
         print(f"\n💾 Saving results...")
         output_file = "result.xlsx"
         out_df = pd.DataFrame(results)
@@ -1098,11 +1117,16 @@ def main():
         print(f"✅ Saved {len(final_df)} total profiles to {output_file}")
         
         successful = len([r for r in results if "error" not in r])
-        print(f"\n📈 Summary: {successful}/{len(urls)} profiles scraped successfully")
+        print(f"\n📋 Input: {stats.summary()}")
+        print(f"📈 Summary: {successful}/{len(results)} profiles scraped successfully")
 
     finally:
         print("🔄 Closing browser...")
+        chrome_profile.save_cookies(driver)
         driver.quit()
+        chrome_profile.cleanup()
+        if snapshot_archive:
+            snapshot_archive.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+Streaming input reader for URL lists.
+
+URLs are read lazily from CSV, JSONL, plain text or xlsx (openpyxl read-only
+mode), cleaned, de-duplicated by canonical URL and optionally filtered against
+a resume set as they stream past, so even a multi-million-row list starts
+producing work immediately. Only the set of canonical keys seen so far is kept
+in memory, never the rows themselves.
+"""
+
+import csv
+import json
+import os
+from typing import Iterator, Optional, Set
+
+from url_utils import canonical_profile_url, clean_input_url
+
+# Header names recognised as the URL column, in order of preference
+URL_COLUMNS = ("url", "profile_url", "profile url", "linkedin_url", "linkedin url")
+
+
+class InputStats:
+    """Counters for one pass over an input file."""
+
+    def __init__(self):
+        self.rows = 0
+        self.invalid = 0
+        self.duplicates = 0
+        self.resumed = 0
+        self.yielded = 0
+
+    def summary(self) -> str:
+        return (f"{self.yielded} to visit from {self.rows} rows "
+                f"({self.duplicates} duplicates dropped, saving {self.duplicates} visits; "
+                f"{self.resumed} already scraped, {self.invalid} invalid)")
+
+
+def _looks_like_url(value) -> bool:
+    value = str(value or "").lower()
+    return "http" in value or "linkedin.com" in value
+
+
+def _url_column(header, column: Optional[str]) -> Optional[int]:
+    """Index of the URL column in a header row, or None if the row is data."""
+    names = [str(h or "").strip().lower() for h in header]
+    wanted = [column.lower()] if column else list(URL_COLUMNS)
+    for name in wanted:
+        if name in names:
+            return names.index(name)
+    if column:
+        raise ValueError(f"column '{column}' not found in header {list(header)}")
+    return None
+
+
+def _iter_rows(rows, column: Optional[str]) -> Iterator[str]:
+    """Pull the URL cell out of each row; the first row may be a header.
+
+    Without a recognised header, the URL column is the first cell of the
+    first data row that looks like a URL.
+    """
+    index = None
+    first = True
+    for row in rows:
+        if not row:
+            continue
+        if first:
+            first = False
+            index = _url_column(row, column)
+            if index is not None or not any(_looks_like_url(cell) for cell in row):
+                continue
+        if index is None:
+            index = next((i for i, cell in enumerate(row) if _looks_like_url(cell)), None)
+        if index is not None and index < len(row) and row[index] is not None:
+            yield str(row[index])
+        else:
+            yield ""
+
+
+def iter_csv(path: str, column: Optional[str] = None) -> Iterator[str]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        yield from _iter_rows(csv.reader(f), column)
+
+
+def iter_xlsx(path: str, column: Optional[str] = None) -> Iterator[str]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True)
+    try:
+        yield from _iter_rows(workbook.active.iter_rows(values_only=True), column)
+    finally:
+        workbook.close()
+
+
+def iter_jsonl(path: str, column: Optional[str] = None) -> Iterator[str]:
+    keys = [column] if column else None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                value = json.loads(line)
+            except ValueError:
+                yield ""
+                continue
+            if isinstance(value, dict):
+                if keys is None:
+                    lowered = {str(k).lower(): v for k, v in value.items()}
+                    value = next((lowered[k] for k in URL_COLUMNS if k in lowered), "")
+                else:
+                    value = value.get(keys[0], "")
+            yield value if isinstance(value, str) else ""
+
+
+def iter_text(path: str, column: Optional[str] = None) -> Iterator[str]:
+    with open(path, encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+
+_READERS = {
+    ".csv": iter_csv,
+    ".xlsx": iter_xlsx,
+    ".xlsm": iter_xlsx,
+    ".jsonl": iter_jsonl,
+    ".ndjson": iter_jsonl,
+    ".txt": iter_text,
+}
+
+
+def iter_raw_urls(path: str, column: Optional[str] = None) -> Iterator[str]:
+    """Raw URL cells from path, picking the reader by file extension."""
+    reader = _READERS.get(os.path.splitext(path)[1].lower(), iter_text)
+    return reader(path, column)
+
+
+def iter_profile_urls(path: str, column: Optional[str] = None, skip: Optional[Set[str]] = None,
+                      stats: Optional[InputStats] = None) -> Iterator[str]:
+    """Stream cleaned, unique URLs to visit from path.
+
+    Cells that are not http(s) URLs are dropped, duplicates are detected by
+    canonical URL (the first spelling is kept for navigation), and URLs whose
+    canonical form is in skip (e.g. the --resume set) are left out.
+    """
+    stats = stats if stats is not None else InputStats()
+    seen = set()
+    for raw in iter_raw_urls(path, column):
+        stats.rows += 1
+        url = clean_input_url(raw)
+        if not url.startswith("http"):
+            stats.invalid += 1
+            continue
+        key = canonical_profile_url(url)
+        if key in seen:
+            stats.duplicates += 1
+            continue
+        seen.add(key)
+        if skip and key in skip:
+            stats.resumed += 1
+            continue
+        stats.yielded += 1
+        yield url
@@ -0,0 +1,108 @@
+"""
+LinkedIn URL helpers shared by the scrapers.
+
+classify_url routes a URL to one of the page kinds below and extracts the
+stable id that identifies the entity, so /in/foo, /in/Foo/ and
+/in/foo?miniProfileUrn=... all map to the same canonical URL. The input
+reader (url_input.py) uses that to drop duplicate inputs before any visit.
+"""
+
+import re
+from typing import NamedTuple
+from urllib.parse import urlparse
+
+LINKEDIN_ORIGIN = "https://www.linkedin.com"
+
+PROFILE = "profile"
+SALES_LEAD = "sales_lead"
+COMPANY = "company"
+SALES_COMPANY = "sales_company"
+UNKNOWN = "unknown"
+
+_ROUTES = [
+    (PROFILE, re.compile(r"^/in/([^/?#]+)", re.IGNORECASE)),
+    (SALES_LEAD, re.compile(r"^/sales/(?:lead|people)/([^/?#,]+)", re.IGNORECASE)),
+    (SALES_COMPANY, re.compile(r"^/sales/company/([^/?#]+)", re.IGNORECASE)),
+    (COMPANY, re.compile(r"^/company/([^/?#]+)", re.IGNORECASE)),
+]
+
+_CANONICAL_PREFIX = {
+    PROFILE: "/in/",
+    SALES_LEAD: "/sales/lead/",
+    SALES_COMPANY: "/sales/company/",
+    COMPANY: "/company/",
+}
+
+
+class LinkedInUrl(NamedTuple):
+    kind: str
+    id: str
+    canonical: str
+
+
+def clean_input_url(url: str) -> str:
+    """Strip whitespace and surrounding quotes from a raw input cell."""
+    return (url or "").strip().strip('"').strip("'").strip()
+
+
+def classify_url(url: str) -> LinkedInUrl:
+    """Return the page kind, stable id and canonical URL of a LinkedIn URL.
+
+    Public /in/ slugs and company slugs are lower-cased; Sales Navigator ids
+    are case-sensitive and keep their case, with the ",NAME_SEARCH,xxxx"
+    suffix dropped. Unrecognised URLs get kind UNKNOWN and a canonical form
+    without query, fragment or trailing slash.
+    """
+    url = clean_input_url(url)
+    parsed = urlparse(url if "://" in url else "https://" + url)
+    path = parsed.path.rstrip("/")
+    for kind, pattern in _ROUTES:
+        match = pattern.match(path)
+        if match:
+            entity_id = match.group(1)
+            if kind in (PROFILE, COMPANY):
+                entity_id = entity_id.lower()
+            return LinkedInUrl(kind, entity_id, LINKEDIN_ORIGIN + _CANONICAL_PREFIX[kind] + entity_id)
+    host = parsed.netloc.lower()
+    origin = LINKEDIN_ORIGIN if host.endswith("linkedin.com") else "https://" + host
+    return LinkedInUrl(UNKNOWN, "", origin + path)
+
+
+# Origin that navigation is sent to; overridden to run against a local stand-in
+_site_origin = LINKEDIN_ORIGIN
+
+
+def set_site_origin(origin: str):
+    """Send navigation to origin (e.g. http://127.0.0.1:8765) instead of LinkedIn."""
+    global _site_origin
+    _site_origin = (origin or LINKEDIN_ORIGIN).rstrip("/")
+
+
+def is_site_overridden() -> bool:
+    return _site_origin != LINKEDIN_ORIGIN
+
+
+def site_url(url: str) -> str:
+    """Rewrite a linkedin.com URL to the configured site origin before navigating."""
+    if not is_site_overridden():
+        return url
+    parsed = urlparse(url)
+    if not parsed.netloc.lower().endswith("linkedin.com"):
+        return url
+    rest = parsed.path + (f"?{parsed.query}" if parsed.query else "") + (f"#{parsed.fragment}" if parsed.fragment else "")
+    return _site_origin + rest
+
+
+def canonical_profile_url(url: str) -> str:
+    """Canonical form of a profile URL, used as the dedup/resume key."""
+    return classify_url(url).canonical
+
+
+def is_sales_navigator_url(url: str) -> bool:
+    """Check if the URL is a Sales Navigator URL."""
+    kind = classify_url(url).kind
+    if kind != UNKNOWN:
+        return kind in (SALES_LEAD, SALES_COMPANY)
+    parsed_url = urlparse(url)
+    return "sales" in parsed_url.netloc or "sales" in parsed_url.path
+